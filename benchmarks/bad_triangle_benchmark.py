@@ -0,0 +1,101 @@
+"""
+Benchmark comparing the bad triangle search of the Bowyer-Watson algorithm
+using a list of Triangle objects and using the NumPy TriangleStore.
+
+Run from the project's root directory with
+python -m benchmarks.bad_triangle_benchmark
+"""
+
+import random
+import timeit
+from dungeon_generator.geometry import Point, Triangle, orientation
+from dungeon_generator.triangle_mesh import TriangleMesh
+from dungeon_generator.triangle_store import TriangleStore
+from dungeon_generator.undirected_graphing import BowyerWatson
+
+POINT_COUNTS = (100, 1000, 10000)
+QUERY_COUNT = 50
+
+def create_triangulation(points: list[Point]) -> list[tuple[int, int, int]]:
+    """
+    Triangulates points with a TriangleMesh.
+
+    Returns:
+        List of counter-clockwise vertex index triples.
+    """
+    mesh = TriangleMesh()
+    for point in points:
+        mesh.add_vertex(point.x, point.y)
+    if orientation(
+        points[0].x, points[0].y,
+        points[1].x, points[1].y,
+        points[2].x, points[2].y
+    ) > 0:
+        mesh.create_initial_triangle(0, 1, 2)
+    else:
+        mesh.create_initial_triangle(0, 2, 1)
+    for vertex in range(3, len(points)):
+        mesh.insert_vertex(vertex)
+    return mesh.get_triangles()
+
+def run_benchmark(
+        point_count: int,
+        rng: random.Random
+    ) -> tuple[int, float, float]:
+    """
+    Times both bad triangle searches for the triangulation
+    of a given number of random points.
+
+    Returns:
+        Number of triangles and the average time of one search in seconds
+        for the Triangle list and for the TriangleStore.
+    """
+    points = [
+        Point(rng.uniform(-point_count, point_count), rng.uniform(-point_count, point_count))
+        for _ in range(point_count)
+    ]
+    triangulation = create_triangulation(points)
+    triangles = [
+        Triangle((points[a], points[b], points[c]))
+        for a, b, c in triangulation
+    ]
+    store = TriangleStore(
+        [point.x for point in points],
+        [point.y for point in points]
+    )
+    for a, b, c in triangulation:
+        store.add_triangle(a, b, c)
+    queries = [
+        Point(rng.uniform(-point_count, point_count), rng.uniform(-point_count, point_count))
+        for _ in range(QUERY_COUNT)
+    ]
+    triangulator = BowyerWatson()
+    for query in queries:
+        if (
+            len(triangulator.get_bad_triangles(query, triangles)) !=
+            int(store.bad_triangle_mask(query.x, query.y).sum())
+        ):
+            raise RuntimeError("Bad triangle searches returned different results")
+
+    list_time = timeit.timeit(
+        lambda: [triangulator.get_bad_triangles(query, triangles) for query in queries],
+        number=1
+    ) / QUERY_COUNT
+    store_time = timeit.timeit(
+        lambda: [store.bad_triangle_mask(query.x, query.y) for query in queries],
+        number=1
+    ) / QUERY_COUNT
+    return (len(triangles), list_time, store_time)
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'points':>8} {'triangles':>10} {'list (ms)':>10} {'numpy (ms)':>11} {'speedup':>8}")
+    for point_count in POINT_COUNTS:
+        triangle_count, list_time, store_time = run_benchmark(point_count, rng)
+        print(
+            f"{point_count:>8} {triangle_count:>10} {list_time * 1000:>10.3f} "
+            f"{store_time * 1000:>11.3f} {list_time / store_time:>7.1f}x"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark comparing map generation on a flat Grid and on a ChunkedGrid,
+where each corridor search copies a window of the grid.
+
+Run from the project's root directory with
+python -m benchmarks.chunked_grid_benchmark
+"""
+
+import timeit
+from dungeon_generator.map_generator import MapGenerator
+from dungeon_generator.room_placer import RoomPlacer
+from dungeon_generator.undirected_graphing import (
+    BowyerWatson,
+    PrimMinSpanningTree,
+    RandomEdgeConnector
+)
+
+# (map size, room count) of the generated maps
+MAP_SETTINGS = ((1024, 100), (4096, 100))
+SEED = 4
+
+def time_generation(
+        size: int,
+        room_count: int,
+        chunk_size: int = None
+    ) -> tuple[float, int]:
+    """
+    Times generating a map with rooms placed on a flat grid,
+    or on a ChunkedGrid if chunk_size is given.
+
+    Returns:
+        Time of the generation in seconds and the number
+        of allocated chunks, or 0 for a flat grid.
+    """
+    room_placer = RoomPlacer()
+    room_placer.grid_chunk_size = chunk_size
+    generator = MapGenerator(
+        room_placer,
+        BowyerWatson(),
+        PrimMinSpanningTree(),
+        RandomEdgeConnector()
+    )
+    maps = []
+    generation_time = timeit.timeit(
+        lambda: maps.append(generator.generate(SEED, size, room_count)),
+        number=1
+    )
+    if chunk_size is None:
+        return (generation_time, 0)
+    return (generation_time, len(maps[0].grid.chunks))
+
+def main() -> None:
+    print(f"{'size':>6} {'rooms':>6} {'flat (s)':>9} {'chunked (s)':>12} {'chunks':>14}")
+    for size, room_count in MAP_SETTINGS:
+        flat_time, _ = time_generation(size, room_count)
+        chunked_time, chunk_count = time_generation(size, room_count, 64)
+        all_chunks = (size // 64) ** 2
+        print(
+            f"{size:>6} {room_count:>6} {flat_time:>9.2f} "
+            f"{chunked_time:>12.2f} {f'{chunk_count}/{all_chunks}':>14}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Module containing the CorridorNetworkRouter class.
+Used to route the corridors of a map so that
+they share cells instead of running side by side.
+"""
+
+from dungeon_generator.geometry import Edge
+from dungeon_generator.grid import Grid, Tile
+from dungeon_generator.pathfinding import AStar, PATH_CELL_VALUES
+
+class CorridorNetworkRouter(AStar):
+    """
+    Pathfinder that routes all corridors of a map as one network.
+
+    Edges are routed from the shortest to the longest, and moving into
+    a cell that is already corridor floor costs less than carving a new
+    one, so later corridors follow the corridors of earlier ones instead
+    of carving new parallel corridors next to them. The heuristic is
+    weighted with the cost of a new cell, which keeps the searches about
+    as focused as those of AStar at the price of not always finding
+    the cheapest path.
+
+    Only grids with a flat cell array are supported.
+
+    Args:
+        grid: Grid in which corridors are carved.
+        allowed_path_cell_values: Cell values that paths can go through.
+        new_cell_cost: Cost of moving into a cell that is not
+        corridor floor.
+        reused_cell_cost: Cost of moving into a corridor floor cell.
+    """
+    def __init__(
+            self,
+            grid: Grid,
+            allowed_path_cell_values: tuple[str, ...] = PATH_CELL_VALUES,
+            new_cell_cost: int = 3,
+            reused_cell_cost: int = 1
+        ) -> None:
+        if grid.cells is None:
+            raise ValueError(
+                "CorridorNetworkRouter requires a grid "
+                "with a flat cell array."
+            )
+        super().__init__(grid, allowed_path_cell_values)
+        self.new_cell_cost = new_cell_cost
+        self.reused_cell_cost = reused_cell_cost
+        # Cost of moving into a cell, indexed by tile code
+        self.step_costs = bytearray((new_cell_cost,)) * 256
+        self.step_costs[Tile.CORRIDOR_FLOOR] = reused_cell_cost
+        self.heuristic = self.calculate_weighted_heuristic
+
+    def paths_for_rooms(self, room_dict: dict, edges: list[Edge]):
+        """
+        Carves a corridor between the rooms of each edge,
+        starting from the shortest edge.
+
+        Args:
+            room_dict: Rooms keyed by the coordinates of their center point.
+            edges: Edges between room center points.
+        """
+        super().paths_for_rooms(
+            room_dict,
+            sorted(edges, key=lambda edge: edge.get_length())
+        )
+
+    def calculate_weighted_heuristic(
+            self,
+            column_distance: int,
+            row_distance: int
+        ) -> int:
+        """
+        Estimates the cost of a path as the cost of carving
+        new cells along the shortest path.
+        """
+        return self.new_cell_cost * (abs(column_distance) + abs(row_distance))
@@ -0,0 +1,260 @@
+"""
+Module contains functions for finding the free positions of a rectangle
+among other rectangles. Used by RoomPlacer to pick a random position
+for a room from all of the positions where it fits.
+"""
+
+import bisect
+
+def get_free_bands(
+        rects: list[tuple[int, int, int, int]],
+        width: int,
+        height: int,
+        bounds: tuple[int, int, int, int]
+    ) -> list[tuple[int, int, list[tuple[int, int]], int]]:
+    """
+    Finds the positions where a rectangle can be placed without
+    intersecting other rectangles. Rectangles are (x, y, width, height)
+    tuples of integers and intersect if their overlap has a positive area.
+
+    A rectangle at (x, y) intersects another one if x and y are both
+    inside the other rectangle extended by the size of the placed one.
+    The rows of positions are swept from the bottom up, keeping the
+    extended rectangles that cover the current row in a list sorted by
+    their first column. The free columns only change where an extended
+    rectangle starts or ends, so rows between those are grouped
+    into bands with the same free columns.
+
+    Args:
+        rects: Rectangles the placed rectangle should not intersect.
+        width: Width of the placed rectangle.
+        height: Height of the placed rectangle.
+        bounds: The first and last allowed x and y coordinates of
+        the placed rectangle as (first x, first y, last x, last y).
+
+    Returns:
+        List of (first row, last row, free columns, free column count)
+        tuples, where free columns is a list of (first x, last x)
+        intervals of positions that are free on every row of the band.
+    """
+    first_x, first_y, last_x, last_y = bounds
+    if first_x > last_x or first_y > last_y:
+        return []
+    # (row, is start, (first column, last column)) of the blocked positions
+    events = []
+    for rect in rects:
+        blocked = get_blocked_positions(rect, width, height, bounds)
+        if blocked is None:
+            continue
+        blocked_first_x, blocked_first_y, blocked_last_x, blocked_last_y = (
+            blocked
+        )
+        interval = (blocked_first_x, blocked_last_x)
+        events.append((blocked_first_y, True, interval))
+        events.append((blocked_last_y + 1, False, interval))
+    events.sort()
+
+    bands = []
+    active = []
+    row = first_y
+    event_index = 0
+    while row <= last_y:
+        while event_index < len(events) and events[event_index][0] == row:
+            _, is_start, interval = events[event_index]
+            if is_start:
+                bisect.insort(active, interval)
+            else:
+                active.remove(interval)
+            event_index += 1
+        if event_index < len(events):
+            next_row = min(events[event_index][0], last_y + 1)
+        else:
+            next_row = last_y + 1
+        free_columns = []
+        free_count = 0
+        column = first_x
+        for blocked_first_x, blocked_last_x in active:
+            if blocked_first_x > column:
+                free_columns.append((column, blocked_first_x - 1))
+                free_count += blocked_first_x - column
+            if blocked_last_x >= column:
+                column = blocked_last_x + 1
+                if column > last_x:
+                    break
+        if column <= last_x:
+            free_columns.append((column, last_x))
+            free_count += last_x - column + 1
+        if free_count:
+            bands.append((row, next_row - 1, free_columns, free_count))
+        row = next_row
+    return bands
+
+def get_blocked_positions(
+        rect: tuple[int, int, int, int],
+        width: int,
+        height: int,
+        bounds: tuple[int, int, int, int]
+    ) -> tuple[int, int, int, int]:
+    """
+    Finds the positions where a placed rectangle would intersect
+    another rectangle.
+
+    Args:
+        rect: Rectangle the placed rectangle should not intersect.
+        width: Width of the placed rectangle.
+        height: Height of the placed rectangle.
+        bounds: The first and last allowed x and y coordinates of
+        the placed rectangle as (first x, first y, last x, last y).
+
+    Returns:
+        The blocked positions inside bounds as
+        (first x, first y, last x, last y), or None if there are none.
+    """
+    x, y, rect_width, rect_height = rect
+    if rect_width <= 0 or rect_height <= 0:
+        return None
+    first_x, first_y, last_x, last_y = bounds
+    blocked = (
+        max(x - width + 1, first_x),
+        max(y - height + 1, first_y),
+        min(x + rect_width - 1, last_x),
+        min(y + rect_height - 1, last_y)
+    )
+    if blocked[0] > blocked[2] or blocked[1] > blocked[3]:
+        return None
+    return blocked
+
+def remove_rect_from_bands(
+        bands: list[tuple[int, int, list[tuple[int, int]], int]],
+        rect: tuple[int, int, int, int],
+        width: int,
+        height: int,
+        bounds: tuple[int, int, int, int]
+    ) -> list[tuple[int, int, list[tuple[int, int]], int]]:
+    """
+    Updates bands returned by get_free_bands after another rectangle
+    is added, without sweeping the other rectangles again. The bands
+    on the rows blocked by the new rectangle are found with a binary
+    search, and only they are replaced.
+
+    Args:
+        bands: Bands returned by get_free_bands for the same
+        width, height and bounds.
+        rect: The added rectangle.
+        width: Width of the placed rectangle.
+        height: Height of the placed rectangle.
+        bounds: The first and last allowed x and y coordinates of
+        the placed rectangle as (first x, first y, last x, last y).
+
+    Returns:
+        New list of the free bands with the new rectangle included.
+    """
+    blocked = get_blocked_positions(rect, width, height, bounds)
+    if blocked is None:
+        return bands
+    blocked_first_x, blocked_first_y, blocked_last_x, blocked_last_y = blocked
+    first_index = bisect.bisect_left(
+        bands,
+        blocked_first_y,
+        key=lambda band: band[1]
+    )
+    last_index = bisect.bisect_right(
+        bands,
+        blocked_last_y,
+        lo=first_index,
+        key=lambda band: band[0]
+    )
+    new_bands = []
+    for band in bands[first_index:last_index]:
+        first_row, last_row, free_columns, free_count = band
+        if first_row < blocked_first_y:
+            append_band(
+                new_bands,
+                (first_row, blocked_first_y - 1, free_columns, free_count)
+            )
+        remaining_columns = []
+        remaining_count = 0
+        for first_column, last_column in free_columns:
+            if last_column < blocked_first_x or first_column > blocked_last_x:
+                remaining_columns.append((first_column, last_column))
+                remaining_count += last_column - first_column + 1
+                continue
+            if first_column < blocked_first_x:
+                remaining_columns.append((first_column, blocked_first_x - 1))
+                remaining_count += blocked_first_x - first_column
+            if last_column > blocked_last_x:
+                remaining_columns.append((blocked_last_x + 1, last_column))
+                remaining_count += last_column - blocked_last_x
+        if remaining_count:
+            append_band(
+                new_bands,
+                (
+                    max(first_row, blocked_first_y),
+                    min(last_row, blocked_last_y),
+                    remaining_columns,
+                    remaining_count
+                )
+            )
+        if last_row > blocked_last_y:
+            append_band(
+                new_bands,
+                (blocked_last_y + 1, last_row, free_columns, free_count)
+            )
+    return bands[:first_index] + new_bands + bands[last_index:]
+
+def append_band(
+        bands: list[tuple[int, int, list[tuple[int, int]], int]],
+        band: tuple[int, int, list[tuple[int, int]], int]
+    ):
+    """
+    Appends a band to a list of bands, joining it with the last band
+    if that ends on the previous row and has the same free columns.
+    """
+    if bands:
+        first_row, last_row, free_columns, free_count = bands[-1]
+        if last_row + 1 == band[0] and free_columns == band[2]:
+            bands[-1] = (first_row, band[1], free_columns, free_count)
+            return
+    bands.append(band)
+
+def get_free_position(
+        bands: list[tuple[int, int, list[tuple[int, int]], int]],
+        position_number: int
+    ) -> tuple[int, int]:
+    """
+    Gets a free position by its number, counting the positions of each
+    band row by row from the first band.
+
+    Args:
+        bands: Bands returned by get_free_bands.
+        position_number: Number of the position, between 0 and
+        the number of free positions - 1.
+
+    Returns:
+        Tuple with the x and y coordinates of the position.
+    """
+    for first_row, last_row, free_columns, free_count in bands:
+        band_size = (last_row - first_row + 1) * free_count
+        if position_number >= band_size:
+            position_number -= band_size
+            continue
+        row_offset, column_number = divmod(position_number, free_count)
+        for first_column, last_column in free_columns:
+            if column_number <= last_column - first_column:
+                return (first_column + column_number, first_row + row_offset)
+            column_number -= last_column - first_column + 1
+    raise ValueError(
+        "Position number is larger than the number of free positions."
+    )
+
+def count_free_positions(
+        bands: list[tuple[int, int, list[tuple[int, int]], int]]
+    ) -> int:
+    """
+    Returns:
+        Number of free positions in bands returned by get_free_bands.
+    """
+    return sum(
+        (last_row - first_row + 1) * free_count
+        for first_row, last_row, _, free_count in bands
+    )
@@ -4,14 +4,123 @@ points, edges and triangles.
 """
 
 import math
-import uuid
+import itertools
+from fractions import Fraction
+
+# Error bounds for the floating point filters of the predicates below.
+# From J. R. Shewchuk, "Adaptive Precision Floating-Point Arithmetic
+# and Fast Robust Geometric Predicates"
+EPSILON = 2.0 ** -53
+ORIENTATION_ERROR_BOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+# Relative margin around a cached circumcircle inside which
+# the exact incircle predicate is used instead
+CIRCUMCIRCLE_MARGIN = 1e-9
+# Number of decimals point coordinates are rounded to
+# when comparing and hashing points
+POINT_KEY_DECIMALS = 6
+
+# Counters used to give each created object a unique integer id
+point_id_counter = itertools.count()
+edge_id_counter = itertools.count()
+triangle_id_counter = itertools.count()
+
+def orientation(
+        ax: float, ay: float,
+        bx: float, by: float,
+        cx: float, cy: float
+    ) -> float:
+    """
+    Orientation predicate of three points.
+    The floating point result is only used when it is known to have
+    the correct sign, otherwise the determinant is calculated exactly.
+
+    Returns:
+        A positive value if the points are in counter-clockwise order,
+        a negative value if they are in clockwise order and
+        zero if they are on a single line.
+    """
+    left = (ax - cx) * (by - cy)
+    right = (ay - cy) * (bx - cx)
+    determinant = left - right
+    if abs(determinant) > ORIENTATION_ERROR_BOUND * (abs(left) + abs(right)):
+        return determinant
+    acx = Fraction(ax) - Fraction(cx)
+    acy = Fraction(ay) - Fraction(cy)
+    bcx = Fraction(bx) - Fraction(cx)
+    bcy = Fraction(by) - Fraction(cy)
+    exact = acx * bcy - acy * bcx
+    # Keep the sign even if the exact value is too small for a float
+    return float(exact) or float((exact > 0) - (exact < 0))
+
+def incircle(
+        ax: float, ay: float,
+        bx: float, by: float,
+        cx: float, cy: float,
+        dx: float, dy: float
+    ) -> float:
+    """
+    Incircle predicate of four points.
+    The floating point result is only used when it is known to have
+    the correct sign, otherwise the determinant is calculated exactly.
+
+    Returns:
+        A positive value if point d is inside the circle going through
+        the counter-clockwise points a, b and c, a negative value if it is
+        outside and zero if all four points are on the same circle.
+        The sign is reversed if a, b and c are in clockwise order.
+    """
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    determinant = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    if abs(determinant) > INCIRCLE_ERROR_BOUND * permanent:
+        return determinant
+    dx = Fraction(dx)
+    dy = Fraction(dy)
+    adx = Fraction(ax) - dx
+    ady = Fraction(ay) - dy
+    bdx = Fraction(bx) - dx
+    bdy = Fraction(by) - dy
+    cdx = Fraction(cx) - dx
+    cdy = Fraction(cy) - dy
+    exact = (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+    # Keep the sign even if the exact value is too small for a float
+    return float(exact) or float((exact > 0) - (exact < 0))
 
 class Point:
     """
     Point class that contains useful functions for working with points.
     """
+    __slots__ = ("point_id", "x", "y")
+
     def __init__(self, x : float, y : float) -> None:
-        self.point_id = uuid.uuid4()
+        self.point_id = next(point_id_counter)
         self.x = x
         self.y = y
 
@@ -34,24 +143,57 @@ class Point:
     def __str__(self) -> str:
         return f"Point<{self.x}, {self.y}>"
 
+    @property
+    def key(self) -> tuple[float, float]:
+        """
+        Canonical key of the point's position. Points with the same key
+        are considered equal, so points can be used in sets and dicts.
+
+        Returns:
+            Tuple of the point's coordinates rounded
+            to POINT_KEY_DECIMALS decimals.
+        """
+        return (
+            round(self.x, POINT_KEY_DECIMALS),
+            round(self.y, POINT_KEY_DECIMALS)
+        )
+
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Point):
             return False
-        if math.isclose(self.x, __value.x) and math.isclose(self.y, __value.y):
-            return True
-        return False
+        return self.key == __value.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
 
 class Edge:
     """
     Edge class that contains useful functions for working with edges.
     """
+    __slots__ = ("vertices", "edge_id")
+
     def __init__(self, vertices : tuple[Point, Point]) -> None:
-        if vertices[0].get_distance_to(vertices[1]) == 0:
+        if vertices[0].x == vertices[1].x and vertices[0].y == vertices[1].y:
             raise ValueError(
                 "Distance between given vertices is 0. Only edges of non-zero length are considered valid."
             )
         self.vertices = vertices
-        self.edge_id = uuid.uuid4()
+        self.edge_id = next(edge_id_counter)
+
+    @property
+    def key(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """
+        Canonical key of the edge that does not depend on the order
+        of the vertices. Edges with the same key are considered equal.
+
+        Returns:
+            Tuple of the vertices' keys, smaller key first.
+        """
+        first = self.vertices[0].key
+        second = self.vertices[1].key
+        if first < second:
+            return (first, second)
+        return (second, first)
 
     def get_length(self) -> float:
         """
@@ -66,18 +208,10 @@ class Edge:
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Edge):
             return False
-        if (
-            (
-                self.vertices[0] == __value.vertices[0] and
-                self.vertices[1] == __value.vertices[1]
-            ) or
-            (
-                self.vertices[0] == __value.vertices[1] and
-                self.vertices[1] == __value.vertices[0]
-            )
-        ):
-            return True
-        return False
+        return self.key == __value.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
 
     def __repr__(self) -> str:
         return f"Edge[{self.vertices[0]}, {self.vertices[1]}]"
@@ -89,6 +223,16 @@ class Triangle:
     """
     Triangle class that contains useful functions for working with triangles.
     """
+    __slots__ = (
+        "vertices",
+        "edges",
+        "triangle_id",
+        "orientation_sign",
+        "circumcenter_x",
+        "circumcenter_y",
+        "circumradius_squared"
+    )
+
     def __init__(self, vertices : tuple[Point, Point, Point]) -> None:
         if (
             vertices[0] == vertices[1] or
@@ -101,11 +245,12 @@ class Triangle:
         # Check cross product of vertices to check
         # if the 3 given points are on a single line,
         # and thus making an invalid triangle
-        if (
-            (vertices[1].x - vertices[0].x) * (vertices[2].y - vertices[0].y)
-            -(vertices[1].y - vertices[0].y) * (vertices[2].x - vertices[0].x)
-            == 0
-        ):
+        vertex_orientation = orientation(
+            vertices[0].x, vertices[0].y,
+            vertices[1].x, vertices[1].y,
+            vertices[2].x, vertices[2].y
+        )
+        if vertex_orientation == 0:
             raise ValueError(
                 "Created triangle has all 3 points on a single line. Only triangles with a non-zero area are considered valid."
             )
@@ -115,7 +260,13 @@ class Triangle:
             Edge((vertices[1], vertices[2])),
             Edge((vertices[2], vertices[0]))
         )
-        self.triangle_id = uuid.uuid4()
+        self.triangle_id = next(triangle_id_counter)
+        self.orientation_sign = 1 if vertex_orientation > 0 else -1
+        (
+            self.circumcenter_x,
+            self.circumcenter_y,
+            self.circumradius_squared
+        ) = self.calculate_circumcircle()
 
     def get_circumcircle_radius(self):
         """
@@ -125,7 +276,7 @@ class Triangle:
         Returns:
             Radius of the circumcircle.
         """
-        return self.vertices[0].get_distance_to(self.get_circumcenter())
+        return math.sqrt(self.circumradius_squared)
 
     def get_circumcenter(self) -> Point:
         """
@@ -135,34 +286,28 @@ class Triangle:
         Returns:
             Point object at the circumcenter.
         """
-        d = (
-            2 * (
-                self.vertices[0].x * (self.vertices[1].y - self.vertices[2].y) +
-                self.vertices[1].x * (self.vertices[2].y - self.vertices[0].y) +
-                self.vertices[2].x * (self.vertices[0].y - self.vertices[1].y)
-            )
-        )
+        return Point(self.circumcenter_x, self.circumcenter_y)
+
+    def calculate_circumcircle(self) -> tuple[float, float, float]:
+        """
+        Calculates the circumcircle of the three tips of the triangle.
+
+        Returns:
+            Tuple of the circumcenter's x and y coordinates
+            and the squared radius of the circumcircle.
+        """
+        a, b, c = self.vertices
+        a_lift = a.x**2 + a.y**2
+        b_lift = b.x**2 + b.y**2
+        c_lift = c.x**2 + c.y**2
+        d = 2 * (a.x * (b.y - c.y) + b.x * (c.y - a.y) + c.x * (a.y - b.y))
         ux = (
-            (1 / d) * (
-                (self.vertices[0].x**2 + self.vertices[0].y**2) *
-                (self.vertices[1].y - self.vertices[2].y) +
-                (self.vertices[1].x**2 + self.vertices[1].y**2) *
-                (self.vertices[2].y - self.vertices[0].y) +
-                (self.vertices[2].x**2 + self.vertices[2].y**2) *
-                (self.vertices[0].y - self.vertices[1].y)
-            )
-        )
+            a_lift * (b.y - c.y) + b_lift * (c.y - a.y) + c_lift * (a.y - b.y)
+        ) / d
         uy = (
-            (1 / d) * (
-                (self.vertices[0].x**2 + self.vertices[0].y**2) *
-                (self.vertices[2].x - self.vertices[1].x) +
-                (self.vertices[1].x**2 + self.vertices[1].y**2) *
-                (self.vertices[0].x - self.vertices[2].x) +
-                (self.vertices[2].x**2 + self.vertices[2].y**2) *
-                (self.vertices[1].x - self.vertices[0].x)
-            )
-        )
-        return Point(ux, uy)
+            a_lift * (c.x - b.x) + b_lift * (a.x - c.x) + c_lift * (b.x - a.x)
+        ) / d
+        return (ux, uy, (a.x - ux)**2 + (a.y - uy)**2)
 
     def is_point_in_circumcircle(self, point : Point) -> bool:
         """
@@ -173,12 +318,29 @@ class Triangle:
             Wether point is inside or not the
             circumcenter as a bool.
         """
-        if (
-            self.get_circumcenter().get_distance_to(point) <
-            self.get_circumcircle_radius()
-        ):
-            return True
-        return False
+        dx = point.x - self.circumcenter_x
+        dy = point.y - self.circumcenter_y
+        difference = dx * dx + dy * dy - self.circumradius_squared
+        if abs(difference) > CIRCUMCIRCLE_MARGIN * self.circumradius_squared:
+            return difference < 0
+        return self.incircle(point) > 0
+
+    def incircle(self, point : Point) -> float:
+        """
+        Exact incircle predicate that does not depend
+        on the order of the triangle's vertices.
+
+        Args:
+            point: The point to check for.
+
+        Returns:
+            A positive value if the point is inside the circumcircle,
+            a negative value if it is outside and zero if it is on it.
+        """
+        a, b, c = self.vertices
+        return self.orientation_sign * incircle(
+            a.x, a.y, b.x, b.y, c.x, c.y, point.x, point.y
+        )
 
     def has_edge(self, edge : Edge) -> bool:
         """
@@ -231,13 +393,24 @@ class Triangle:
                 return True
         return False
 
+    @property
+    def key(self) -> frozenset:
+        """
+        Canonical key of the triangle that does not depend
+        on the order of the vertices.
+
+        Returns:
+            Frozenset of the vertices' keys.
+        """
+        return frozenset(vertex.key for vertex in self.vertices)
+
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Triangle):
             return False
-        for edge in self.edges:
-            if not __value.has_edge(edge):
-                return False
-        return True
+        return self.key == __value.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
 
     def __repr__(self) -> str:
         return f"Triangle[{self.edges[0]}, {self.edges[1]}, {self.edges[2]}]"
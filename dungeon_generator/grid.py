@@ -1,10 +1,7 @@
 """
 Module containing the Grid class.
 """
-import math
 import enum
-from pygame import Vector2
-from dungeon_generator.geometry import Edge
 
 class Direction(enum.Enum):
     NORTH = 0
@@ -12,22 +9,83 @@ class Direction(enum.Enum):
     SOUTH = 2
     WEST = 3
 
+# Coordinate steps to the north, east, south and west neighbours
+NEIGHBOUR_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+# Coordinate steps to all 8 neighbours, rows from the smallest y up
+FULL_NEIGHBOUR_DIRECTIONS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1)
+)
+
+class Tile(enum.IntEnum):
+    """
+    Integer codes of the tile types stored in a grid.
+    BORDER is only used in the ring of cells around the grid.
+    """
+    NONE = 0
+    EMPTY = 1
+    ROOM_FLOOR = 2
+    ROOM_WALL = 3
+    CORRIDOR_FLOOR = 4
+    CORRIDOR_WALL = 5
+    BORDER = 255
+
+# Cell values of the tile codes, indexed by code
+TILE_VALUES = (
+    None,
+    "empty",
+    "room_floor",
+    "room_wall",
+    "corridor_floor",
+    "corridor_wall"
+)
+MAX_TILE_CODES = 255
+CHUNK_SIZE = 64
+
 class Grid:
     """
     Grid objects that is a 2D-array containing values in a grid.
-    The values can be of any type.
+    Cells are stored in a flat bytearray as tile codes, one byte per cell
+    in rows from the smallest y coordinate up. get_cell and set_cell
+    convert between the codes and cell values, which can be of any
+    hashable type. Codes for values other than the ones in TILE_VALUES
+    are added when the values are first set.
+
+    The cell array is padded with a ring of Tile.BORDER cells around
+    the grid, so the neighbours of any cell inside the bounds can be
+    found by adding the offsets in neighbour_offsets or
+    full_neighbour_offsets to its index without checking the bounds.
     """
+    __slots__ = (
+        "bounds", "size", "min_x", "min_y", "width", "height", "stride",
+        "cells", "tile_values", "tile_codes",
+        "neighbour_offsets", "full_neighbour_offsets"
+    )
+
     def __init__(self, size : int) -> None:
-        self.cells = {}
-        for y in range((-size // 2), (size // 2)):
-            self.cells[y] = {}
-            for x in range((-size // 2), (size // 2)):
-                self.cells[y][x] = None
         self.bounds = (
             (-size // 2, -size // 2),
             ((size // 2)-1, (size // 2)-1)
         )
         self.size = size
+        self.min_x = self.bounds[0][0]
+        self.min_y = self.bounds[0][1]
+        self.width = self.bounds[1][0] - self.min_x + 1
+        self.height = self.bounds[1][1] - self.min_y + 1
+        self.stride = self.width + 2
+        self.cells = bytearray(self.stride * (self.height + 2))
+        self.tile_values = list(TILE_VALUES)
+        self.tile_codes = {
+            value: code for code, value in enumerate(self.tile_values)
+        }
+        self.fill(None)
+        self.neighbour_offsets = tuple(
+            dy * self.stride + dx for dx, dy in NEIGHBOUR_DIRECTIONS
+        )
+        self.full_neighbour_offsets = tuple(
+            dy * self.stride + dx for dx, dy in FULL_NEIGHBOUR_DIRECTIONS
+        )
 
     def is_cell_in_bounds(self, x : int, y : int):
         """
@@ -38,14 +96,72 @@ class Grid:
             self.bounds[1][0] >= x >= self.bounds[0][0]
         )
 
+    def get_index(self, x : int, y : int) -> int:
+        """
+        Gets the index of a cell in the cell array.
+        The cell should be inside the bounds of the grid.
+        """
+        return (y - self.min_y + 1) * self.stride + (x - self.min_x + 1)
+
+    def get_coordinates(self, index : int) -> tuple[int, int]:
+        """
+        Gets the coordinates of the cell with the given index.
+        """
+        row, column = divmod(index, self.stride)
+        return (column - 1 + self.min_x, row - 1 + self.min_y)
+
+    def get_tile_code(self, cell_value) -> int:
+        """
+        Gets the tile code of a cell value.
+        A new code is added for values without one.
+        """
+        code = self.tile_codes.get(cell_value)
+        if code is None:
+            if len(self.tile_values) == MAX_TILE_CODES:
+                raise ValueError(
+                    f"A grid can only contain {MAX_TILE_CODES} different cell values."
+                )
+            code = len(self.tile_values)
+            self.tile_values.append(cell_value)
+            self.tile_codes[cell_value] = code
+        return code
+
+    def get_tile(self, x : int, y : int) -> int:
+        """
+        Gets the tile code of the cell in the specified coordinates.
+        If cell does not exist, returns None.
+        """
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return None
+        return self.cells[(row + 1) * self.stride + column + 1]
+
+    def set_tile(self, x : int, y : int, code : int) -> bool:
+        """
+        Sets the tile code of the cell in the specified coordinates.
+        If the cell position is not inside of the grid bounds,
+        returns False. Otherwise returns True.
+        """
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return False
+        self.cells[(row + 1) * self.stride + column + 1] = code
+        return True
+
     def get_cell(self, x : int, y : int):
         """
         Gets the cell's value in the specified coordinates.
         If cell does not exist, returns None.
         """
-        if not self.is_cell_in_bounds(x, y):
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
             return None
-        return self.cells[y][x]
+        return self.tile_values[
+            self.cells[(row + 1) * self.stride + column + 1]
+        ]
 
     def set_cell(self, x : int, y : int, cell_value):
         """
@@ -53,11 +169,117 @@ class Grid:
         If the cell position is not inside of the grid bounds,
         returns False. Otherwise returns True.
         """
-        if not self.is_cell_in_bounds(x, y):
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
             return False
-        self.cells[y][x] = cell_value
+        code = self.tile_codes.get(cell_value)
+        if code is None:
+            code = self.get_tile_code(cell_value)
+        self.cells[(row + 1) * self.stride + column + 1] = code
         return True
 
+    def clip_rect(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int
+        ) -> tuple[int, int, int, int]:
+        """
+        Clips a rectangle to the grid. The rectangle contains the cells
+        from (x0, y0) to (x1, y1), including the corners.
+
+        Returns:
+            The first and last column and row of the clipped rectangle,
+            counted from the minimum corner of the grid. If the rectangle
+            is outside of the grid, the last column or row is smaller
+            than the first.
+        """
+        return (
+            max(min(x0, x1) - self.min_x, 0),
+            max(min(y0, y1) - self.min_y, 0),
+            min(max(x0, x1) - self.min_x, self.width - 1),
+            min(max(y0, y1) - self.min_y, self.height - 1)
+        )
+
+    def fill(self, cell_value) -> None:
+        """
+        Sets the value of every cell in the grid.
+        """
+        border = bytes((Tile.BORDER,))
+        row = border + bytes((self.get_tile_code(cell_value),)) * self.width
+        row += border
+        self.cells[:] = (
+            border * self.stride + row * self.height + border * self.stride
+        )
+
+    def fill_rect(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int,
+            cell_value
+        ) -> None:
+        """
+        Sets the value of the cells in a rectangle from (x0, y0)
+        to (x1, y1), including the corners. Cells outside
+        of the grid bounds are ignored.
+        """
+        first_column, first_row, last_column, last_row = self.clip_rect(
+            x0, y0, x1, y1
+        )
+        if first_column > last_column:
+            return
+        run = bytes((self.get_tile_code(cell_value),)) * (
+            last_column - first_column + 1
+        )
+        for row in range(first_row + 1, last_row + 2):
+            start = row * self.stride + first_column + 1
+            self.cells[start:start + len(run)] = run
+
+    def outline_rect(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int,
+            cell_value
+        ) -> None:
+        """
+        Sets the value of the cells on the border of a rectangle from
+        (x0, y0) to (x1, y1). Cells outside of the grid bounds are ignored.
+        """
+        left, right = min(x0, x1), max(x0, x1)
+        bottom, top = min(y0, y1), max(y0, y1)
+        self.fill_rect(left, bottom, right, bottom, cell_value)
+        self.fill_rect(left, top, right, top, cell_value)
+        first_column, first_row, last_column, last_row = self.clip_rect(
+            left, bottom + 1, right, top - 1
+        )
+        if first_row > last_row:
+            return
+        code = self.get_tile_code(cell_value)
+        for column in (left - self.min_x, right - self.min_x):
+            if first_column <= column <= last_column:
+                start = (first_row + 1) * self.stride + column + 1
+                stop = (last_row + 1) * self.stride + column + 2
+                self.cells[start:stop:self.stride] = bytes((code,)) * (
+                    last_row - first_row + 1
+                )
+
+    def replace(self, old_value, new_value) -> None:
+        """
+        Replaces the value of every cell containing old_value with new_value.
+        """
+        old_code = self.tile_codes.get(old_value)
+        if old_code is None:
+            return
+        table = bytearray(range(256))
+        table[old_code] = self.get_tile_code(new_value)
+        self.cells[:] = self.cells.translate(table)
+
     def get_cell_neighbours(self, x : int, y : int) -> tuple:
         """
         Returns the North, East, South and West neighbours
@@ -98,208 +320,252 @@ class Grid:
                     neighbors.append(None)
         return neighbors
 
-class AStar:
+class ChunkedGrid(Grid):
+    """
+    Grid that stores its cells in square chunks. A chunk is only
+    allocated when one of its cells is set to a value other than the
+    default value, so memory use depends on the area that is written to
+    instead of the size of the grid.
+
+    The chunks are not padded and the grid has no flat cell array,
+    so cells has the value None and neighbour offsets can not be used.
+
+    Args:
+        size: Side length of the grid.
+        chunk_size: Side length of a chunk.
+        default_value: Value of the cells in unallocated chunks.
+    """
+    __slots__ = ("chunk_size", "chunks", "default_code")
+
     def __init__(
             self,
-            grid: Grid,
-            allowed_path_cell_values: list[str] = [
-                "empty",
-                "corridor_floor",
-                "corridor_wall"
-            ]
+            size : int,
+            chunk_size : int = CHUNK_SIZE,
+            default_value = None
         ) -> None:
-        self.grid = grid
-        self.allowed_path_cell_values = allowed_path_cell_values
-
-    def paths_for_rooms(self, room_dict: dict, edges: list[Edge]):
-        for edge in edges:
-            point_tuple0 = (edge.vertices[0].x, edge.vertices[0].y)
-            point_tuple1 = (edge.vertices[1].x, edge.vertices[1].y)
-            room0 = room_dict[point_tuple0]
-            room1 = room_dict[point_tuple1]
-            start = room0.north_entrance
-            end = room1.north_entrance
-            dir = self.get_direction_from_edge(edge)
-            if dir == Direction.NORTH:
-                start = (room0.north_entrance[0], room0.north_entrance[1] + 2)
-                end = (room1.south_entrance[0], room1.south_entrance[1] - 2)
-                self.grid.set_cell(
-                    room0.north_entrance[0],
-                    room0.north_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.south_entrance[0],
-                    room1.south_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room0.north_entrance[0],
-                    room0.north_entrance[1]+1,
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.south_entrance[0],
-                    room1.south_entrance[1]-1,
-                    "corridor_floor"
-                )
-            if dir == Direction.EAST:
-                start = (room0.east_entrance[0] + 2, room0.east_entrance[1])
-                end = (room1.west_entrance[0] - 2, room1.west_entrance[1])
-                self.grid.set_cell(
-                    room0.east_entrance[0],
-                    room0.east_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.west_entrance[0],
-                    room1.west_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room0.east_entrance[0]+1,
-                    room0.east_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.west_entrance[0]-1,
-                    room1.west_entrance[1],
-                    "corridor_floor"
-                )
-            if dir == Direction.WEST:
-                start = (room0.west_entrance[0] - 2, room0.west_entrance[1])
-                end = (room1.east_entrance[0] + 2, room1.east_entrance[1])
-                self.grid.set_cell(
-                    room0.west_entrance[0],
-                    room0.west_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.east_entrance[0],
-                    room1.east_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room0.west_entrance[0]-1,
-                    room0.west_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.east_entrance[0]+1,
-                    room1.east_entrance[1],
-                    "corridor_floor"
-                )
-            elif dir == Direction.SOUTH:
-                start = (room0.south_entrance[0], room0.south_entrance[1] - 2)
-                end = (room1.north_entrance[0], room1.north_entrance[1] + 2)
-                self.grid.set_cell(
-                    room0.south_entrance[0],
-                    room0.south_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.north_entrance[0],
-                    room1.north_entrance[1],
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room0.south_entrance[0],
-                    room0.south_entrance[1]-1,
-                    "corridor_floor"
-                )
-                self.grid.set_cell(
-                    room1.north_entrance[0],
-                    room1.north_entrance[1]+1,
-                    "corridor_floor"
-                )
-            self.grid.set_cell(start[0], start[1], "corridor_floor")
-            self.grid.set_cell(end[0], end[1], "corridor_floor")
-            tiles = self.find_path((start[0], start[1]), (end[0], end[1]))
-            for tile in tiles:
-                self.grid.set_cell(tile[0], tile[1], "corridor_floor")
-                for neighbor_tile in self.grid.get_full_cell_neighbours(tile[0], tile[1]):
-                    if self.grid.get_cell(neighbor_tile[0], neighbor_tile[1]) == "empty":
-                        self.grid.set_cell(neighbor_tile[0], neighbor_tile[1], "corridor_wall")
-
-    def get_direction_from_edge(self, edge: Edge):
-        edge_dir_vector = Vector2(
-            edge.vertices[1].x - edge.vertices[0].x,
-            edge.vertices[1].y - edge.vertices[0].y
+        # pylint: disable=super-init-not-called
+        self.bounds = (
+            (-size // 2, -size // 2),
+            ((size // 2)-1, (size // 2)-1)
         )
-        angle = edge_dir_vector.as_polar()[1]
-        if 45 <= angle <= 135:
-            return Direction.NORTH
-        elif 135 < angle or -135 > angle:
-            return Direction.WEST
-        elif 45 > angle or -45 < angle:
-            return Direction.EAST
-        elif -45 >= angle >= -135:
-            return Direction.SOUTH
-        else:
-            return Direction.NORTH
-
-    def reconstruct_path(self, last: tuple[int, int], previous_nodes: dict):
-        path = []
-        prev = last
-        for _ in range(len(previous_nodes.keys())):
-            path.append(prev)
-            prev = previous_nodes[prev]
-            if prev is None:
-                break
-        return path
-
-    def find_path(self, start: tuple[int, int], end: tuple[int, int]):
-        # https://en.wikipedia.org/wiki/A*_search_algorithm#Pseudocode
-        queue = []
-        queue.append(start)
-        previous_cheapest_node = {}
-        cheapest_path_score = {}
-        estimate_path_score = {}
-        for y in range((-self.grid.size // 2), (self.grid.size // 2)):
-            for x in range((-self.grid.size // 2), (self.grid.size // 2)):
-                cheapest_path_score[(x, y)] = 99999999999999
-                estimate_path_score[(x, y)] = 99999999999999
-        cheapest_path_score[start] = 0
-        estimate_path_score[start] = self.calculate_heuristic_score(start, end)
-        previous_cheapest_node[start] = None
-        for _ in range(100000):
-            if len(queue) == 0:
-                break
-            queue.sort(key=lambda cell : estimate_path_score[cell], reverse=True)
-            current = queue.pop()
-            if current == end:
-                return self.reconstruct_path(current, previous_cheapest_node)
-            neighbor_cells = self.get_valid_neighbors(
-                self.grid.get_cell_neighbours(current[0], current[1])
+        self.size = size
+        self.min_x = self.bounds[0][0]
+        self.min_y = self.bounds[0][1]
+        self.width = self.bounds[1][0] - self.min_x + 1
+        self.height = self.bounds[1][1] - self.min_y + 1
+        self.stride = None
+        self.cells = None
+        self.neighbour_offsets = None
+        self.full_neighbour_offsets = None
+        self.tile_values = list(TILE_VALUES)
+        self.tile_codes = {
+            value: code for code, value in enumerate(self.tile_values)
+        }
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, int], bytearray] = {}
+        self.default_code = self.get_tile_code(default_value)
+
+    def get_chunk(self, chunk_key : tuple[int, int]) -> bytearray:
+        """
+        Gets a chunk, allocating it if it does not exist.
+
+        Args:
+            chunk_key: Column and row of the chunk.
+        """
+        chunk = self.chunks.get(chunk_key)
+        if chunk is None:
+            chunk = bytearray((self.default_code,)) * (
+                self.chunk_size * self.chunk_size
             )
-            for neighbor in neighbor_cells:
-                tentative_score = cheapest_path_score[current] + 1
-                if tentative_score < cheapest_path_score[neighbor]:
-                    previous_cheapest_node[neighbor] = current
-                    cheapest_path_score[neighbor] = tentative_score
-                    estimate_path_score[neighbor] = (
-                        tentative_score + self.calculate_heuristic_score(neighbor, end)
-                    )
-                    if neighbor not in queue:
-                        queue.append(neighbor)
-
-        return []
-
-    def calculate_heuristic_score(self, cell: tuple[int, int], goal: tuple[int, int]) -> int:
-        return int(math.dist(cell, goal))
-
-    def get_valid_neighbors(self, neighbours: tuple[tuple[int, int]]):
-        valid_neighbours = []
-        for neighbour in neighbours:
-            if neighbour is None:
+            self.chunks[chunk_key] = chunk
+        return chunk
+
+    def get_tile(self, x : int, y : int) -> int:
+        """
+        Gets the tile code of the cell in the specified coordinates.
+        If cell does not exist, returns None.
+        """
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return None
+        chunk_row, cell_row = divmod(row, self.chunk_size)
+        chunk_column, cell_column = divmod(column, self.chunk_size)
+        chunk = self.chunks.get((chunk_column, chunk_row))
+        if chunk is None:
+            return self.default_code
+        return chunk[cell_row * self.chunk_size + cell_column]
+
+    def set_tile(self, x : int, y : int, code : int) -> bool:
+        """
+        Sets the tile code of the cell in the specified coordinates.
+        If the cell position is not inside of the grid bounds,
+        returns False. Otherwise returns True.
+        """
+        column = x - self.min_x
+        row = y - self.min_y
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return False
+        chunk_row, cell_row = divmod(row, self.chunk_size)
+        chunk_column, cell_column = divmod(column, self.chunk_size)
+        chunk_key = (chunk_column, chunk_row)
+        if chunk_key not in self.chunks and code == self.default_code:
+            return True
+        self.get_chunk(chunk_key)[cell_row * self.chunk_size + cell_column] = code
+        return True
+
+    def get_cell(self, x : int, y : int):
+        """
+        Gets the cell's value in the specified coordinates.
+        If cell does not exist, returns None.
+        """
+        code = self.get_tile(x, y)
+        if code is None:
+            return None
+        return self.tile_values[code]
+
+    def set_cell(self, x : int, y : int, cell_value):
+        """
+        Sets the value in a cell in the specied coordinates.
+        If the cell position is not inside of the grid bounds,
+        returns False. Otherwise returns True.
+        """
+        return self.set_tile(x, y, self.get_tile_code(cell_value))
+
+    def get_rect_tiles(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int
+        ) -> bytearray:
+        """
+        Copies the tile codes of the cells in a rectangle from (x0, y0)
+        to (x1, y1), including the corners, into a flat array. Cells
+        outside of the grid bounds get the code Tile.BORDER, like the
+        padding of a flat grid.
+
+        Returns:
+            Bytearray of the tile codes row by row from the row of y0,
+            with rows of x1 - x0 + 1 cells starting from x0.
+        """
+        chunk_size = self.chunk_size
+        default_chunk_row = bytes((self.default_code,)) * chunk_size
+        border = bytes((Tile.BORDER,))
+        first_column, _, last_column, _ = self.clip_rect(x0, y0, x1, y1)
+        left_padding = border * (first_column + self.min_x - x0)
+        right_padding = border * (x1 - last_column - self.min_x)
+        out_of_bounds_row = border * (x1 - x0 + 1)
+        tiles = bytearray()
+        for y in range(y0, y1 + 1):
+            row = y - self.min_y
+            if not 0 <= row < self.height or first_column > last_column:
+                tiles += out_of_bounds_row
                 continue
-            valid = True
-            if self.grid.get_cell(neighbour[0], neighbour[1]) in self.allowed_path_cell_values:
-                for other_neighbor in self.grid.get_full_cell_neighbours(neighbour[0], neighbour[1]):
-                    if other_neighbor is None:
-                        continue
-                    if (self.grid.get_cell(other_neighbor[0], other_neighbor[1]) not in self.allowed_path_cell_values):
-                        valid = False
-                if valid:
-                    valid_neighbours.append(neighbour)
-        return valid_neighbours
+            chunk_row, cell_row = divmod(row, chunk_size)
+            tiles += left_padding
+            for chunk_column in range(
+                first_column // chunk_size,
+                last_column // chunk_size + 1
+            ):
+                start_column = max(first_column - chunk_column * chunk_size, 0)
+                stop_column = min(
+                    last_column - chunk_column * chunk_size + 1,
+                    chunk_size
+                )
+                chunk = self.chunks.get((chunk_column, chunk_row))
+                if chunk is None:
+                    tiles += default_chunk_row[start_column:stop_column]
+                else:
+                    start = cell_row * chunk_size
+                    tiles += chunk[start + start_column:start + stop_column]
+            tiles += right_padding
+        return tiles
+
+    def fill(self, cell_value) -> None:
+        """
+        Sets the value of every cell in the grid
+        by removing all chunks and changing the default value.
+        """
+        self.chunks.clear()
+        self.default_code = self.get_tile_code(cell_value)
+
+    def fill_rect(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int,
+            cell_value
+        ) -> None:
+        """
+        Sets the value of the cells in a rectangle from (x0, y0)
+        to (x1, y1), including the corners. Cells outside
+        of the grid bounds are ignored.
+        """
+        first_column, first_row, last_column, last_row = self.clip_rect(
+            x0, y0, x1, y1
+        )
+        if first_column > last_column or first_row > last_row:
+            return
+        code = self.get_tile_code(cell_value)
+        chunk_size = self.chunk_size
+        for chunk_row in range(
+            first_row // chunk_size,
+            last_row // chunk_size + 1
+        ):
+            for chunk_column in range(
+                first_column // chunk_size,
+                last_column // chunk_size + 1
+            ):
+                chunk_key = (chunk_column, chunk_row)
+                if chunk_key not in self.chunks and code == self.default_code:
+                    continue
+                chunk = self.get_chunk(chunk_key)
+                start_column = max(first_column - chunk_column * chunk_size, 0)
+                stop_column = min(
+                    last_column - chunk_column * chunk_size + 1,
+                    chunk_size
+                )
+                run = bytes((code,)) * (stop_column - start_column)
+                for cell_row in range(
+                    max(first_row - chunk_row * chunk_size, 0),
+                    min(last_row - chunk_row * chunk_size + 1, chunk_size)
+                ):
+                    start = cell_row * chunk_size + start_column
+                    chunk[start:start + len(run)] = run
+
+    def outline_rect(
+            self,
+            x0 : int,
+            y0 : int,
+            x1 : int,
+            y1 : int,
+            cell_value
+        ) -> None:
+        """
+        Sets the value of the cells on the border of a rectangle from
+        (x0, y0) to (x1, y1). Cells outside of the grid bounds are ignored.
+        """
+        left, right = min(x0, x1), max(x0, x1)
+        bottom, top = min(y0, y1), max(y0, y1)
+        self.fill_rect(left, bottom, right, bottom, cell_value)
+        self.fill_rect(left, top, right, top, cell_value)
+        if top - bottom > 1:
+            self.fill_rect(left, bottom + 1, left, top - 1, cell_value)
+            self.fill_rect(right, bottom + 1, right, top - 1, cell_value)
+
+    def replace(self, old_value, new_value) -> None:
+        """
+        Replaces the value of every cell containing old_value with new_value.
+        """
+        old_code = self.tile_codes.get(old_value)
+        if old_code is None:
+            return
+        new_code = self.get_tile_code(new_value)
+        table = bytearray(range(256))
+        table[old_code] = new_code
+        for chunk in self.chunks.values():
+            chunk[:] = chunk.translate(table)
+        if self.default_code == old_code:
+            self.default_code = new_code
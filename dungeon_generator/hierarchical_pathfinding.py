@@ -0,0 +1,565 @@
+"""
+Module containing the HierarchicalPathfinder class.
+Used to find long corridors on large grids by searching a graph of
+connections between square clusters of cells instead of single cells.
+"""
+
+import enum
+import heapq
+import itertools
+from dungeon_generator.grid import Grid
+from dungeon_generator.pathfinding import (
+    AStar,
+    NO_CELL,
+    MAX_PATH_SEARCH_STEPS,
+    PATH_CELL_VALUES,
+    manhattan_heuristic
+)
+from dungeon_generator.geometry import Edge
+
+CLUSTER_SIZE = 16
+
+class PathFailure(enum.Enum):
+    """
+    Reasons for not finding a path.
+    """
+    OUT_OF_BOUNDS = "start or end is outside of the grid"
+    START_BLOCKED = "start has no neighbour that can be moved into"
+    END_BLOCKED = "end can not be moved into"
+    NO_ROUTE = "start and end are not connected"
+
+class PathNotFoundError(Exception):
+    """
+    Raised when there is no path between two cells.
+
+    Args:
+        reason: PathFailure telling why there is no path.
+        start: Coordinates of the start cell.
+        end: Coordinates of the end cell.
+    """
+    def __init__(
+            self,
+            reason: PathFailure,
+            start: tuple[int, int],
+            end: tuple[int, int]
+        ) -> None:
+        super().__init__(f"No path from {start} to {end}: {reason.value}")
+        self.reason = reason
+        self.start = start
+        self.end = end
+
+class HierarchicalPathfinder(AStar):
+    """
+    Pathfinder that finds long paths with hierarchical A* (HPA*).
+
+    The grid is split into square clusters. Each maximal run of cells
+    that can be moved into on both sides of the border between two
+    clusters gets a transition, a pair of cells facing each other across
+    the border. The graph of a cluster connects its transition cells to
+    each other with the lengths of the shortest paths inside the cluster.
+    Graphs are created when a search first reaches the cluster and
+    dropped when the clearance map changes inside or next to it.
+
+    Paths between nearby cells are first searched with A* limited to
+    a window around the cells. Other paths are searched in the graph of
+    transitions and refined into cells with A* inside each cluster.
+    Since every run has a transition, a path is always found if one
+    exists, but it can be slightly longer than the shortest path.
+
+    Only grids with a flat cell array are supported.
+
+    Args:
+        grid: Grid in which paths are searched.
+        allowed_path_cell_values: Cell values that paths can go through.
+        cluster_size: Side length of the clusters.
+        window_distance: Largest Manhattan distance between the start
+        and end cells for which a windowed search is tried first.
+        window_margin: Number of cells the window of a windowed search
+        extends past the start and end cells.
+    """
+    def __init__(
+            self,
+            grid: Grid,
+            allowed_path_cell_values: tuple[str, ...] = PATH_CELL_VALUES,
+            cluster_size: int = CLUSTER_SIZE,
+            window_distance: int = 8 * CLUSTER_SIZE,
+            window_margin: int = 8
+        ) -> None:
+        if grid.cells is None:
+            raise ValueError(
+                "HierarchicalPathfinder requires a grid "
+                "with a flat cell array."
+            )
+        super().__init__(grid, allowed_path_cell_values)
+        self.heuristic = manhattan_heuristic
+        self.cluster_size = cluster_size
+        self.window_distance = window_distance
+        self.window_margin = window_margin
+        # Transitions of the east and north borders of each cluster,
+        # keyed by (cluster column, cluster row, border offset)
+        self.border_transitions: dict = {}
+        self.cluster_graphs: dict = {}
+        self.failed_paths: list[tuple[Edge, PathFailure]] = []
+
+    def update_clearance(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """
+        Updates the clearance map for the cells in a rectangle and drops
+        the cluster graphs and transitions that depend on those cells.
+        """
+        super().update_clearance(x0, y0, x1, y1)
+        size = self.cluster_size
+        first_column, first_row, last_column, last_row = self.grid.clip_rect(
+            x0 - 1, y0 - 1, x1 + 1, y1 + 1
+        )
+        for cluster_row in range(first_row // size, last_row // size + 1):
+            for cluster_column in range(
+                first_column // size,
+                last_column // size + 1
+            ):
+                self.invalidate_cluster((cluster_column, cluster_row))
+
+    def invalidate_cluster(self, cluster: tuple[int, int]) -> None:
+        """
+        Drops the graph and border transitions of a cluster and the
+        graphs of its neighbours, which share transitions with it.
+        """
+        column, row = cluster
+        stride = self.grid.stride
+        for key in (
+            (column, row, 1),
+            (column, row, stride),
+            (column - 1, row, 1),
+            (column, row - 1, stride)
+        ):
+            self.border_transitions.pop(key, None)
+        for neighbour in (
+            cluster,
+            (column + 1, row),
+            (column, row + 1),
+            (column - 1, row),
+            (column, row - 1)
+        ):
+            self.cluster_graphs.pop(neighbour, None)
+
+    def get_cluster(self, index: int) -> tuple[int, int]:
+        """
+        Gets the column and row of the cluster containing a cell.
+        """
+        row, column = divmod(index, self.grid.stride)
+        size = self.cluster_size
+        return ((column - 1) // size, (row - 1) // size)
+
+    def get_cluster_window(
+            self,
+            cluster: tuple[int, int]
+        ) -> tuple[int, int, int, int]:
+        """
+        Returns:
+            The first and last column and row of the cells of a cluster,
+            counted from the minimum corner of the grid.
+        """
+        size = self.cluster_size
+        return (
+            cluster[0] * size,
+            cluster[1] * size,
+            min(cluster[0] * size + size, self.grid.width) - 1,
+            min(cluster[1] * size + size, self.grid.height) - 1
+        )
+
+    def get_border_transitions(
+            self,
+            cluster: tuple[int, int],
+            offset: int
+        ) -> list[tuple[int, int]]:
+        """
+        Gets the transitions of the east or north border of a cluster.
+
+        Args:
+            cluster: Column and row of the cluster.
+            offset: Offset from a cell of the cluster to the cell on
+            the other side of the border, 1 for the east border and
+            the grid's stride for the north border.
+
+        Returns:
+            List of index pairs, the first index of each pair
+            inside the cluster and the second one outside of it.
+        """
+        key = (cluster[0], cluster[1], offset)
+        transitions = self.border_transitions.get(key)
+        if transitions is not None:
+            return transitions
+        transitions = []
+        first_column, first_row, last_column, last_row = (
+            self.get_cluster_window(cluster)
+        )
+        stride = self.grid.stride
+        if offset == 1:
+            if last_column == self.grid.width - 1:
+                self.border_transitions[key] = transitions
+                return transitions
+            first = (first_row + 1) * stride + last_column + 1
+            step = stride
+            length = last_row - first_row + 1
+        else:
+            if last_row == self.grid.height - 1:
+                self.border_transitions[key] = transitions
+                return transitions
+            first = (last_row + 1) * stride + first_column + 1
+            step = 1
+            length = last_column - first_column + 1
+        clearance = self.clearance
+        run = []
+        for index in range(first, first + length * step, step):
+            if clearance[index] and clearance[index + offset]:
+                run.append(index)
+                continue
+            if run:
+                middle = run[len(run) // 2]
+                transitions.append((middle, middle + offset))
+                run = []
+        if run:
+            middle = run[len(run) // 2]
+            transitions.append((middle, middle + offset))
+        self.border_transitions[key] = transitions
+        return transitions
+
+    def get_cluster_cells(self, cluster: tuple[int, int]) -> set[int]:
+        """
+        Returns:
+            Set of the indices of the cells in a cluster
+            that can be moved into.
+        """
+        first_column, first_row, last_column, last_row = (
+            self.get_cluster_window(cluster)
+        )
+        stride = self.grid.stride
+        clearance = self.clearance
+        cells = set()
+        for row in range(first_row + 1, last_row + 2):
+            first = row * stride + first_column + 1
+            last = row * stride + last_column + 1
+            cells.update(
+                index
+                for index in range(first, last + 1)
+                if clearance[index]
+            )
+        return cells
+
+    def get_cluster_distances(
+            self,
+            index: int,
+            cluster: tuple[int, int],
+            cells: set[int] = None
+        ) -> dict[int, int]:
+        """
+        Finds the lengths of the shortest paths from a cell to all
+        cells of a cluster that can be reached without leaving it.
+
+        Args:
+            index: Index of the cell to start from.
+            cluster: Column and row of the cluster.
+            cells: The cells of the cluster that can be moved into,
+            if already known.
+
+        Returns:
+            Dict of path lengths keyed by cell index.
+        """
+        if cells is None:
+            cells = self.get_cluster_cells(cluster)
+        unvisited = set(cells)
+        unvisited.discard(index)
+        neighbour_offsets = self.grid.neighbour_offsets
+        distances = {index: 0}
+        frontier = [index]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for current in frontier:
+                for offset in neighbour_offsets:
+                    neighbour = current + offset
+                    if neighbour in unvisited:
+                        unvisited.remove(neighbour)
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return distances
+
+    def get_cluster_graph(
+            self,
+            cluster: tuple[int, int]
+        ) -> dict[int, list[tuple[int, int]]]:
+        """
+        Gets the graph of the transition cells of a cluster,
+        creating it if it does not exist.
+
+        Returns:
+            Dict keyed by the indices of the cluster's transition cells.
+            The values are lists of (index, cost) pairs of the cells that
+            can be moved to from the cell, either inside the cluster or
+            across a border.
+        """
+        graph = self.cluster_graphs.get(cluster)
+        if graph is not None:
+            return graph
+        graph = {}
+        column, row = cluster
+        stride = self.grid.stride
+        for inside, outside in itertools.chain(
+            self.get_border_transitions(cluster, 1),
+            self.get_border_transitions(cluster, stride)
+        ):
+            graph.setdefault(inside, []).append((outside, 1))
+        for outside, inside in itertools.chain(
+            self.get_border_transitions((column - 1, row), 1)
+            if column > 0 else (),
+            self.get_border_transitions((column, row - 1), stride)
+            if row > 0 else ()
+        ):
+            graph.setdefault(inside, []).append((outside, 1))
+        cells = self.get_cluster_cells(cluster)
+        nodes = list(graph)
+        # Distances are symmetric, so each pair is searched only once
+        for i, node in enumerate(nodes[:-1]):
+            distances = self.get_cluster_distances(node, cluster, cells)
+            for other in nodes[i+1:]:
+                if other in distances:
+                    graph[node].append((other, distances[other]))
+                    graph[other].append((node, distances[other]))
+        self.cluster_graphs[cluster] = graph
+        return graph
+
+    def paths_for_rooms(self, room_dict: dict, edges: list[Edge]):
+        """
+        Carves a corridor between the rooms of each edge. Edges whose
+        rooms can not be connected are stored in failed_paths
+        with the reason.
+
+        Args:
+            room_dict: Rooms keyed by the coordinates of their center point.
+            edges: Edges between room center points.
+        """
+        for edge in edges:
+            start, end = self.open_room_entrances(room_dict, edge)
+            self.route_edge(edge, start, end)
+
+    def route_edge(
+            self,
+            edge: Edge,
+            start: tuple[int, int],
+            end: tuple[int, int]
+        ) -> None:
+        """
+        Carves the corridor of an edge between its entrance cells.
+        If there is no path, the edge is stored in failed_paths
+        with the reason instead.
+        """
+        try:
+            tiles = self.find_path_or_raise(start, end)
+        except PathNotFoundError as error:
+            self.failed_paths.append((edge, error.reason))
+            return
+        self.carve_corridor(tiles)
+
+    def find_path(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int],
+            max_steps: int = MAX_PATH_SEARCH_STEPS
+        ):
+        """
+        Finds a path between two cells like find_path_or_raise.
+
+        Returns:
+            List of cell coordinates from end to start,
+            or an empty list if no path was found.
+        """
+        try:
+            return self.find_path_or_raise(start, end, max_steps)
+        except PathNotFoundError:
+            return []
+
+    def find_path_or_raise(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int],
+            max_steps: int = MAX_PATH_SEARCH_STEPS
+        ) -> list[tuple[int, int]]:
+        """
+        Finds a path between two cells, moving only to cells allowed by
+        the clearance map. Nearby cells are first searched with a
+        windowed search and other cells with the cluster graphs.
+
+        Args:
+            start: Coordinates of the first cell of the path.
+            end: Coordinates of the last cell of the path.
+            max_steps: Number of cells a windowed search
+            expands before giving up.
+
+        Returns:
+            List of cell coordinates from end to start.
+
+        Raises:
+            PathNotFoundError: If there is no path between the cells.
+        """
+        grid = self.grid
+        if not (
+            grid.is_cell_in_bounds(start[0], start[1]) and
+            grid.is_cell_in_bounds(end[0], end[1])
+        ):
+            raise PathNotFoundError(PathFailure.OUT_OF_BOUNDS, start, end)
+        start_index = grid.get_index(start[0], start[1])
+        end_index = grid.get_index(end[0], end[1])
+        if start_index == end_index:
+            return [start]
+        clearance = self.clearance
+        if not clearance[end_index]:
+            raise PathNotFoundError(PathFailure.END_BLOCKED, start, end)
+        if not any(
+            clearance[start_index + offset]
+            for offset in grid.neighbour_offsets
+        ):
+            raise PathNotFoundError(PathFailure.START_BLOCKED, start, end)
+
+        if (
+            abs(start[0] - end[0]) + abs(start[1] - end[1]) <=
+            self.window_distance
+        ):
+            path = self.find_path_between_indices(
+                start_index,
+                end_index,
+                max_steps,
+                self.get_search_window(start, end)
+            )
+            if path:
+                return [grid.get_coordinates(index) for index in path]
+
+        nodes = self.find_abstract_path(start_index, end_index)
+        if nodes is None:
+            raise PathNotFoundError(PathFailure.NO_ROUTE, start, end)
+        path = [start_index]
+        for current, following in zip(nodes, nodes[1:]):
+            cluster = self.get_cluster(current)
+            following_cluster = self.get_cluster(following)
+            if current != start_index and cluster != following_cluster:
+                path.append(following)
+                continue
+            # Paths from the start cell can end in a neighbouring cluster
+            first_column, first_row, last_column, last_row = (
+                self.get_cluster_window(cluster)
+            )
+            other_window = self.get_cluster_window(following_cluster)
+            path.extend(reversed(self.find_path_between_indices(
+                current,
+                following,
+                window=(
+                    min(first_column, other_window[0]),
+                    min(first_row, other_window[1]),
+                    max(last_column, other_window[2]),
+                    max(last_row, other_window[3])
+                )
+            )[:-1]))
+        path.reverse()
+        return [grid.get_coordinates(index) for index in path]
+
+    def get_search_window(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int]
+        ) -> tuple[int, int, int, int]:
+        """
+        Gets the window of a windowed search between two cells,
+        the bounding box of the cells extended by window_margin.
+
+        Returns:
+            The first and last column and row of the window,
+            counted from the minimum corner of the grid.
+        """
+        margin = self.window_margin
+        return self.grid.clip_rect(
+            min(start[0], end[0]) - margin,
+            min(start[1], end[1]) - margin,
+            max(start[0], end[0]) + margin,
+            max(start[1], end[1]) + margin
+        )
+
+    def find_abstract_path(
+            self,
+            start_index: int,
+            end_index: int
+        ) -> list[int]:
+        """
+        Finds the shortest path from the start cell to the end cell
+        through the transition cells of the cluster graphs.
+
+        Returns:
+            List of the indices of the start cell, the transition cells
+            of the path and the end cell, or None if there is no path.
+        """
+        stride = self.grid.stride
+        clearance = self.clearance
+        end_cluster = self.get_cluster(end_index)
+        end_distances = self.get_cluster_distances(end_index, end_cluster)
+        # The start cell does not need to be clear, so paths from it can
+        # step into the clusters next to it
+        if clearance[start_index]:
+            sources = [(start_index, 0)]
+        else:
+            sources = [
+                (start_index + offset, 1)
+                for offset in self.grid.neighbour_offsets
+                if clearance[start_index + offset]
+            ]
+        start_edges = []
+        for source, source_cost in sources:
+            cluster = self.get_cluster(source)
+            graph = self.get_cluster_graph(cluster)
+            for node, distance in self.get_cluster_distances(
+                source,
+                cluster
+            ).items():
+                if node in graph or node == end_index:
+                    start_edges.append((node, distance + source_cost))
+        end_row, end_column = divmod(end_index, stride)
+
+        scores = {start_index: 0}
+        parents = {start_index: NO_CELL}
+        closed = set()
+        insertion_counter = itertools.count()
+        queue = [(0, -next(insertion_counter), start_index)]
+        while queue:
+            current = heapq.heappop(queue)[2]
+            if current in closed:
+                continue
+            if current == end_index:
+                nodes = []
+                while current != NO_CELL:
+                    nodes.append(current)
+                    current = parents[current]
+                nodes.reverse()
+                return nodes
+            closed.add(current)
+            cluster = self.get_cluster(current)
+            edges = self.get_cluster_graph(cluster).get(current, [])
+            if current == start_index:
+                edges = start_edges + edges
+            elif cluster == end_cluster and current in end_distances:
+                edges = edges + [(end_index, end_distances[current])]
+            current_score = scores[current]
+            for neighbour, cost in edges:
+                tentative_score = current_score + cost
+                if (
+                    neighbour not in closed and
+                    tentative_score <
+                    scores.get(neighbour, tentative_score + 1)
+                ):
+                    scores[neighbour] = tentative_score
+                    parents[neighbour] = current
+                    row, column = divmod(neighbour, stride)
+                    heapq.heappush(queue, (
+                        tentative_score +
+                        abs(column - end_column) + abs(row - end_row),
+                        -next(insertion_counter),
+                        neighbour
+                    ))
+        return None
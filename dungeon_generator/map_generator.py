@@ -6,7 +6,11 @@ The latter is used to generate a 2d map procedurally.
 import random
 from dataclasses import dataclass
 from dungeon_generator.geometry import Point, Edge
-from dungeon_generator.grid import Grid, AStar
+from dungeon_generator.grid import Grid
+from dungeon_generator.pathfinding import AStar
+from dungeon_generator.corridor_network import CorridorNetworkRouter
+from dungeon_generator.hierarchical_pathfinding import HierarchicalPathfinder
+from dungeon_generator.parallel_routing import ParallelCorridorRouter
 from dungeon_generator.undirected_graphing import RandomEdgeConnector, PrimMinSpanningTree, BowyerWatson
 from dungeon_generator.room_placer import RoomPlacer
 
@@ -34,20 +38,47 @@ class MapGenerator:
         center points.
         min_tree_generator: Generator Class responsible for crating
         a Minimum spanning tree from the Delaunay triangulation.
+        If it has a create_tree_from_points method, it is given the
+        points and the triangulator and creates both the
+        triangulation and the tree.
         room_connector: Class responsible for adding random edges
         to the MST.
+        jump_point_search: If True, corridors are routed
+        with Jump Point Search instead of A*. Requires
+        a room placer that creates flat grids.
+        shared_corridors: If True, corridors are routed with
+        CorridorNetworkRouter, which makes corridors share cells
+        instead of running next to each other. Jump Point Search
+        is not used with it. Requires a room placer that
+        creates flat grids.
+        hierarchical_pathfinding: If True, corridors are routed with
+        HierarchicalPathfinder, which searches long corridors in a graph
+        of grid clusters. Used only if shared_corridors is False,
+        and requires a room placer that creates flat grids.
+        corridor_workers: If more than 0, corridors are routed with
+        ParallelCorridorRouter using this many worker processes.
+        Used only if shared_corridors is False, and requires
+        a room placer that creates flat grids.
     """
     def __init__(
             self,
             room_placer,
             triangulator,
             min_tree_generator,
-            room_connector
+            room_connector,
+            jump_point_search: bool = False,
+            shared_corridors: bool = False,
+            hierarchical_pathfinding: bool = False,
+            corridor_workers: int = 0
         ) -> None:
         self.room_placer = room_placer
         self.triangulator = triangulator
         self.min_tree_generator = min_tree_generator
         self.room_connector = room_connector
+        self.jump_point_search = jump_point_search
+        self.shared_corridors = shared_corridors
+        self.hierarchical_pathfinding = hierarchical_pathfinding
+        self.corridor_workers = corridor_workers
         self.pather = None
 
     def generate(
@@ -58,8 +89,12 @@ class MapGenerator:
         ) -> Map:
         """
         Generates a map dataclass using given settings.
+        Each stage gets its own random number generator derived from
+        the seed, so maps can be generated in parallel threads and
+        the global state of the random module is not used.
 
         Args:
+            seed: Seed value for RNG.
             size: Size of the map to be generated.
             Currently the side length of square
             bounds that the map is generated in.
@@ -69,34 +104,63 @@ class MapGenerator:
         Returns:
             Map dataclass containing generated points, edges, MST, etc.
             See Map documentation for more details.
+
+        Raises:
+            ValueError: If the room placer creates a grid without a flat
+            cell array and jump_point_search, shared_corridors,
+            hierarchical_pathfinding or corridor_workers is used.
         """
-        random.seed(seed)
-        grid = Grid(size)
+        rng = random.Random(seed)
+        room_rng = random.Random(rng.getrandbits(64))
+        connector_rng = random.Random(rng.getrandbits(64))
+        grid = self.room_placer.create_grid(size)
         room_grid_tuple = self.room_placer.generate_rooms(
             amount,
             grid,
-            seed
+            seed,
+            rng=room_rng
         )
         rooms: dict = room_grid_tuple[1]
         new_grid = room_grid_tuple[0]
-        self.pather = AStar(new_grid)
+        if self.shared_corridors:
+            self.pather = CorridorNetworkRouter(new_grid)
+        elif self.corridor_workers > 0:
+            self.pather = ParallelCorridorRouter(
+                new_grid,
+                workers=self.corridor_workers
+            )
+        elif self.hierarchical_pathfinding:
+            self.pather = HierarchicalPathfinder(new_grid)
+        else:
+            self.pather = AStar(
+                new_grid,
+                jump_point_search=self.jump_point_search
+            )
         points = [room.center_point for room in rooms.values()]
-        triangulation_edges = self.triangulator.triangulate_points(
-            points
-        )
-        mst = self.min_tree_generator.create_tree_from_edges(
-            triangulation_edges
-        )
+        if hasattr(self.min_tree_generator, "create_tree_from_points"):
+            # Fused stage that triangulates and creates
+            # the tree without building duplicate edges
+            triangulation_edges, mst = (
+                self.min_tree_generator.create_tree_from_points(
+                    points,
+                    self.triangulator
+                )
+            )
+        else:
+            triangulation_edges = self.triangulator.triangulate_points(
+                points
+            )
+            mst = self.min_tree_generator.create_tree_from_edges(
+                triangulation_edges
+            )
         complete_map_diagram = self.room_connector.create_connections(
             seed,
             mst,
-            triangulation_edges
+            triangulation_edges,
+            rng=connector_rng
         )
         self.pather.paths_for_rooms(rooms, complete_map_diagram)
-        for y in range((-size // 2), (size // 2)):
-            for x in range((-size // 2), (size // 2)):
-                if grid.get_cell(x, y) == "empty2":
-                    grid.set_cell(x, y, "empty")
+        new_grid.replace("empty2", "empty")
         return Map(
             size,
             points,
@@ -0,0 +1,371 @@
+"""
+Module containing the ParallelCorridorRouter class.
+Used to route corridors in separate parts of a large map
+at the same time in a pool of worker processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from dungeon_generator.grid import Grid
+from dungeon_generator.pathfinding import (
+    PathfindingWorkspace,
+    PATH_CELL_VALUES,
+    MAX_PATH_SEARCH_STEPS,
+    find_index_path,
+    manhattan_heuristic
+)
+from dungeon_generator.geometry import Edge
+from dungeon_generator.hierarchical_pathfinding import (
+    HierarchicalPathfinder,
+    CLUSTER_SIZE
+)
+
+# Number of cells a search window is extended by when checking if two
+# searches overlap. Carving a corridor changes cells next to it and the
+# clearance of the cells next to those.
+WINDOW_PADDING = 2
+# Side length of the buckets used to find overlapping windows
+WINDOW_BUCKET_SIZE = 32
+
+# State of a worker process, set by initialize_worker
+worker_state = {}
+
+def initialize_worker(
+        memory_name: str,
+        cell_count: int,
+        neighbour_offsets: tuple[int, ...],
+        stride: int
+    ) -> None:
+    """
+    Attaches a worker process to the shared memory buffer
+    holding the clearance map and creates the buffers
+    used by the searches of the worker.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    worker_state["memory"] = memory
+    worker_state["clearance"] = memory.buf[:cell_count]
+    worker_state["neighbour_offsets"] = neighbour_offsets
+    worker_state["stride"] = stride
+    worker_state["workspace"] = PathfindingWorkspace(cell_count)
+
+def find_window_paths_in_worker(
+        searches: list[tuple[int, int, tuple[int, int, int, int]]]
+    ) -> list[list[int]]:
+    """
+    Finds paths for windowed searches in a worker process.
+
+    Args:
+        searches: List of (start index, end index, window) tuples.
+
+    Returns:
+        List with the path of each search as cell indices
+        from end to start, empty if no path was found.
+    """
+    return [
+        find_index_path(
+            worker_state["clearance"],
+            worker_state["neighbour_offsets"],
+            worker_state["stride"],
+            worker_state["workspace"],
+            start_index,
+            end_index,
+            MAX_PATH_SEARCH_STEPS,
+            window,
+            manhattan_heuristic
+        )
+        for start_index, end_index, window in searches
+    ]
+
+def windows_overlap(
+        first: tuple[int, int, int, int],
+        second: tuple[int, int, int, int]
+    ) -> bool:
+    """
+    Checks if two windows given as (first column, first row,
+    last column, last row) have common cells.
+    """
+    return (
+        first[0] <= second[2] and second[0] <= first[2] and
+        first[1] <= second[3] and second[1] <= first[3]
+    )
+
+class ParallelCorridorRouter(HierarchicalPathfinder):
+    """
+    Pathfinder that routes corridors far enough from each other
+    at the same time in a pool of worker processes.
+
+    The entrances of all rooms are opened first. The edges are then
+    routed in batches of edges whose search windows do not overlap each
+    other or the windows of earlier edges still waiting to be routed.
+    Before each batch, the clearance map is copied to a shared memory
+    buffer, the workers run windowed searches against this snapshot and
+    the main process carves the paths in the order of the edges. Edges
+    longer than window_distance are routed alone in the main process.
+    Edges whose path is not found inside the window are routed the same
+    way after their batch, since their corridor can leave the window
+    and change cells that the other paths of the batch were found on.
+
+    Routing an edge only depends on the edges before it that are near
+    it, and those are always carved first, so the carved corridors
+    do not depend on the number of workers.
+
+    Args:
+        grid: Grid in which corridors are carved.
+        allowed_path_cell_values: Cell values that paths can go through.
+        cluster_size: Side length of the clusters, see
+        HierarchicalPathfinder.
+        window_distance: Largest Manhattan distance between the start
+        and end cells for which a windowed search is used, see
+        HierarchicalPathfinder.
+        window_margin: Number of cells the window of a windowed search
+        extends past the start and end cells.
+        workers: Number of worker processes.
+        If not given, the number of CPUs is used.
+        min_batch_size: Smallest batch routed in the worker processes.
+        Smaller batches are routed in the main process.
+    """
+    def __init__(
+            self,
+            grid: Grid,
+            allowed_path_cell_values: tuple[str, ...] = PATH_CELL_VALUES,
+            cluster_size: int = CLUSTER_SIZE,
+            window_distance: int = 8 * CLUSTER_SIZE,
+            window_margin: int = 8,
+            workers: int = None,
+            min_batch_size: int = 8
+        ) -> None:
+        super().__init__(
+            grid,
+            allowed_path_cell_values,
+            cluster_size,
+            window_distance,
+            window_margin
+        )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.min_batch_size = min_batch_size
+        # Shared memory buffer and pool of the workers, see start_workers
+        self.memory: shared_memory.SharedMemory = None
+        self.executor: ProcessPoolExecutor = None
+
+    def paths_for_rooms(self, room_dict: dict, edges: list[Edge]):
+        """
+        Carves a corridor between the rooms of each edge, routing
+        corridors in separate parts of the grid at the same time.
+        Edges whose rooms can not be connected are stored
+        in failed_paths with the reason.
+
+        Args:
+            room_dict: Rooms keyed by the coordinates of their center point.
+            edges: Edges between room center points.
+        """
+        routes = []
+        for edge in edges:
+            start, end = self.open_room_entrances(room_dict, edge)
+            window = self.get_padded_window(start, end)
+            routes.append((edge, start, end, window))
+        try:
+            while routes:
+                batch, routes = self.split_batch(routes)
+                routes = self.route_batch(batch) + routes
+        finally:
+            self.stop_workers()
+
+    def route_batch(self, batch: list) -> list:
+        """
+        Routes a batch returned by split_batch. The windowed searches of
+        the batch are run against the clearance map from before the
+        batch and their paths are carved in the order of the routes.
+        A route without a window is routed with route_edge.
+
+        A route whose path is not found inside its window could go
+        anywhere in the grid, so it is not routed in the batch.
+
+        Args:
+            batch: List of (edge, start, end, padded window) tuples.
+
+        Returns:
+            List of the routes whose path was not found inside the
+            window, with the window set to None so that split_batch
+            routes each of them alone.
+        """
+        searches = [
+            (
+                self.grid.get_index(start[0], start[1]),
+                self.grid.get_index(end[0], end[1]),
+                self.get_search_window(start, end)
+            )
+            for _, start, end, window in batch
+            if window is not None
+        ]
+        if self.workers > 1 and len(searches) >= self.min_batch_size:
+            if self.executor is None:
+                self.start_workers()
+            self.memory.buf[:len(self.clearance)] = self.clearance
+            paths = self.find_window_paths_in_workers(searches)
+        else:
+            paths = [
+                self.find_path_between_indices(
+                    start_index,
+                    end_index,
+                    window=window
+                )
+                for start_index, end_index, window in searches
+            ]
+        paths.reverse()
+        deferred_routes = []
+        for edge, start, end, window in batch:
+            if window is None:
+                self.route_edge(edge, start, end)
+                continue
+            path = paths.pop()
+            if path:
+                self.carve_corridor([
+                    self.grid.get_coordinates(index)
+                    for index in path
+                ])
+            else:
+                deferred_routes.append((edge, start, end, None))
+        return deferred_routes
+
+    def get_padded_window(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int]
+        ) -> tuple[int, int, int, int]:
+        """
+        Gets the cells that routing a corridor between two cells
+        with a windowed search can read or change.
+
+        Returns:
+            The search window extended by WINDOW_PADDING, or None if
+            the cells are too far apart for a windowed search.
+        """
+        if (
+            abs(start[0] - end[0]) + abs(start[1] - end[1]) >
+            self.window_distance
+        ):
+            return None
+        first_column, first_row, last_column, last_row = (
+            self.get_search_window(start, end)
+        )
+        return (
+            first_column - WINDOW_PADDING,
+            first_row - WINDOW_PADDING,
+            last_column + WINDOW_PADDING,
+            last_row + WINDOW_PADDING
+        )
+
+    def split_batch(self, routes: list) -> tuple[list, list]:
+        """
+        Splits the routes waiting to be routed into a batch that can be
+        routed at the same time and the routes left for later batches.
+        A route is added to the batch if its window does not overlap the
+        windows of the routes before it. Routes without a window can
+        go anywhere in the grid, so they are routed alone.
+
+        Args:
+            routes: List of (edge, start, end, padded window) tuples.
+
+        Returns:
+            Tuple with the batch and the routes left out of it,
+            both in the order of the given routes.
+        """
+        batch = []
+        rest = []
+        # Windows of earlier routes, keyed by the buckets they cover
+        buckets = {}
+        for i, route in enumerate(routes):
+            window = route[3]
+            if window is None:
+                if not batch:
+                    batch.append(route)
+                    rest.extend(routes[i+1:])
+                else:
+                    rest.extend(routes[i:])
+                break
+            keys = [
+                (column, row)
+                for row in range(
+                    window[1] // WINDOW_BUCKET_SIZE,
+                    window[3] // WINDOW_BUCKET_SIZE + 1
+                )
+                for column in range(
+                    window[0] // WINDOW_BUCKET_SIZE,
+                    window[2] // WINDOW_BUCKET_SIZE + 1
+                )
+            ]
+            if any(
+                windows_overlap(window, other)
+                for key in keys
+                for other in buckets.get(key, ())
+            ):
+                rest.append(route)
+            else:
+                batch.append(route)
+            for key in keys:
+                buckets.setdefault(key, []).append(window)
+        return batch, rest
+
+    def start_workers(self) -> None:
+        """
+        Creates the shared memory buffer for the clearance map
+        and the pool of worker processes.
+        """
+        memory = shared_memory.SharedMemory(
+            create=True,
+            size=len(self.clearance)
+        )
+        try:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=initialize_worker,
+                initargs=(
+                    memory.name,
+                    len(self.clearance),
+                    self.grid.neighbour_offsets,
+                    self.grid.stride
+                )
+            )
+        except Exception:
+            memory.close()
+            memory.unlink()
+            raise
+        self.memory = memory
+
+    def stop_workers(self) -> None:
+        """
+        Shuts down the pool of worker processes
+        and frees the shared memory buffer.
+        """
+        if self.executor is None:
+            return
+        self.executor.shutdown()
+        self.memory.close()
+        self.memory.unlink()
+        self.executor = None
+        self.memory = None
+
+    def find_window_paths_in_workers(
+            self,
+            searches: list[tuple[int, int, tuple[int, int, int, int]]]
+        ) -> list[list[int]]:
+        """
+        Splits windowed searches between the worker processes.
+
+        Returns:
+            List with the path of each search, in the same order.
+        """
+        chunk_size = -(-len(searches) // self.workers)
+        paths = []
+        for chunk_paths in self.executor.map(
+            find_window_paths_in_worker,
+            [
+                searches[i:i+chunk_size]
+                for i in range(0, len(searches), chunk_size)
+            ]
+        ):
+            paths.extend(chunk_paths)
+        return paths
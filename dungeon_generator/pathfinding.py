@@ -0,0 +1,900 @@
+"""
+Module containing the AStar class and the A* search it uses.
+Used to carve corridors between rooms in a grid.
+"""
+import math
+import heapq
+import itertools
+from array import array
+from pygame import Vector2
+from dungeon_generator.geometry import Edge
+from dungeon_generator.grid import (
+    Grid,
+    Tile,
+    Direction,
+    NEIGHBOUR_DIRECTIONS,
+    FULL_NEIGHBOUR_DIRECTIONS
+)
+
+MAX_PATH_SEARCH_STEPS = 100000
+UNREACHED_SCORE = 2**62
+NO_CELL = -1
+# Cell values that corridors can go through by default
+PATH_CELL_VALUES = ("empty", "corridor_floor", "corridor_wall")
+MAX_SEARCH_GENERATION = 2**32 - 1
+# Cells added around the start and end cells
+# for the first search window on a ChunkedGrid
+WINDOW_SEARCH_MARGIN = 32
+
+class PathfindingWorkspace:
+    """
+    Buffers used by A* searches on a grid, allocated once and reused by
+    every search. Instead of resetting the buffers for each search, the
+    cells touched by a search are stamped with its generation number,
+    and values with an older stamp are treated as unset.
+
+    Args:
+        cell_count: Number of cells in the grid's cell array.
+    """
+    def __init__(self, cell_count: int) -> None:
+        self.cell_count = cell_count
+        self.scores = array("q", (UNREACHED_SCORE,)) * cell_count
+        self.parents = array("q", (NO_CELL,)) * cell_count
+        # Generation of the search that last set the score of each cell
+        self.score_generations = array("I", (0,)) * cell_count
+        # Generation of the search that last expanded each cell
+        self.closed_generations = array("I", (0,)) * cell_count
+        self.generation = 0
+
+    def start_search(self) -> int:
+        """
+        Starts a new search, making the values of earlier searches unset.
+
+        Returns:
+            Generation number of the new search.
+        """
+        self.generation += 1
+        if self.generation > MAX_SEARCH_GENERATION:
+            self.score_generations = array("I", (0,)) * self.cell_count
+            self.closed_generations = array("I", (0,)) * self.cell_count
+            self.generation = 1
+        return self.generation
+
+
+def euclidean_heuristic(column_distance: int, row_distance: int) -> int:
+    """
+    Estimates the length of a path between cells with the straight line
+    distance between them, rounded down.
+    """
+    return int(math.hypot(column_distance, row_distance))
+
+def manhattan_heuristic(column_distance: int, row_distance: int) -> int:
+    """
+    Estimates the length of a path between cells with the sum of
+    the column and row distances, the length of the shortest path
+    when nothing blocks it.
+    """
+    return abs(column_distance) + abs(row_distance)
+
+def create_clearance(
+        cells: bytearray,
+        walkable_tiles: bytearray,
+        clear_tiles: bytearray,
+        full_neighbour_offsets: tuple[int, ...]
+    ) -> bytearray:
+    """
+    Creates a clearance map of a cell array. The flags of all cells are
+    stored in a single integer with a byte for each cell, so shifting the
+    integer by a neighbour offset lines each cell up with its neighbour.
+
+    Args:
+        cells: Tile codes of the cells.
+        walkable_tiles: Flags indexed by tile code, 1 if a cell
+        with the code can be moved into.
+        clear_tiles: Flags indexed by tile code, 1 if a cell
+        with the code does not block the cells next to it.
+        full_neighbour_offsets: Offsets from a cell index
+        to the indices of its 8 neighbours.
+
+    Returns:
+        Bytearray with a byte for each cell in the cell array,
+        1 if the cell can be moved into, otherwise 0.
+    """
+    clearance = int.from_bytes(cells.translate(walkable_tiles), "little")
+    clear = int.from_bytes(cells.translate(clear_tiles), "little")
+    for offset in full_neighbour_offsets:
+        if offset > 0:
+            clearance &= clear >> (8 * offset)
+        else:
+            clearance &= clear << (-8 * offset)
+    return bytearray(clearance.to_bytes(len(cells), "little"))
+
+def find_index_path(
+        clearance,
+        neighbour_offsets: tuple[int, ...],
+        stride: int,
+        workspace: PathfindingWorkspace,
+        start_index: int,
+        end_index: int,
+        max_steps: int = MAX_PATH_SEARCH_STEPS,
+        window: tuple[int, int, int, int] = None,
+        heuristic = euclidean_heuristic,
+        cells: bytearray = None,
+        step_costs: bytearray = None
+    ) -> list[int]:
+    """
+    Finds a path between two cells with A*, moving only to cells allowed
+    by a clearance map. The open set is a binary heap where ties are
+    broken by expanding the most recently added cell first. Scores,
+    parents and expanded cells are stored in the buffers of the
+    workspace. Only cell indices are used, so the search can be run in
+    processes that do not have the grid.
+
+    Args:
+        clearance: Clearance map of the grid, see AStar.
+        neighbour_offsets: Offsets from a cell index to the indices
+        of its north, east, south and west neighbours.
+        stride: Length of a row in the grid's cell array.
+        workspace: Buffers used by the search.
+        start_index: Index of the first cell of the path.
+        end_index: Index of the last cell of the path.
+        max_steps: Number of cells expanded before giving up.
+        window: If given, the first and last column and row, counted
+        from the minimum corner of the grid, of a rectangular window
+        that the path does not leave.
+        heuristic: Function estimating the cost of a path from the
+        column and row distances between its cells. The path is the
+        cheapest one if the estimate is never too large.
+        cells: The grid's cell array, only needed with step_costs.
+        step_costs: If given, the cost of moving into a cell indexed
+        by its tile code. Otherwise every move costs 1.
+
+    Returns:
+        List of cell indices from end to start,
+        or an empty list if no path was found.
+    """
+    # https://en.wikipedia.org/wiki/A*_search_algorithm#Pseudocode
+    first_column, first_row, last_column, last_row = window or (0, 0, 0, 0)
+    end_row, end_column = divmod(end_index, stride)
+    start_row, start_column = divmod(start_index, stride)
+    generation = workspace.start_search()
+    cheapest_path_score = workspace.scores
+    previous_cheapest_node = workspace.parents
+    score_generations = workspace.score_generations
+    closed_generations = workspace.closed_generations
+    insertion_counter = itertools.count()
+
+    cheapest_path_score[start_index] = 0
+    previous_cheapest_node[start_index] = NO_CELL
+    score_generations[start_index] = generation
+    queue = [(
+        heuristic(start_column - end_column, start_row - end_row),
+        -next(insertion_counter),
+        start_index
+    )]
+    steps = 0
+    while queue and steps < max_steps:
+        current = heapq.heappop(queue)[2]
+        if closed_generations[current] == generation:
+            continue
+        if current == end_index:
+            path = []
+            while current != NO_CELL:
+                path.append(current)
+                current = previous_cheapest_node[current]
+            return path
+        closed_generations[current] = generation
+        steps += 1
+        current_score = cheapest_path_score[current]
+        tentative_score = current_score + 1
+        for offset in neighbour_offsets:
+            neighbour = current + offset
+            if not clearance[neighbour] or (
+                closed_generations[neighbour] == generation
+            ):
+                continue
+            row, column = divmod(neighbour, stride)
+            # Columns and rows of indices are offset by the border ring
+            if window is not None and not (
+                first_column < column <= last_column + 1 and
+                first_row < row <= last_row + 1
+            ):
+                continue
+            if step_costs is not None:
+                tentative_score = current_score + step_costs[cells[neighbour]]
+            if (
+                score_generations[neighbour] != generation or
+                tentative_score < cheapest_path_score[neighbour]
+            ):
+                score_generations[neighbour] = generation
+                cheapest_path_score[neighbour] = tentative_score
+                previous_cheapest_node[neighbour] = current
+                heapq.heappush(queue, (
+                    tentative_score +
+                    heuristic(column - end_column, row - end_row),
+                    -next(insertion_counter),
+                    neighbour
+                ))
+    return []
+
+
+class AStar:
+    """
+    A* pathfinder used to carve corridors between rooms.
+
+    A clearance map with a byte for each cell of the grid tells whether
+    the cell can be moved into, which requires the cell and its 8
+    neighbours to have allowed values. The map is created when the
+    pathfinder is created and updated when cells are set with set_cell,
+    so the grid should not be changed in other ways while it is used.
+
+    If jump_point_search is True, paths are found with Jump Point Search,
+    which finds paths of the same length while expanding fewer cells.
+    It is only supported on grids with a flat cell array.
+
+    On grids without a flat cell array, such as ChunkedGrid, there is
+    no clearance map of the whole grid. Each search copies a window of
+    the grid and creates a clearance map for it, see
+    find_path_in_windows.
+    """
+    def __init__(
+            self,
+            grid: Grid,
+            allowed_path_cell_values: tuple[str, ...] = PATH_CELL_VALUES,
+            jump_point_search: bool = False
+        ) -> None:
+        if jump_point_search and grid.cells is None:
+            raise ValueError(
+                "Jump Point Search requires a grid with a flat cell array."
+            )
+        self.grid = grid
+        self.allowed_path_cell_values = allowed_path_cell_values
+        self.jump_point_search = jump_point_search
+        # Used by find_path_between_indices, see find_index_path
+        self.heuristic = euclidean_heuristic
+        self.step_costs = None
+        # Flags indexed by tile code. Cells outside of the grid can not
+        # be moved into, but they do not block the cells next to them.
+        self.walkable_tiles = bytearray(256)
+        self.clear_tiles = bytearray(256)
+        for cell_value in allowed_path_cell_values:
+            code = grid.get_tile_code(cell_value)
+            self.walkable_tiles[code] = 1
+            self.clear_tiles[code] = 1
+        self.clear_tiles[Tile.BORDER] = 1
+        # Chunked grids have no flat cell array for the clearance map
+        self.clearance = None
+        self.workspace = None
+        if grid.cells is not None:
+            self.clearance = self.create_clearance_map()
+            self.workspace = PathfindingWorkspace(len(grid.cells))
+
+    def create_clearance_map(self) -> bytearray:
+        """
+        Creates the clearance map of the whole grid, see create_clearance.
+
+        Returns:
+            Bytearray with a byte for each cell in the cell array,
+            1 if the cell can be moved into, otherwise 0.
+        """
+        return create_clearance(
+            self.grid.cells,
+            self.walkable_tiles,
+            self.clear_tiles,
+            self.grid.full_neighbour_offsets
+        )
+
+    def update_clearance(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """
+        Updates the clearance map for the cells in a rectangle
+        from (x0, y0) to (x1, y1), including the corners.
+        """
+        if self.clearance is None:
+            return
+        grid = self.grid
+        cells = grid.cells
+        first_column, first_row, last_column, last_row = grid.clip_rect(
+            x0, y0, x1, y1
+        )
+        for row in range(first_row + 1, last_row + 2):
+            for index in range(
+                row * grid.stride + first_column + 1,
+                row * grid.stride + last_column + 2
+            ):
+                clear = self.walkable_tiles[cells[index]]
+                if clear:
+                    for offset in grid.full_neighbour_offsets:
+                        if not self.clear_tiles[cells[index + offset]]:
+                            clear = 0
+                            break
+                self.clearance[index] = clear
+
+    def changes_clearance(self, old_code: int, new_code: int) -> bool:
+        """
+        Checks if changing a cell from one tile code to another
+        can change the clearance map.
+        """
+        return (
+            self.walkable_tiles[old_code] != self.walkable_tiles[new_code] or
+            self.clear_tiles[old_code] != self.clear_tiles[new_code]
+        )
+
+    def set_cell(self, x: int, y: int, cell_value) -> bool:
+        """
+        Sets the value of a cell in the grid and
+        updates the clearance map around it.
+
+        Returns:
+            False if the cell is not inside of the grid bounds,
+            otherwise True.
+        """
+        old_code = self.grid.get_tile(x, y)
+        if not self.grid.set_cell(x, y, cell_value):
+            return False
+        if self.changes_clearance(old_code, self.grid.get_tile(x, y)):
+            self.update_clearance(x - 1, y - 1, x + 1, y + 1)
+        return True
+
+    def paths_for_rooms(self, room_dict: dict, edges: list[Edge]):
+        """
+        Carves a corridor between the rooms of each edge.
+
+        Args:
+            room_dict: Rooms keyed by the coordinates of their center point.
+            edges: Edges between room center points.
+        """
+        for edge in edges:
+            start, end = self.open_room_entrances(room_dict, edge)
+            self.carve_corridor(self.find_path(start, end))
+
+    def open_room_entrances(
+            self,
+            room_dict: dict,
+            edge: Edge
+        ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Opens the entrances of both rooms of an edge on the sides
+        facing each other.
+
+        Args:
+            room_dict: Rooms keyed by the coordinates of their center point.
+            edge: Edge between the center points of the rooms.
+
+        Returns:
+            Coordinates of the cells outside of the entrances
+            where the corridor should start and end.
+        """
+        point_tuple0 = (edge.vertices[0].x, edge.vertices[0].y)
+        point_tuple1 = (edge.vertices[1].x, edge.vertices[1].y)
+        room0 = room_dict[point_tuple0]
+        room1 = room_dict[point_tuple1]
+        start = room0.north_entrance
+        end = room1.north_entrance
+        dir = self.get_direction_from_edge(edge)
+        if dir == Direction.NORTH:
+            start = (room0.north_entrance[0], room0.north_entrance[1] + 2)
+            end = (room1.south_entrance[0], room1.south_entrance[1] - 2)
+            self.set_cell(
+                room0.north_entrance[0],
+                room0.north_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.south_entrance[0],
+                room1.south_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room0.north_entrance[0],
+                room0.north_entrance[1]+1,
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.south_entrance[0],
+                room1.south_entrance[1]-1,
+                "corridor_floor"
+            )
+        if dir == Direction.EAST:
+            start = (room0.east_entrance[0] + 2, room0.east_entrance[1])
+            end = (room1.west_entrance[0] - 2, room1.west_entrance[1])
+            self.set_cell(
+                room0.east_entrance[0],
+                room0.east_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.west_entrance[0],
+                room1.west_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room0.east_entrance[0]+1,
+                room0.east_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.west_entrance[0]-1,
+                room1.west_entrance[1],
+                "corridor_floor"
+            )
+        if dir == Direction.WEST:
+            start = (room0.west_entrance[0] - 2, room0.west_entrance[1])
+            end = (room1.east_entrance[0] + 2, room1.east_entrance[1])
+            self.set_cell(
+                room0.west_entrance[0],
+                room0.west_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.east_entrance[0],
+                room1.east_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room0.west_entrance[0]-1,
+                room0.west_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.east_entrance[0]+1,
+                room1.east_entrance[1],
+                "corridor_floor"
+            )
+        elif dir == Direction.SOUTH:
+            start = (room0.south_entrance[0], room0.south_entrance[1] - 2)
+            end = (room1.north_entrance[0], room1.north_entrance[1] + 2)
+            self.set_cell(
+                room0.south_entrance[0],
+                room0.south_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.north_entrance[0],
+                room1.north_entrance[1],
+                "corridor_floor"
+            )
+            self.set_cell(
+                room0.south_entrance[0],
+                room0.south_entrance[1]-1,
+                "corridor_floor"
+            )
+            self.set_cell(
+                room1.north_entrance[0],
+                room1.north_entrance[1]+1,
+                "corridor_floor"
+            )
+        self.set_cell(start[0], start[1], "corridor_floor")
+        self.set_cell(end[0], end[1], "corridor_floor")
+        return (start[0], start[1]), (end[0], end[1])
+
+    def carve_corridor(self, tiles: list[tuple[int, int]]) -> None:
+        """
+        Sets the cells of a path to corridor floor and
+        the empty cells around them to corridor wall.
+
+        Args:
+            tiles: Coordinates of the cells of the path.
+        """
+        cells = self.grid.cells
+        walls_change_clearance = self.changes_clearance(
+            Tile.EMPTY,
+            Tile.CORRIDOR_WALL
+        )
+        for tile in tiles:
+            self.set_cell(tile[0], tile[1], "corridor_floor")
+            if cells is None:
+                for dx, dy in FULL_NEIGHBOUR_DIRECTIONS:
+                    if self.grid.get_tile(tile[0] + dx, tile[1] + dy) == Tile.EMPTY:
+                        self.grid.set_tile(
+                            tile[0] + dx,
+                            tile[1] + dy,
+                            Tile.CORRIDOR_WALL
+                        )
+                continue
+            index = self.grid.get_index(tile[0], tile[1])
+            for offset in self.grid.full_neighbour_offsets:
+                if cells[index + offset] == Tile.EMPTY:
+                    cells[index + offset] = Tile.CORRIDOR_WALL
+            if walls_change_clearance:
+                self.update_clearance(
+                    tile[0] - 2,
+                    tile[1] - 2,
+                    tile[0] + 2,
+                    tile[1] + 2
+                )
+
+    def get_direction_from_edge(self, edge: Edge):
+        edge_dir_vector = Vector2(
+            edge.vertices[1].x - edge.vertices[0].x,
+            edge.vertices[1].y - edge.vertices[0].y
+        )
+        angle = edge_dir_vector.as_polar()[1]
+        if 45 <= angle <= 135:
+            return Direction.NORTH
+        elif 135 < angle or -135 > angle:
+            return Direction.WEST
+        elif 45 > angle or -45 < angle:
+            return Direction.EAST
+        elif -45 >= angle >= -135:
+            return Direction.SOUTH
+        else:
+            return Direction.NORTH
+
+    def reconstruct_path(self, last: tuple[int, int], previous_nodes: dict):
+        path = []
+        prev = last
+        for _ in range(len(previous_nodes.keys())):
+            path.append(prev)
+            prev = previous_nodes[prev]
+            if prev is None:
+                break
+        return path
+
+    def find_path(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int],
+            max_steps: int = MAX_PATH_SEARCH_STEPS
+        ):
+        """
+        Finds the shortest path between two cells, moving only to cells
+        allowed by the clearance map. See find_index_path.
+
+        Args:
+            start: Coordinates of the first cell of the path.
+            end: Coordinates of the last cell of the path.
+            max_steps: Number of cells expanded before giving up.
+
+        Returns:
+            List of cell coordinates from end to start,
+            or an empty list if no path was found.
+        """
+        grid = self.grid
+        if not (
+            grid.is_cell_in_bounds(start[0], start[1]) and
+            grid.is_cell_in_bounds(end[0], end[1])
+        ):
+            return []
+        if self.clearance is None:
+            return self.find_path_in_windows(start, end, max_steps)
+        if self.jump_point_search:
+            return self.find_jump_point_path(start, end, max_steps)
+        path = self.find_path_between_indices(
+            grid.get_index(start[0], start[1]),
+            grid.get_index(end[0], end[1]),
+            max_steps
+        )
+        return [grid.get_coordinates(index) for index in path]
+
+    def find_path_between_indices(
+            self,
+            start_index: int,
+            end_index: int,
+            max_steps: int = MAX_PATH_SEARCH_STEPS,
+            window: tuple[int, int, int, int] = None
+        ) -> list[int]:
+        """
+        Finds a path between two cells given by their index in the
+        grid's cell array with find_index_path, using the heuristic
+        and step costs of the pathfinder.
+
+        Args:
+            start_index: Index of the first cell of the path.
+            end_index: Index of the last cell of the path.
+            max_steps: Number of cells expanded before giving up.
+            window: If given, the first and last column and row of
+            a window of the grid that the path does not leave.
+
+        Returns:
+            List of cell indices from end to start,
+            or an empty list if no path was found.
+        """
+        return find_index_path(
+            self.clearance,
+            self.grid.neighbour_offsets,
+            self.grid.stride,
+            self.workspace,
+            start_index,
+            end_index,
+            max_steps,
+            window,
+            self.heuristic,
+            self.grid.cells,
+            self.step_costs
+        )
+
+    def find_jump_point_path(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int],
+            max_steps: int = MAX_PATH_SEARCH_STEPS
+        ):
+        """
+        Finds the shortest path between two cells with Jump Point Search
+        for 4-connected grids. Of paths of equal length, only ones where
+        vertical moves come before horizontal ones are searched, so the
+        search jumps along straight lines and only stops at cells where
+        the direction might have to change. Both cells are expected to
+        be inside of the grid bounds.
+
+        Args:
+            start: Coordinates of the first cell of the path.
+            end: Coordinates of the last cell of the path.
+            max_steps: Number of jump points expanded before giving up.
+
+        Returns:
+            List of cell coordinates from end to start,
+            or an empty list if no path was found.
+        """
+        grid = self.grid
+        clearance = self.clearance
+        stride = grid.stride
+        start_index = grid.get_index(start[0], start[1])
+        end_index = grid.get_index(end[0], end[1])
+        end_row, end_column = divmod(end_index, stride)
+        workspace = self.workspace
+        generation = workspace.start_search()
+        cheapest_path_score = workspace.scores
+        previous_cheapest_node = workspace.parents
+        score_generations = workspace.score_generations
+        closed_generations = workspace.closed_generations
+        insertion_counter = itertools.count()
+
+        cheapest_path_score[start_index] = 0
+        previous_cheapest_node[start_index] = NO_CELL
+        score_generations[start_index] = generation
+        # Entries are (estimate, insertion number, cell, direction offset)
+        queue = [(0, 0, start_index, 0)]
+        steps = 0
+        while queue and steps < max_steps:
+            _, _, current, direction = heapq.heappop(queue)
+            if closed_generations[current] == generation:
+                continue
+            if current == end_index:
+                return self.reconstruct_jump_point_path(current)
+            closed_generations[current] = generation
+            steps += 1
+            if direction == 0:
+                directions = grid.neighbour_offsets
+            elif direction in (1, -1):
+                directions = [direction] + [
+                    vertical for vertical in (stride, -stride)
+                    if clearance[current + vertical] and
+                    not clearance[current - direction + vertical]
+                ]
+            else:
+                directions = (direction, 1, -1)
+            for offset in directions:
+                if offset in (1, -1):
+                    jump_point = self.jump_horizontally(current, offset, end_index)
+                else:
+                    jump_point = self.jump_vertically(current, offset, end_index)
+                if (
+                    jump_point == NO_CELL or
+                    closed_generations[jump_point] == generation
+                ):
+                    continue
+                tentative_score = (
+                    cheapest_path_score[current] +
+                    abs(jump_point - current) // abs(offset)
+                )
+                if (
+                    score_generations[jump_point] != generation or
+                    tentative_score < cheapest_path_score[jump_point]
+                ):
+                    score_generations[jump_point] = generation
+                    cheapest_path_score[jump_point] = tentative_score
+                    previous_cheapest_node[jump_point] = current
+                    row, column = divmod(jump_point, stride)
+                    heapq.heappush(queue, (
+                        tentative_score + abs(column - end_column) +
+                        abs(row - end_row),
+                        -next(insertion_counter),
+                        jump_point,
+                        offset
+                    ))
+        return []
+
+    def jump_horizontally(self, index: int, offset: int, end_index: int) -> int:
+        """
+        Moves from a cell in a horizontal direction until reaching
+        the end cell or a cell where moving vertically becomes possible
+        after being blocked on the previous cell.
+
+        Returns:
+            Index of the cell where the jump stopped,
+            or NO_CELL if a blocked cell was reached first.
+        """
+        clearance = self.clearance
+        up = self.grid.stride
+        while True:
+            index += offset
+            if not clearance[index]:
+                return NO_CELL
+            if index == end_index:
+                return index
+            if (
+                (clearance[index + up] and not clearance[index - offset + up]) or
+                (clearance[index - up] and not clearance[index - offset - up])
+            ):
+                return index
+
+    def jump_vertically(self, index: int, offset: int, end_index: int) -> int:
+        """
+        Moves from a cell in a vertical direction until reaching the end
+        cell or a cell from which a horizontal jump finds a jump point.
+
+        Returns:
+            Index of the cell where the jump stopped,
+            or NO_CELL if a blocked cell was reached first.
+        """
+        clearance = self.clearance
+        while True:
+            index += offset
+            if not clearance[index]:
+                return NO_CELL
+            if (
+                index == end_index or
+                self.jump_horizontally(index, 1, end_index) != NO_CELL or
+                self.jump_horizontally(index, -1, end_index) != NO_CELL
+            ):
+                return index
+
+    def reconstruct_jump_point_path(self, last: int) -> list[tuple[int, int]]:
+        """
+        Creates the path to a cell found with Jump Point Search,
+        filling in the cells between consecutive jump points.
+
+        Returns:
+            List of cell coordinates from the cell to the start.
+        """
+        grid = self.grid
+        parents = self.workspace.parents
+        path = [grid.get_coordinates(last)]
+        current = last
+        while parents[current] != NO_CELL:
+            parent = parents[current]
+            if abs(parent - current) < grid.stride:
+                step = 1 if parent > current else -1
+            else:
+                step = grid.stride if parent > current else -grid.stride
+            while current != parent:
+                current += step
+                path.append(grid.get_coordinates(current))
+        return path
+
+    def find_path_in_windows(
+            self,
+            start: tuple[int, int],
+            end: tuple[int, int],
+            max_steps: int = MAX_PATH_SEARCH_STEPS
+        ):
+        """
+        Finds the shortest path between two cells like find_path, for
+        grids without a flat cell array such as ChunkedGrid. The cells
+        of a window around both cells are copied into a flat array with
+        a ring of extra cells, and the path is searched in the window
+        with find_index_path using a clearance map of the copy.
+
+        A path that leaves the window is at least 2 * (margin + 1)
+        moves longer than the Manhattan distance between the cells,
+        so a path found in the window is the shortest one unless it is
+        longer than that. Otherwise the search is repeated in a window
+        with 4 times the margin, until the window covers the grid or
+        the search gives up after expanding max_steps cells.
+
+        Args:
+            start: Coordinates of the first cell of the path.
+            end: Coordinates of the last cell of the path.
+            max_steps: Number of cells expanded in each window
+            before giving up.
+
+        Returns:
+            List of cell coordinates from end to start,
+            or an empty list if no path was found.
+        """
+        grid = self.grid
+        distance = abs(start[0] - end[0]) + abs(start[1] - end[1])
+        margin = WINDOW_SEARCH_MARGIN
+        while True:
+            first_column, first_row, last_column, last_row = grid.clip_rect(
+                min(start[0], end[0]) - margin,
+                min(start[1], end[1]) - margin,
+                max(start[0], end[0]) + margin,
+                max(start[1], end[1]) + margin
+            )
+            # Coordinates of the first cell in the copy of the window
+            x0 = grid.min_x + first_column - 1
+            y0 = grid.min_y + first_row - 1
+            cells = grid.get_rect_tiles(
+                x0,
+                y0,
+                grid.min_x + last_column + 1,
+                grid.min_y + last_row + 1
+            )
+            stride = last_column - first_column + 3
+            clearance = create_clearance(
+                cells,
+                self.walkable_tiles,
+                self.clear_tiles,
+                [dy * stride + dx for dx, dy in FULL_NEIGHBOUR_DIRECTIONS]
+            )
+            # The ring of extra cells has neighbours outside of the copy
+            zero_column = bytes(len(range(0, len(cells), stride)))
+            clearance[0::stride] = zero_column
+            clearance[stride - 1::stride] = zero_column
+            clearance[:stride] = bytes(stride)
+            clearance[-stride:] = bytes(stride)
+            workspace = PathfindingWorkspace(len(cells))
+            path = find_index_path(
+                clearance,
+                [dy * stride + dx for dx, dy in NEIGHBOUR_DIRECTIONS],
+                stride,
+                workspace,
+                (start[1] - y0) * stride + start[0] - x0,
+                (end[1] - y0) * stride + end[0] - x0,
+                max_steps,
+                heuristic=self.heuristic
+            )
+            covers_grid = (
+                first_column == 0 and first_row == 0 and
+                last_column == grid.width - 1 and last_row == grid.height - 1
+            )
+            if path:
+                finished = len(path) - 1 <= distance + 2 * (margin + 1)
+            else:
+                # A larger window does not help if the search gave up
+                finished = workspace.closed_generations.count(
+                    workspace.generation
+                ) >= max_steps
+            if covers_grid or finished:
+                return [
+                    (x0 + index % stride, y0 + index // stride)
+                    for index in path
+                ]
+            margin *= 4
+
+    def calculate_heuristic_score(self, cell: tuple[int, int], goal: tuple[int, int]) -> int:
+        return int(math.dist(cell, goal))
+
+    def get_valid_neighbors(self, cell: tuple[int, int]):
+        """
+        Gets the north, east, south and west neighbours of a cell that
+        can be moved into. A neighbour is valid if it and all of its
+        8 neighbours have allowed values.
+        """
+        grid = self.grid
+        if not grid.is_cell_in_bounds(cell[0], cell[1]):
+            return []
+        clearance = self.clearance
+        if clearance is None:
+            return self.get_valid_neighbors_by_coordinates(cell)
+        index = grid.get_index(cell[0], cell[1])
+        valid_neighbours = []
+        for offset, (dx, dy) in zip(
+            grid.neighbour_offsets,
+            NEIGHBOUR_DIRECTIONS
+        ):
+            if clearance[index + offset]:
+                valid_neighbours.append((cell[0] + dx, cell[1] + dy))
+        return valid_neighbours
+
+    def get_valid_neighbors_by_coordinates(self, cell: tuple[int, int]):
+        """
+        Gets the valid neighbours of a cell like get_valid_neighbors,
+        for grids without a flat cell array such as ChunkedGrid.
+        """
+        valid_neighbours = []
+        for dx, dy in NEIGHBOUR_DIRECTIONS:
+            x = cell[0] + dx
+            y = cell[1] + dy
+            code = self.grid.get_tile(x, y)
+            if code is None or not self.walkable_tiles[code]:
+                continue
+            for other_dx, other_dy in FULL_NEIGHBOUR_DIRECTIONS:
+                other_code = self.grid.get_tile(x + other_dx, y + other_dy)
+                if other_code is not None and not self.clear_tiles[other_code]:
+                    break
+            else:
+                valid_neighbours.append((x, y))
+        return valid_neighbours
@@ -3,11 +3,18 @@ Module contains Room and RoomPlacer objects.
 Used to generate random rooms in a grid.
 """
 
+import math
 import random
 from dataclasses import dataclass
-from pygame import Rect
-from dungeon_generator.grid import Grid
+from dungeon_generator.grid import Grid, ChunkedGrid
 from dungeon_generator.geometry import Point
+from dungeon_generator.spatial_hash import SpatialHash
+from dungeon_generator.free_space import (
+    get_free_bands,
+    remove_rect_from_bands,
+    get_free_position,
+    count_free_positions
+)
 
 @dataclass
 class Room:
@@ -90,45 +97,98 @@ class RoomPlacer:
     """
     Class responsible for randomly placing rooms of random
     size inside the bounds of the grid.
+
+    By default a room that does not fit is left out. If
+    free_space_sampling and shrink_rooms_to_fit are both set, such
+    a room is shrunk to a random smaller size until it fits, so more
+    rooms are placed but crowded maps get more small rooms.
     """
     def __init__(self) -> None:
         self.room_min_side_length = 5
         self.room_max_side_length = 30
         self.min_room_buffer_distance = 6
+        # If set, rooms are placed on a ChunkedGrid with chunks of this size
+        self.grid_chunk_size = None
+        # If True, rooms are placed with place_room_in_free_space
+        # instead of trying random positions
+        self.free_space_sampling = False
+        # If True, place_room_in_free_space shrinks
+        # rooms that do not fit anywhere
+        self.shrink_rooms_to_fit = False
 
     def generate_rooms(
             self,
             amount: int,
             grid: Grid,
-            seed: int = None
+            seed: int = None,
+            rng: random.Random = None
         ) -> tuple[Grid, list[Room]]:
         """
         Generates a given number of random rooms onto a grid.
 
         Args:
             amount: Number of rooms to be generated.
-            grid: The grid onto which rooms should be generated
-            seed: Seed value for RNG.
+            grid: The grid onto which rooms should be generated.
+            Its cells are set to "empty" before placing the rooms.
+            seed: Seed value for RNG. Only used if rng is not given.
+            rng: Random number generator used for all rooms.
 
         Returns:
-            A tuple with new grid an list of generated rooms.
+            A tuple with the given grid and list of generated rooms.
         """
-        if seed is not None:
-            random.seed(seed)
-        new_grid = self.create_empty_grid(grid.size)
+        if rng is None:
+            rng = random.Random(seed)
+        # Rectangles of the placed rooms, see get_room_rect
+        room_index = SpatialHash()
+        # Free bands of each room size, see place_room_in_free_space
+        free_bands = {}
+        new_grid = grid
+        new_grid.fill("empty")
         rooms: list[Room] = []
         room_dict = {}
 
-        for i in range(amount):
-            new_room = self.create_random_room(seed+(2*i))
-            success = self.try_to_place_room(new_room, rooms, new_grid, seed+i)
+        for _ in range(amount):
+            new_room = self.create_random_room(rng)
+            if self.free_space_sampling:
+                success = self.place_room_in_free_space(
+                    new_room,
+                    rooms,
+                    new_grid,
+                    rng,
+                    room_index=room_index,
+                    free_bands=free_bands
+                )
+            else:
+                success = self.try_to_place_room(
+                    new_room,
+                    rooms,
+                    new_grid,
+                    rng,
+                    room_index=room_index
+                )
             if success:
                 point_tuple = (new_room.center_point.x, new_room.center_point.y)
                 rooms.append(new_room)
+                room_index.insert(self.get_room_rect(new_room))
                 room_dict[point_tuple] = new_room
 
         return (new_grid, room_dict)
 
+    def create_grid(self, size: int) -> Grid:
+        """
+        Creates the kind of grid rooms are placed on, a ChunkedGrid
+        if grid_chunk_size is set and otherwise a Grid.
+
+        Args:
+            size: Size of the grid to be created.
+
+        Returns:
+            Grid of given size. Its cells are not set to "empty".
+        """
+        if self.grid_chunk_size is None:
+            return Grid(size)
+        return ChunkedGrid(size, self.grid_chunk_size)
+
     def create_empty_grid(self, size: int) -> Grid:
         """
         Creates an grid with values of "empty".
@@ -139,30 +199,29 @@ class RoomPlacer:
         Returns:
             Grid of given size with all values as "empty".
         """
-        new_grid = Grid(size)
-        for y in range(-new_grid.size // 2, new_grid.size // 2):
-            for x in range(-new_grid.size // 2, new_grid.size // 2):
-                new_grid.set_cell(x, y, "empty")
+        new_grid = self.create_grid(size)
+        new_grid.fill("empty")
         return new_grid
 
-    def create_random_room(self, seed: int = None) -> Room:
+    def create_random_room(self, rng: random.Random = None) -> Room:
         """
         Creates a randomly sized room object.
 
         Args:
-            seed: A seed value for RNG.
+            rng: Random number generator. If not given,
+            the shared generator of the random module is used.
 
         Returns:
             A room object with random height and width. It's position
             is not set.
         """
-        if seed is not None:
-            random.seed(seed)
-        width = random.uniform(
+        if rng is None:
+            rng = random
+        width = rng.uniform(
             self.room_min_side_length,
             self.room_max_side_length
         )
-        height = random.uniform(
+        height = rng.uniform(
             self.room_min_side_length,
             self.room_max_side_length
         )
@@ -176,8 +235,9 @@ class RoomPlacer:
             room: Room,
             room_list: list[Room],
             grid: Grid,
-            seed: int = None,
-            maximum_attempts: int = 100
+            rng: random.Random = None,
+            maximum_attempts: int = 100,
+            room_index: SpatialHash = None
         ) -> bool:
         """
         Tries to place a room in a random position.
@@ -186,25 +246,166 @@ class RoomPlacer:
             room: Room object to be placed.
             room_list: List of rooms already placed.
             grid: Grid onto which the room should be placed.
-            seed: Seed value for RNG
+            rng: Random number generator used for the positions.
             maximum_attempts: Maximum number of attempts before
             giving up on placing the room.
+            room_index: Spatial hash of the rooms in room_list.
+            If not given, it is created with create_room_index.
 
         Returns:
             A boolean on if the room was successfully generated.
         """
-        for i in range(maximum_attempts):
+        if room_index is None:
+            room_index = self.create_room_index(room_list)
+        for _ in range(maximum_attempts):
             random_position = self.create_random_room_position(
                 room,
                 grid,
-                seed+i
+                rng
             )
             room.bottom_left_point = random_position
-            if self.can_place_room(room, room_list, grid):
+            if self.can_place_room(room, room_list, grid, room_index):
                 self.place_room(room, grid)
                 return True
         return False
 
+    def place_room_in_free_space(
+            self,
+            room: Room,
+            room_list: list[Room],
+            grid: Grid,
+            rng: random.Random = None,
+            maximum_attempts: int = 100,
+            random_attempts: int = 8,
+            room_index: SpatialHash = None,
+            free_bands: dict = None
+        ) -> bool:
+        """
+        Places a room in a random position picked from all positions
+        where it is inside the grid bounds and does not intersect other
+        rooms. If the room does not fit anywhere and shrink_rooms_to_fit
+        is set, it is shrunk to a random smaller size until it fits.
+
+        A few random positions are tried first. If none of them is free,
+        the free positions are found with get_free_bands and one of them
+        is picked. Either way every free position is equally likely.
+        The bands are kept in free_bands, and when the same size is
+        placed again only the rooms added since then are removed from
+        them with remove_rect_from_bands.
+
+        Args:
+            room: Room object to be placed.
+            room_list: List of rooms already placed.
+            grid: Grid onto which the room should be placed.
+            rng: Random number generator. If not given,
+            the shared generator of the random module is used.
+            maximum_attempts: Maximum number of sizes to try.
+            random_attempts: Number of random positions
+            to try before finding the free positions.
+            room_index: Spatial hash of the rooms in room_list.
+            If not given, it is created with create_room_index.
+            free_bands: Dictionary from the room's rectangle size and
+            bounds to its free bands and the number of rooms in
+            room_list they include. Rooms may only be appended to
+            room_list between calls that share it.
+
+        Returns:
+            A boolean on if the room was placed. If shrinking is
+            enabled, False only if not even a room with
+            the smallest side length fits.
+        """
+        if rng is None:
+            rng = random
+        buffer = self.min_room_buffer_distance
+        if room_index is None:
+            room_index = self.create_room_index(room_list)
+        if free_bands is None:
+            free_bands = {}
+        smallest_side = int(self.room_min_side_length + buffer)
+        for _ in range(maximum_attempts):
+            width = int(room.width + buffer)
+            height = int(room.height + buffer)
+            # Positions of the room's rectangle, which is offset by the
+            # buffer distance from the room, allowed by is_room_inside_bounds
+            bounds = (
+                -grid.size // 2 + 2 * buffer,
+                -grid.size // 2 + 2 * buffer,
+                math.floor(grid.size // 2 - room.width),
+                math.floor(grid.size // 2 - room.height)
+            )
+            if bounds[0] <= bounds[2] and bounds[1] <= bounds[3]:
+                for _ in range(random_attempts):
+                    x = rng.randint(bounds[0], bounds[2])
+                    y = rng.randint(bounds[1], bounds[3])
+                    if not room_index.intersects((x, y, width, height)):
+                        room.bottom_left_point = Point(x - buffer, y - buffer)
+                        self.place_room(room, grid)
+                        return True
+            bands = self.get_free_bands_for_size(
+                room_list,
+                width,
+                height,
+                bounds,
+                free_bands
+            )
+            free_positions = count_free_positions(bands)
+            if free_positions:
+                x, y = get_free_position(bands, rng.randrange(free_positions))
+                room.bottom_left_point = Point(x - buffer, y - buffer)
+                self.place_room(room, grid)
+                return True
+            if not self.shrink_rooms_to_fit or (
+                int(room.width + buffer) <= smallest_side and
+                int(room.height + buffer) <= smallest_side
+            ):
+                return False
+            room.width = rng.uniform(self.room_min_side_length, room.width)
+            room.height = rng.uniform(self.room_min_side_length, room.height)
+        return False
+
+    def get_free_bands_for_size(
+            self,
+            room_list: list[Room],
+            width: int,
+            height: int,
+            bounds: tuple[int, int, int, int],
+            free_bands: dict
+        ) -> list[tuple[int, int, list[tuple[int, int]], int]]:
+        """
+        Gets the free bands of a room rectangle size, updating the bands
+        stored in free_bands with the rooms added after them, or finding
+        them with get_free_bands if there are none.
+
+        Args:
+            room_list: List of rooms already placed.
+            width: Width of the room's rectangle.
+            height: Height of the room's rectangle.
+            bounds: Allowed positions of the room's rectangle.
+            free_bands: Free bands by size and bounds,
+            see place_room_in_free_space.
+
+        Returns:
+            Free bands of the size including every room in room_list.
+        """
+        key = (width, height, bounds)
+        if key in free_bands:
+            bands, room_count = free_bands[key]
+            for other_room in room_list[room_count:]:
+                bands = remove_rect_from_bands(
+                    bands,
+                    self.get_room_rect(other_room),
+                    width,
+                    height,
+                    bounds
+                )
+        else:
+            rects = [
+                self.get_room_rect(other_room) for other_room in room_list
+            ]
+            bands = get_free_bands(rects, width, height, bounds)
+        free_bands[key] = (bands, len(room_list))
+        return bands
+
     def place_room(self, room: Room, grid: Grid):
         """
         Sets values of grid cells according to
@@ -215,32 +416,19 @@ class RoomPlacer:
             grid: Grid in which room is to be placed.
 
         """
-        for y in range(
-            int(room.bottom_left_point.y),
-            int(room.bottom_left_point.y + room.height + 1)
-        ):
-            for x in range(
-                int(room.bottom_left_point.x),
-                int(room.bottom_left_point.x + room.width + 1)
-            ):
-                if (
-                    x == int(room.bottom_left_point.x) or
-                    x == int(room.bottom_left_point.x + room.width)
-                ):
-                    grid.set_cell(x, y, "room_wall")
-                elif (
-                    y == int(room.bottom_left_point.y) or
-                    y == int(room.bottom_left_point.y + room.height)
-                ):
-                    grid.set_cell(x, y, "room_wall")
-                else:
-                    grid.set_cell(x, y, "room_floor")
+        x0 = int(room.bottom_left_point.x)
+        y0 = int(room.bottom_left_point.y)
+        x1 = int(room.bottom_left_point.x + room.width)
+        y1 = int(room.bottom_left_point.y + room.height)
+        grid.fill_rect(x0 + 1, y0 + 1, x1 - 1, y1 - 1, "room_floor")
+        grid.outline_rect(x0, y0, x1, y1, "room_wall")
 
     def can_place_room(
             self,
             room: Room,
             room_list: list[Room],
-            grid: Grid
+            grid: Grid,
+            room_index: SpatialHash = None
         ) -> bool:
         """
         Checks wether a room can be placed.
@@ -249,19 +437,26 @@ class RoomPlacer:
             room: The room to check for.
             room_list: The list of other rooms already placed.
             grid: Grid where the room should be placed.
+            room_index: Spatial hash of the rooms in room_list.
+            If not given, it is created with create_room_index.
 
         Returns:
             A boolean on wether the current placement is valid. If it is,
             then returns True.
         """
         in_bounds = self.is_room_inside_bounds(room, grid)
-        room_overlap = self.if_room_intersect_with_rooms(room, room_list)
+        room_overlap = self.if_room_intersect_with_rooms(
+            room,
+            room_list,
+            room_index
+        )
         return in_bounds and not room_overlap
 
     def if_room_intersect_with_rooms(
             self,
             room: Room,
-            room_list: list[Room]
+            room_list: list[Room],
+            room_index: SpatialHash = None
         ) -> bool:
         """
         Checks wether a room intersects with a list of other rooms.
@@ -269,27 +464,48 @@ class RoomPlacer:
         Args:
             room: The room to check for intersection with.
             room_list: The list of rooms to compare with.
+            room_index: Spatial hash of the rooms in room_list.
+            If not given, it is created with create_room_index.
 
         Returns:
             A boolean on wether there is an intersection. If there is,
             then returns True.
         """
-        rect_list = [
-            Rect(
-                other_room.bottom_left_point.x + self.min_room_buffer_distance,
-                other_room.bottom_left_point.y + self.min_room_buffer_distance,
-                other_room.width + self.min_room_buffer_distance,
-                other_room.height + self.min_room_buffer_distance
-            )
-            for other_room in room_list
-        ]
-        room_rect = Rect(
-            room.bottom_left_point.x + self.min_room_buffer_distance,
-            room.bottom_left_point.y + self.min_room_buffer_distance,
-            room.width + self.min_room_buffer_distance,
-            room.height + self.min_room_buffer_distance
+        if room_index is None:
+            room_index = self.create_room_index(room_list)
+        return room_index.intersects(self.get_room_rect(room))
+
+    def create_room_index(self, room_list: list[Room]) -> SpatialHash:
+        """
+        Creates a spatial hash of the rectangles of a list of rooms.
+        generate_rooms does not call this, it creates an empty hash
+        and adds each room to it when the room is placed.
+
+        Args:
+            room_list: The list of rooms to create the hash for.
+
+        Returns:
+            SpatialHash containing the rectangle of each room.
+        """
+        room_index = SpatialHash()
+        for other_room in room_list:
+            room_index.insert(self.get_room_rect(other_room))
+        return room_index
+
+    def get_room_rect(self, room: Room) -> tuple[int, int, int, int]:
+        """
+        Gets the rectangle used to check if a room intersects other rooms.
+        Values are truncated to integers like in pygame's Rect.
+
+        Returns:
+            Tuple of the x and y coordinates, width and height.
+        """
+        return (
+            int(room.bottom_left_point.x + self.min_room_buffer_distance),
+            int(room.bottom_left_point.y + self.min_room_buffer_distance),
+            int(room.width + self.min_room_buffer_distance),
+            int(room.height + self.min_room_buffer_distance)
         )
-        return room_rect.collidelist(rect_list) != -1
 
     def is_room_inside_bounds(self, room: Room, grid: Grid) -> bool:
         """
@@ -321,7 +537,7 @@ class RoomPlacer:
             self,
             room: Room,
             grid: Grid,
-            seed: int = None
+            rng: random.Random = None
         ) -> Point:
         """
         Creates a random position for a room that is inside
@@ -330,16 +546,17 @@ class RoomPlacer:
         Args:
             room: The room which position should be created.
             grid: The grid in which the room is to be positioned.
-            seed: Seed value for RNG.
+            rng: Random number generator. If not given,
+            the shared generator of the random module is used.
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random
 
-        x = int(random.uniform(
+        x = int(rng.uniform(
             -int(grid.size // 2 + self.min_room_buffer_distance),
             int(grid.size // 2 - room.width - self.min_room_buffer_distance)
         ))
-        y = int(random.uniform(
+        y = int(rng.uniform(
             -int(grid.size // 2 + self.min_room_buffer_distance),
             int(grid.size // 2 - room.height - self.min_room_buffer_distance)
         ))
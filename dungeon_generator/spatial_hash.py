@@ -0,0 +1,77 @@
+"""
+Module containing the SpatialHash class.
+Used by RoomPlacer to find the rooms near a position
+without checking every placed room.
+"""
+
+BUCKET_SIZE = 32
+
+class SpatialHash:
+    """
+    Uniform grid of square buckets storing axis-aligned rectangles.
+    Each rectangle is stored in every bucket it covers, so checking
+    a rectangle only needs the rectangles in the buckets it covers.
+
+    Rectangles are (x, y, width, height) tuples of integers. Like with
+    pygame's Rect.colliderect, two rectangles intersect only if their
+    overlap has a positive area, so rectangles that only share an edge
+    and rectangles without an area never intersect.
+
+    Args:
+        bucket_size: Side length of the buckets. Works best when
+        it is close to the size of a typical rectangle.
+    """
+    def __init__(self, bucket_size: int = BUCKET_SIZE) -> None:
+        self.bucket_size = bucket_size
+        self.buckets: dict[tuple[int, int], list[tuple[int, int, int, int]]] = {}
+        self.count = 0
+
+    def get_bucket_keys(
+            self,
+            rect: tuple[int, int, int, int]
+        ) -> list[tuple[int, int]]:
+        """
+        Gets the keys of the buckets a rectangle covers.
+
+        Returns:
+            List of (column, row) keys of the buckets.
+        """
+        x, y, width, height = rect
+        size = self.bucket_size
+        return [
+            (column, row)
+            for row in range(y // size, (y + height - 1) // size + 1)
+            for column in range(x // size, (x + width - 1) // size + 1)
+        ]
+
+    def insert(self, rect: tuple[int, int, int, int]) -> None:
+        """
+        Adds a rectangle to the buckets it covers.
+        """
+        self.count += 1
+        if rect[2] <= 0 or rect[3] <= 0:
+            return
+        for key in self.get_bucket_keys(rect):
+            self.buckets.setdefault(key, []).append(rect)
+
+    def intersects(self, rect: tuple[int, int, int, int]) -> bool:
+        """
+        Checks if a rectangle intersects any rectangle in the hash.
+        """
+        x, y, width, height = rect
+        if width <= 0 or height <= 0:
+            return False
+        right = x + width
+        top = y + height
+        buckets = self.buckets
+        for key in self.get_bucket_keys(rect):
+            for other_x, other_y, other_width, other_height in buckets.get(
+                key,
+                ()
+            ):
+                if (
+                    x < other_x + other_width and other_x < right and
+                    y < other_y + other_height and other_y < top
+                ):
+                    return True
+        return False
@@ -0,0 +1,106 @@
+"""
+Module contains functions for ordering points spatially.
+Used to insert points into a triangulation in an order
+where consecutive points are close to each other.
+"""
+
+import random
+from dungeon_generator.geometry import Point
+
+HILBERT_ORDER = 16
+
+def get_hilbert_index(x: int, y: int, order: int = HILBERT_ORDER) -> int:
+    """
+    Gets the distance along a Hilbert curve
+    to a cell in a square grid.
+
+    Args:
+        x: X coordinate of the cell, between 0 and 2^order - 1.
+        y: Y coordinate of the cell, between 0 and 2^order - 1.
+        order: Order of the Hilbert curve.
+
+    Returns:
+        Distance of the cell along the curve.
+    """
+    # https://en.wikipedia.org/wiki/Hilbert_curve#Applications_and_mapping_algorithms
+    index = 0
+    side = 1 << order
+    step = side >> 1
+    while step > 0:
+        rx = 1 if x & step else 0
+        ry = 1 if y & step else 0
+        index += step * step * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = side - 1 - x
+                y = side - 1 - y
+            x, y = y, x
+        step >>= 1
+    return index
+
+def sort_by_hilbert_curve(
+        points: list[Point],
+        indices: list[int]
+    ) -> list[int]:
+    """
+    Sorts point indices by the position of the points along
+    a Hilbert curve covering the bounds of the points.
+
+    Args:
+        points: List of all points.
+        indices: Indices of the points to sort.
+
+    Returns:
+        Sorted list of point indices.
+    """
+    if len(indices) <= 1:
+        return list(indices)
+    min_x = min(point.x for point in points)
+    min_y = min(point.y for point in points)
+    extent = max(
+        max(point.x for point in points) - min_x,
+        max(point.y for point in points) - min_y
+    )
+    if extent == 0:
+        return list(indices)
+    scale = ((1 << HILBERT_ORDER) - 1) / extent
+    return sorted(
+        indices,
+        key=lambda i: get_hilbert_index(
+            int((points[i].x - min_x) * scale),
+            int((points[i].y - min_y) * scale)
+        )
+    )
+
+def get_biased_randomized_insertion_order(
+        points: list[Point],
+        seed: int = 0
+    ) -> list[int]:
+    """
+    Creates a biased randomized insertion order (BRIO) for points.
+    Points are split into rounds where each round has about half of the
+    points of the next one, and the points in each round are sorted
+    along a Hilbert curve. This keeps consecutive points close to each
+    other while avoiding the worst cases of a fully sorted order.
+
+    Args:
+        points: List of points to order.
+        seed: Seed value for the RNG used to split the points into rounds.
+
+    Returns:
+        List of point indices in insertion order.
+    """
+    rng = random.Random(seed)
+    rounds: list[list[int]] = [[]]
+    for i in range(len(points)):
+        round_number = 0
+        while rng.random() < 0.5:
+            round_number += 1
+        while len(rounds) <= round_number:
+            rounds.append([])
+        rounds[round_number].append(i)
+
+    order = []
+    for round_indices in reversed(rounds):
+        order.extend(sort_by_hilbert_curve(points, round_indices))
+    return order
@@ -0,0 +1,347 @@
+"""
+Module containing the TriangleMesh class.
+Used by the Bowyer-Watson implementation to
+insert points into a triangulation incrementally.
+"""
+
+from dungeon_generator.geometry import orientation, incircle
+
+NO_TRIANGLE = -1
+GHOST_VERTEX = -1
+
+class TriangleMesh:
+    """
+    Triangle mesh where every triangle knows its neighbouring triangles.
+
+    Vertices are stored as indices into the coordinate lists and
+    triangles as counter-clockwise vertex index triples in a flat list.
+    Neighbour i of a triangle is the triangle on the other side of the edge
+    going from vertex i to vertex i+1, or NO_TRIANGLE if there is none.
+
+    A mesh started with create_initial_triangle is surrounded by ghost
+    triangles, which connect each edge of the convex hull to GHOST_VERTEX,
+    a symbolic vertex at infinity. The circumcircle of a ghost triangle is
+    the open half-plane on the outer side of its hull edge.
+    """
+    def __init__(self) -> None:
+        self.x_coords: list[float] = []
+        self.y_coords: list[float] = []
+        self.triangle_vertices: list[int] = []
+        self.triangle_neighbours: list[int] = []
+        self.alive: list[bool] = []
+        self.free_triangles: list[int] = []
+        self.last_triangle = NO_TRIANGLE
+
+    def add_vertex(self, x: float, y: float) -> int:
+        """
+        Adds a vertex to the mesh without triangulating it.
+
+        Args:
+            x: X coordinate of the vertex.
+            y: Y coordinate of the vertex.
+
+        Returns:
+            Index of the new vertex.
+        """
+        self.x_coords.append(x)
+        self.y_coords.append(y)
+        return len(self.x_coords) - 1
+
+    def add_triangle(self, a: int, b: int, c: int) -> int:
+        """
+        Adds a triangle with no neighbours to the mesh.
+        The vertices should be in counter-clockwise order.
+
+        Args:
+            a, b, c: Vertex indices of the triangle.
+
+        Returns:
+            Index of the new triangle.
+        """
+        if self.free_triangles:
+            triangle = self.free_triangles.pop()
+            base = 3 * triangle
+            self.triangle_vertices[base:base+3] = (a, b, c)
+            self.triangle_neighbours[base:base+3] = (
+                NO_TRIANGLE, NO_TRIANGLE, NO_TRIANGLE
+            )
+            self.alive[triangle] = True
+        else:
+            triangle = len(self.alive)
+            self.triangle_vertices.extend((a, b, c))
+            self.triangle_neighbours.extend(
+                (NO_TRIANGLE, NO_TRIANGLE, NO_TRIANGLE)
+            )
+            self.alive.append(True)
+        self.last_triangle = triangle
+        return triangle
+
+    def create_initial_triangle(self, a: int, b: int, c: int) -> int:
+        """
+        Adds the first triangle of a triangulation and a ghost triangle
+        on the outer side of each of its edges.
+        The vertices should be in counter-clockwise order.
+
+        Args:
+            a, b, c: Vertex indices of the triangle.
+
+        Returns:
+            Index of the new triangle.
+        """
+        triangle = self.add_triangle(a, b, c)
+        ghosts = (
+            self.add_triangle(b, a, GHOST_VERTEX),
+            self.add_triangle(c, b, GHOST_VERTEX),
+            self.add_triangle(a, c, GHOST_VERTEX)
+        )
+        neighbours = self.triangle_neighbours
+        for i, ghost in enumerate(ghosts):
+            neighbours[3*triangle+i] = ghost
+            neighbours[3*ghost] = triangle
+            # Ghost triangles of consecutive edges share
+            # an edge going to the ghost vertex
+            neighbours[3*ghost+1] = ghosts[(i - 1) % 3]
+            neighbours[3*ghost+2] = ghosts[(i + 1) % 3]
+        self.last_triangle = triangle
+        return triangle
+
+    def remove_triangle(self, triangle: int) -> None:
+        """
+        Removes a triangle from the mesh. The slot is reused by
+        the next added triangle.
+        """
+        self.alive[triangle] = False
+        self.free_triangles.append(triangle)
+
+    def get_triangles(self) -> list[tuple[int, int, int]]:
+        """
+        Returns:
+            List of vertex index triples of all
+            triangles in the mesh, excluding ghost triangles.
+        """
+        vertices = self.triangle_vertices
+        triangles = []
+        for t, alive in enumerate(self.alive):
+            if not alive:
+                continue
+            triangle = (vertices[3*t], vertices[3*t+1], vertices[3*t+2])
+            if GHOST_VERTEX not in triangle:
+                triangles.append(triangle)
+        return triangles
+
+    def is_ghost_triangle(self, triangle: int) -> bool:
+        """
+        Check if a triangle is a ghost triangle.
+        """
+        return GHOST_VERTEX in self.triangle_vertices[3*triangle:3*triangle+3]
+
+    def orientation(self, a: int, b: int, x: float, y: float) -> float:
+        """
+        Returns a positive value if the point (x, y) is to the left of
+        the line going from vertex a to vertex b, a negative value if it is
+        to the right and zero if the three are on a single line.
+        """
+        return orientation(
+            self.x_coords[a], self.y_coords[a],
+            self.x_coords[b], self.y_coords[b],
+            x, y
+        )
+
+    def is_point_in_circumcircle(
+            self,
+            triangle: int,
+            x: float,
+            y: float
+        ) -> bool:
+        """
+        Check if the point (x, y) is strictly inside
+        the circumcircle of a triangle.
+        """
+        base = 3 * triangle
+        a, b, c = self.triangle_vertices[base:base+3]
+        x_coords = self.x_coords
+        y_coords = self.y_coords
+        if GHOST_VERTEX in (a, b, c):
+            if a == GHOST_VERTEX:
+                a, b = b, c
+            elif b == GHOST_VERTEX:
+                a, b = c, a
+            side = self.orientation(a, b, x, y)
+            if side != 0:
+                return side > 0
+            # A point on the hull edge's line is inside
+            # only if it is between the edge's vertices
+            return (
+                (x_coords[a] - x) * (x_coords[b] - x)
+                + (y_coords[a] - y) * (y_coords[b] - y)
+            ) < 0
+        return incircle(
+            x_coords[a], y_coords[a],
+            x_coords[b], y_coords[b],
+            x_coords[c], y_coords[c],
+            x, y
+        ) > 0
+
+    def locate(self, x: float, y: float) -> int:
+        """
+        Finds the triangle containing the point (x, y) by walking
+        through the mesh from the most recently created triangle.
+
+        Returns:
+            Index of the triangle containing the point. If the point is
+            outside of the convex hull, a ghost triangle whose circumcircle
+            contains the point, or the last visited triangle
+            if the mesh has no ghost triangles.
+        """
+        triangle = self.last_triangle
+        if triangle == NO_TRIANGLE or not self.alive[triangle]:
+            triangle = self.alive.index(True)
+        vertices = self.triangle_vertices
+        neighbours = self.triangle_neighbours
+        if self.is_ghost_triangle(triangle):
+            for i in range(3):
+                if GHOST_VERTEX not in (
+                    vertices[3*triangle+i],
+                    vertices[3*triangle+(i+1)%3]
+                ):
+                    triangle = neighbours[3*triangle+i]
+                    break
+        # Rotating the first checked edge on every step
+        # keeps the walk from circling around a point
+        for step in range(len(self.alive) + 1):
+            base = 3 * triangle
+            for k in range(3):
+                i = (step + k) % 3
+                if self.orientation(
+                    vertices[base+i],
+                    vertices[base+(i+1)%3],
+                    x,
+                    y
+                ) < 0:
+                    neighbour = neighbours[base+i]
+                    if neighbour == NO_TRIANGLE:
+                        return triangle
+                    triangle = neighbour
+                    if self.is_ghost_triangle(triangle):
+                        return triangle
+                    break
+            else:
+                return triangle
+        return self.locate_by_scan(x, y)
+
+    def locate_by_scan(self, x: float, y: float) -> int:
+        """
+        Finds the triangle containing the point (x, y)
+        by checking every triangle in the mesh.
+        Used as a fallback if walking through the mesh fails.
+        """
+        vertices = self.triangle_vertices
+        ghosts = []
+        for triangle, alive in enumerate(self.alive):
+            if not alive:
+                continue
+            if self.is_ghost_triangle(triangle):
+                ghosts.append(triangle)
+                continue
+            base = 3 * triangle
+            if (
+                self.orientation(vertices[base], vertices[base+1], x, y) >= 0
+                and self.orientation(vertices[base+1], vertices[base+2], x, y) >= 0
+                and self.orientation(vertices[base+2], vertices[base], x, y) >= 0
+            ):
+                return triangle
+        for triangle in ghosts:
+            if self.is_point_in_circumcircle(triangle, x, y):
+                return triangle
+        return NO_TRIANGLE
+
+    def insert_vertex(self, vertex: int) -> bool:
+        """
+        Inserts a vertex into the triangulation. Triangles whose circumcircle
+        contains the vertex are removed and the resulting cavity is
+        filled with new triangles connected to the vertex.
+
+        Args:
+            vertex: Index of a vertex added with add_vertex.
+
+        Returns:
+            False if the vertex is outside of the mesh or has the same
+            position as an existing vertex, otherwise True.
+        """
+        x = self.x_coords[vertex]
+        y = self.y_coords[vertex]
+        start = self.locate(x, y)
+        if start == NO_TRIANGLE:
+            return False
+        for other in self.triangle_vertices[3*start:3*start+3]:
+            if other == GHOST_VERTEX:
+                continue
+            if self.x_coords[other] == x and self.y_coords[other] == y:
+                return False
+        if not self.is_point_in_circumcircle(start, x, y):
+            return False
+        self.fill_cavity(vertex, self.find_cavity(start, x, y))
+        return True
+
+    def find_cavity(self, start: int, x: float, y: float) -> set[int]:
+        """
+        Finds the triangles whose circumcircle contains the point (x, y)
+        by flood-filling through neighbours from the triangle
+        containing the point.
+
+        Returns:
+            Set of triangle indices forming the cavity.
+        """
+        neighbours = self.triangle_neighbours
+        cavity = {start}
+        stack = [start]
+        while stack:
+            triangle = stack.pop()
+            for neighbour in neighbours[3*triangle:3*triangle+3]:
+                if (
+                    neighbour != NO_TRIANGLE and
+                    neighbour not in cavity and
+                    self.is_point_in_circumcircle(neighbour, x, y)
+                ):
+                    cavity.add(neighbour)
+                    stack.append(neighbour)
+        return cavity
+
+    def fill_cavity(self, vertex: int, cavity: set[int]) -> None:
+        """
+        Replaces the triangles of a cavity with triangles connecting
+        the edges on the border of the cavity to the given vertex.
+        """
+        vertices = self.triangle_vertices
+        neighbours = self.triangle_neighbours
+        # Edges of the cavity as (start vertex, end vertex, outer triangle)
+        boundary = []
+        for triangle in cavity:
+            base = 3 * triangle
+            for i in range(3):
+                if neighbours[base+i] not in cavity:
+                    boundary.append((
+                        vertices[base+i],
+                        vertices[base+(i+1)%3],
+                        neighbours[base+i]
+                    ))
+        for triangle in cavity:
+            self.remove_triangle(triangle)
+
+        triangle_starting_at = {}
+        triangle_ending_at = {}
+        for a, b, outer in boundary:
+            new_triangle = self.add_triangle(a, b, vertex)
+            neighbours[3*new_triangle] = outer
+            if outer != NO_TRIANGLE:
+                outer_base = 3 * outer
+                for i in range(3):
+                    if vertices[outer_base+i] == b:
+                        neighbours[outer_base+i] = new_triangle
+                        break
+            triangle_starting_at[a] = new_triangle
+            triangle_ending_at[b] = new_triangle
+        for new_triangle in triangle_starting_at.values():
+            base = 3 * new_triangle
+            neighbours[base+1] = triangle_starting_at[vertices[base+1]]
+            neighbours[base+2] = triangle_ending_at[vertices[base]]
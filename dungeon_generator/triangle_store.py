@@ -0,0 +1,180 @@
+"""
+Module containing the TriangleStore class.
+Stores triangles in NumPy arrays so that the circumcircles
+of all triangles can be checked with a single array expression.
+NumPy is an optional dependency only needed by this module.
+"""
+
+from dungeon_generator.geometry import incircle, CIRCUMCIRCLE_MARGIN
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TriangleStore:
+    """
+    Array-backed store of triangles. Each row contains the vertex indices
+    of a triangle and its precomputed circumcenter and squared circumradius.
+    Rows of removed triangles are reused by new triangles.
+
+    Args:
+        x_coords: X coordinates of all vertices.
+        y_coords: Y coordinates of all vertices.
+        first_super_vertex: Index of the first vertex of a super triangle.
+        The precomputed circumcircles of triangles with super triangle
+        vertices are too imprecise, so those triangles are always
+        checked with the exact incircle predicate.
+        capacity: Number of rows to allocate at first.
+    """
+    def __init__(
+            self,
+            x_coords: list[float],
+            y_coords: list[float],
+            first_super_vertex: int = None,
+            capacity: int = 64
+        ) -> None:
+        if np is None:
+            raise ImportError(
+                "TriangleStore requires NumPy. Install it with 'pip install numpy'."
+            )
+        self.x_coords = np.asarray(x_coords, dtype=np.float64)
+        self.y_coords = np.asarray(y_coords, dtype=np.float64)
+        # Plain float lists are faster for checking single triangles
+        self.x_values: list[float] = self.x_coords.tolist()
+        self.y_values: list[float] = self.y_coords.tolist()
+        self.vertices = np.zeros((capacity, 3), dtype=np.int64)
+        self.circumcenter_x = np.zeros(capacity, dtype=np.float64)
+        self.circumcenter_y = np.zeros(capacity, dtype=np.float64)
+        self.circumradius_squared = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.needs_exact_check = np.zeros(capacity, dtype=bool)
+        if first_super_vertex is None:
+            first_super_vertex = len(self.x_coords)
+        self.first_super_vertex = first_super_vertex
+        self.row_count = 0
+        self.free_rows: list[int] = []
+
+    def grow(self) -> None:
+        """
+        Doubles the number of rows in the arrays.
+        """
+        capacity = 2 * len(self.alive)
+        self.vertices = np.resize(self.vertices, (capacity, 3))
+        self.circumcenter_x = np.resize(self.circumcenter_x, capacity)
+        self.circumcenter_y = np.resize(self.circumcenter_y, capacity)
+        self.circumradius_squared = np.resize(
+            self.circumradius_squared,
+            capacity
+        )
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.row_count] = self.alive[:self.row_count]
+        self.alive = alive
+        self.needs_exact_check = np.resize(self.needs_exact_check, capacity)
+
+    def add_triangle(self, a: int, b: int, c: int) -> int:
+        """
+        Adds a triangle to the store and calculates its circumcircle.
+        The vertices should be in counter-clockwise order.
+
+        Args:
+            a, b, c: Vertex indices of the triangle.
+
+        Returns:
+            Row index of the new triangle.
+        """
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.row_count == len(self.alive):
+                self.grow()
+            row = self.row_count
+            self.row_count += 1
+        ax = self.x_values[a]
+        ay = self.y_values[a]
+        bx = self.x_values[b] - ax
+        by = self.y_values[b] - ay
+        cx = self.x_values[c] - ax
+        cy = self.y_values[c] - ay
+        # Circumcenter relative to vertex a
+        d = 2 * (bx * cy - by * cx)
+        b_lift = bx * bx + by * by
+        c_lift = cx * cx + cy * cy
+        ux = (cy * b_lift - by * c_lift) / d
+        uy = (bx * c_lift - cx * b_lift) / d
+        self.vertices[row] = (a, b, c)
+        self.circumcenter_x[row] = ax + ux
+        self.circumcenter_y[row] = ay + uy
+        self.circumradius_squared[row] = ux * ux + uy * uy
+        self.needs_exact_check[row] = (
+            max(a, b, c) >= self.first_super_vertex
+        )
+        self.alive[row] = True
+        return row
+
+    def remove_triangles(self, rows) -> None:
+        """
+        Removes triangles from the store.
+
+        Args:
+            rows: Row indices of the triangles to remove.
+        """
+        self.alive[rows] = False
+        self.free_rows.extend(int(row) for row in rows)
+
+    def bad_triangle_mask(self, x: float, y: float):
+        """
+        Checks the circumcircles of all triangles at once.
+        Triangles whose circumcircle is too close to the point for the
+        floating point result to be certain are checked with the exact
+        incircle predicate.
+
+        Args:
+            x: X coordinate of the point.
+            y: Y coordinate of the point.
+
+        Returns:
+            Boolean array with a value for each row, True for triangles
+            whose circumcircle contains the point.
+        """
+        rows = self.row_count
+        dx = self.circumcenter_x[:rows] - x
+        dy = self.circumcenter_y[:rows] - y
+        difference = dx * dx + dy * dy - self.circumradius_squared[:rows]
+        margin = CIRCUMCIRCLE_MARGIN * self.circumradius_squared[:rows]
+        mask = (
+            (difference < -margin) &
+            self.alive[:rows] &
+            ~self.needs_exact_check[:rows]
+        )
+        uncertain = np.flatnonzero(
+            (
+                (np.abs(difference) <= margin) |
+                self.needs_exact_check[:rows]
+            ) & self.alive[:rows]
+        )
+        x_coords = self.x_values
+        y_coords = self.y_values
+        for row, (a, b, c) in zip(
+            uncertain.tolist(),
+            self.vertices[uncertain].tolist()
+        ):
+            mask[row] = incircle(
+                x_coords[a], y_coords[a],
+                x_coords[b], y_coords[b],
+                x_coords[c], y_coords[c],
+                x, y
+            ) > 0
+        return mask
+
+    def get_triangles(self) -> list[tuple[int, int, int]]:
+        """
+        Returns:
+            List of vertex index triples of all triangles in the store.
+        """
+        return [
+            tuple(int(vertex) for vertex in triangle)
+            for triangle in self.vertices[:self.row_count][
+                self.alive[:self.row_count]
+            ]
+        ]
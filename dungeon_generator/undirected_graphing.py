@@ -2,47 +2,79 @@
 Module contains classes to create and manipulate undirected graphs.
 """
 import math
+import heapq
+import itertools
 import random
-from dungeon_generator.geometry import Point, Edge, Triangle
+from dungeon_generator.geometry import Point, Edge, Triangle, orientation
+from dungeon_generator.triangle_mesh import TriangleMesh
+from dungeon_generator.triangle_store import TriangleStore
+from dungeon_generator.spatial_sort import get_biased_randomized_insertion_order
 
-def get_point_edge_refs(
+def get_point_edge_index_refs(
         edges: list[Edge]
     ) -> dict:
     """
-    Creates a dictionary of point ids and
-    edges to which said points are connected to.
+    Creates a dictionary of point ids and the indices
+    of edges to which said points are connected to.
 
     Args:
         edges: List of edges to create references from.
 
     Returns:
-        A dictionary with a point ids as keys
-        and a list of edges as values.
+        A dictionary with point ids as keys
+        and a list of edge indices as values.
     """
-    point_edge_references = {}
-    for edge in edges:
-        point_edge_references[edge.vertices[0].point_id] = []
-        point_edge_references[edge.vertices[1].point_id] = []
-
-    for edge in edges:
-        point_edge_references[edge.vertices[0].point_id].append(edge)
-        point_edge_references[edge.vertices[1].point_id].append(edge)
+    point_edge_indices = {}
+    for edge_index, edge in enumerate(edges):
+        for vertex in edge.vertices:
+            point_edge_indices.setdefault(vertex.point_id, []).append(edge_index)
+    return point_edge_indices
+
+def get_unique_triangle_edges(
+        triangles: list[tuple[int, int, int]]
+    ) -> list[tuple[int, int]]:
+    """
+    Gets the edges of triangles given as vertex index triples.
+    An edge shared by two triangles is only included once.
 
-    return point_edge_references
+    Args:
+        triangles: List of vertex index triples.
 
-def get_edge_id_dict(
-        edges: list[Edge]
-    ) -> dict:
-    edge_dict = {}
-    for edge in edges:
-        edge_dict[edge.edge_id] = edge
-    return edge_dict
+    Returns:
+        List of vertex index pairs in the order
+        in which they first appear in the triangles.
+    """
+    edges = []
+    seen_edges = set()
+    for a, b, c in triangles:
+        for start, end in ((a, b), (b, c), (c, a)):
+            edge_key = (start, end) if start < end else (end, start)
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edges.append((start, end))
+    return edges
 
 class BowyerWatson:
     """
     Implementation of the Bowyer-Watson algorithm for creating
     a Delaunay triangulation from a set of points.
+
+    Args:
+        use_ghost_vertices: If True, the triangulation is surrounded
+        by ghost triangles connected to a symbolic vertex at infinity.
+        Otherwise a very large super triangle is used, which
+        can cause floating point precision issues.
+        spatial_sort: If True, points are inserted in a biased randomized
+        order along a Hilbert curve, so that the triangle containing the
+        next point is found close to the previous one.
     """
+    def __init__(
+            self,
+            use_ghost_vertices: bool = True,
+            spatial_sort: bool = True
+        ) -> None:
+        self.use_ghost_vertices = use_ghost_vertices
+        self.spatial_sort = spatial_sort
 
     def get_bounds_from_points(self, points: list[Point]) -> tuple[Point, Point]:
         if len(points) <= 1:
@@ -79,65 +111,139 @@ class BowyerWatson:
         Returns:
             Returns the Delaunay triangulation as a list of edges.
         """
+        output = []
+        for triangle in self.triangulate_point_indices(points):
+            a, b, c = (points[vertex] for vertex in triangle)
+            output.append(Edge((a, b)))
+            output.append(Edge((b, c)))
+            output.append(Edge((c, a)))
+        return output
+
+    def triangulate_point_indices(
+            self,
+            points: list[Point]
+        ) -> list[tuple[int, int, int]]:
+        """
+        Triangulates a given set of points using the Bowyer-Watson algorithm.
+
+        Args:
+            points: List of points that should be triangulated.
+            Multiple points should not occupy the same space.
+
+        Returns:
+            The triangles of the Delaunay triangulation as
+            counter-clockwise triples of indices into the list of points.
+        """
         # Implementation of pseudocode from
         # https://en.wikipedia.org/wiki/Bowyer%E2%80%93Watson_algorithm
         # Also inspired by
         # https://www.gorillasun.de/blog/bowyer-watson-algorithm-for-delaunay-triangulation/
-        # This is an inefficient algorithm with no optimizations
+        # Points are inserted into a mesh of neighbour-linked triangles,
+        # so the triangle containing a point is found by walking from the
+        # previous insertion and the bad triangles by flood-filling
+        # from there, instead of checking every triangle.
         if len(points) <= 1:
             return []
+        mesh = TriangleMesh()
+        for point in points:
+            mesh.add_vertex(point.x, point.y)
+        if self.spatial_sort:
+            order = get_biased_randomized_insertion_order(points)
+        else:
+            order = list(range(len(points)))
+        if self.use_ghost_vertices:
+            inserted = self.start_ghost_triangulation(mesh, order)
+            if len(inserted) == 0:
+                return []
+        else:
+            inserted = self.start_supertriangle_triangulation(mesh, points)
+
+        for vertex in order:
+            if vertex not in inserted:
+                mesh.insert_vertex(vertex)
+
+        # Super triangle vertices are added after the points
+        return [
+            triangle for triangle in mesh.get_triangles()
+            if max(triangle) < len(points)
+        ]
+
+    def start_ghost_triangulation(
+            self,
+            mesh: TriangleMesh,
+            order: list[int]
+        ) -> tuple[int, ...]:
+        """
+        Creates the first triangle of the triangulation surrounded by
+        ghost triangles, using the first three vertices in insertion order
+        that are not on a single line.
+
+        Args:
+            mesh: Mesh containing the vertices to triangulate.
+            order: Vertex indices in insertion order.
+
+        Returns:
+            The vertices of the first triangle, or an empty tuple
+            if all vertices are on a single line.
+        """
+        x_coords = mesh.x_coords
+        y_coords = mesh.y_coords
+        first = order[0]
+        second_position = next(
+            (
+                position for position in range(1, len(order))
+                if x_coords[order[position]] != x_coords[first] or
+                y_coords[order[position]] != y_coords[first]
+            ),
+            None
+        )
+        if second_position is None:
+            return ()
+        second = order[second_position]
+        for third in order[second_position+1:]:
+            side = mesh.orientation(
+                first,
+                second,
+                x_coords[third],
+                y_coords[third]
+            )
+            if side > 0:
+                mesh.create_initial_triangle(first, second, third)
+                return (first, second, third)
+            if side < 0:
+                mesh.create_initial_triangle(first, third, second)
+                return (first, second, third)
+        return ()
+
+    def start_supertriangle_triangulation(
+            self,
+            mesh: TriangleMesh,
+            points: list[Point]
+        ) -> tuple[int, ...]:
+        """
+        Adds a super triangle encompassing the points to the mesh.
+
+        Args:
+            mesh: Mesh containing the vertices to triangulate.
+            points: The points to triangulate.
+
+        Returns:
+            An empty tuple, since no points are part of the super triangle.
+        """
         bounds = self.get_bounds_from_points(points)
         super_triangle = self.create_supertriangle(
             bounds[0],
             bounds[1]
         )
-        triangles : list[Triangle] = []
-        bad_triangles: list[Triangle] = []
-        triangles.append(super_triangle)
-
-        for point in points:
-            bad_triangles.clear()
-            bad_triangles = self.get_bad_triangles(point, triangles)
-
-            polygon : list[Edge] = []
-            for bad_triangle in bad_triangles:
-                for edge in bad_triangle.edges:
-                    valid = True
-                    for other_bad_triangle in bad_triangles:
-                        if other_bad_triangle == bad_triangle:
-                            continue
-                        if other_bad_triangle.has_edge(edge):
-                            valid = False
-                            break
-                    if edge not in polygon and valid:
-                        polygon.append(edge)
-
-            for bad_triangle in bad_triangles:
-                triangles.remove(bad_triangle)
-
-            for edge in polygon:
-                try:
-                    new_triangle = Triangle(
-                        (
-                            edge.vertices[0],
-                            edge.vertices[1],
-                            point
-                        )
-                    )
-                except ValueError as error:
-                    # TODO: Implement proper error handling/logging
-                    print(error)
-                    print(f"Invalid triangle {(edge.vertices[0], edge.vertices[1], point)}, skipping triangulation step...")
-                if new_triangle not in triangles:
-                    triangles.append(new_triangle)
-
-        output = []
-        for triangle in triangles:
-            if not triangle.shares_vertex_with_triangle(super_triangle):
-                for error in triangle.edges:
-                    output.append(error)
-
-        return output
+        a, b, c = (
+            mesh.add_vertex(vertex.x, vertex.y)
+            for vertex in super_triangle.vertices
+        )
+        if mesh.orientation(a, b, mesh.x_coords[c], mesh.y_coords[c]) > 0:
+            mesh.add_triangle(a, b, c)
+        else:
+            mesh.add_triangle(a, c, b)
+        return ()
 
     def create_supertriangle(
             self,
@@ -161,7 +267,8 @@ class BowyerWatson:
         # have to also be inside the super triangle!
         # A large value is a hack,
         # and should ideally use infinity when calculating.
-        # I have no idea how to implement it, so this stays for now
+        # Ghost vertices do that, so this is only used
+        # when use_ghost_vertices is False.
         # Also floating point precision is an issue with very large triangles
         size_mult = 3000000
         avg_point = Point(
@@ -190,6 +297,87 @@ class BowyerWatson:
         return Triangle([tip, point2, point3])
 
 
+class VectorizedBowyerWatson(BowyerWatson):
+    """
+    Implementation of the Bowyer-Watson algorithm that stores triangles
+    in NumPy arrays and finds the bad triangles for each point with
+    a single vectorized circumcircle check. Always uses a super triangle.
+    Requires NumPy.
+    """
+    def __init__(self, spatial_sort: bool = True) -> None:
+        super().__init__(use_ghost_vertices=False, spatial_sort=spatial_sort)
+
+    def triangulate_point_indices(
+            self,
+            points: list[Point]
+        ) -> list[tuple[int, int, int]]:
+        """
+        Triangulates a given set of points using the Bowyer-Watson algorithm.
+
+        Args:
+            points: List of points that should be triangulated.
+            Multiple points should not occupy the same space.
+
+        Returns:
+            The triangles of the Delaunay triangulation as
+            counter-clockwise triples of indices into the list of points.
+        """
+        if len(points) <= 1:
+            return []
+        bounds = self.get_bounds_from_points(points)
+        super_triangle = self.create_supertriangle(
+            bounds[0],
+            bounds[1]
+        )
+        vertices = list(points) + list(super_triangle.vertices)
+        store = TriangleStore(
+            [vertex.x for vertex in vertices],
+            [vertex.y for vertex in vertices],
+            first_super_vertex=len(points)
+        )
+        a, b, c = len(points), len(points) + 1, len(points) + 2
+        if orientation(
+            vertices[a].x, vertices[a].y,
+            vertices[b].x, vertices[b].y,
+            vertices[c].x, vertices[c].y
+        ) > 0:
+            store.add_triangle(a, b, c)
+        else:
+            store.add_triangle(a, c, b)
+
+        if self.spatial_sort:
+            order = get_biased_randomized_insertion_order(points)
+        else:
+            order = range(len(points))
+        for vertex in order:
+            point = points[vertex]
+            bad_rows = store.bad_triangle_mask(point.x, point.y).nonzero()[0]
+            # Edges of bad triangles that are not shared
+            # by another bad triangle form the polygonal hole
+            polygon = {}
+            for bad_triangle in store.vertices[bad_rows].tolist():
+                for i in range(3):
+                    start = bad_triangle[i]
+                    end = bad_triangle[(i + 1) % 3]
+                    if (end, start) in polygon:
+                        del polygon[(end, start)]
+                    else:
+                        polygon[(start, end)] = True
+            if any(
+                point == vertices[polygon_vertex]
+                for edge in polygon for polygon_vertex in edge
+            ):
+                continue
+            store.remove_triangles(bad_rows)
+            for start, end in polygon:
+                store.add_triangle(start, end, vertex)
+
+        return [
+            triangle for triangle in store.get_triangles()
+            if max(triangle) < len(points)
+        ]
+
+
 class PrimMinSpanningTree:
     """
     Implementation of Prim's algorithm.
@@ -208,85 +396,221 @@ class PrimMinSpanningTree:
             the minimum spanning tree is created from.
 
         Returns:
-            List of edges contained in the minimum spanning tree.
+            List of edges contained in the minimum spanning tree,
+            in the same order as in the given list.
         """
         if len(triangulation_edges) == 0:
             return []
 
-        visited_vertex_ids = set()
-        edge_id_forest = set()
-        points_edge_references = get_point_edge_refs(
-            triangulation_edges
-        )
+        # Edge lengths are calculated once and the queue is a binary heap
+        # of (length, insertion number, edge index) tuples. Edges leading to
+        # already visited points are skipped when popped from the heap.
+        lengths = [edge.get_length() for edge in triangulation_edges]
+        point_edge_indices = get_point_edge_index_refs(triangulation_edges)
+        visited_point_ids = set()
+        forest_edge_indices = set()
+        insertion_counter = itertools.count()
+        queue = []
+
+        # The tree is grown from the first point of the first edge
+        new_point_id = triangulation_edges[0].vertices[0].point_id
+        while True:
+            visited_point_ids.add(new_point_id)
+            for other_index in point_edge_indices[new_point_id]:
+                other_edge = triangulation_edges[other_index]
+                if (
+                    other_edge.vertices[0].point_id not in visited_point_ids or
+                    other_edge.vertices[1].point_id not in visited_point_ids
+                ):
+                    heapq.heappush(
+                        queue,
+                        (
+                            lengths[other_index],
+                            next(insertion_counter),
+                            other_index
+                        )
+                    )
 
-        queue : list[Edge] = []
-        queue.append(triangulation_edges[0])
+            new_point_id = None
+            while len(queue) > 0 and new_point_id is None:
+                _, _, edge_index = heapq.heappop(queue)
+                for vertex in triangulation_edges[edge_index].vertices:
+                    if vertex.point_id not in visited_point_ids:
+                        new_point_id = vertex.point_id
+                        forest_edge_indices.add(edge_index)
+            if new_point_id is None:
+                break
 
-        while len(queue) > 0:
-            queue.sort(key=lambda edge : edge.get_length(), reverse=True)
-            edge = queue.pop()
+        return [
+            edge for edge_index, edge in enumerate(triangulation_edges)
+            if edge_index in forest_edge_indices
+        ]
 
-            if (
-                edge.vertices[0].point_id in visited_vertex_ids and
-                edge.vertices[1].point_id in visited_vertex_ids
-            ):
-                continue
 
-            edge_id_forest.add(edge.edge_id)
-            visited_vertex_ids.add(edge.vertices[0].point_id)
-            visited_vertex_ids.add(edge.vertices[1].point_id)
-            queue.extend(
-                self.get_potential_unvisited_edges(
-                    points_edge_references[edge.vertices[0].point_id],
-                    visited_vertex_ids,
-                    edge
-                )
-            )
-            queue.extend(
-                self.get_potential_unvisited_edges(
-                    points_edge_references[edge.vertices[1].point_id],
-                    visited_vertex_ids,
-                    edge
-                )
-            )
+class DisjointSet:
+    """
+    Disjoint-set (union-find) data structure over integers
+    from 0 to size - 1, with path compression and union by rank.
+    """
+    def __init__(self, size: int) -> None:
+        self.parents = list(range(size))
+        self.ranks = [0] * size
 
-        mst_edges = []
-        for edge in triangulation_edges:
-            if edge.edge_id in edge_id_forest:
-                mst_edges.append(edge)
+    def find(self, element: int) -> int:
+        """
+        Finds the representative of the set containing an element.
+        Compresses the path from the element to the representative.
+        """
+        root = element
+        while self.parents[root] != root:
+            root = self.parents[root]
+        while self.parents[element] != root:
+            self.parents[element], element = root, self.parents[element]
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        """
+        Merges the sets containing two elements.
 
-        return mst_edges
+        Returns:
+            False if the elements were already in the same set,
+            otherwise True.
+        """
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root == second_root:
+            return False
+        if self.ranks[first_root] < self.ranks[second_root]:
+            first_root, second_root = second_root, first_root
+        self.parents[second_root] = first_root
+        if self.ranks[first_root] == self.ranks[second_root]:
+            self.ranks[first_root] += 1
+        return True
+
+
+class KruskalMinSpanningTree:
+    """
+    Implementation of Kruskal's algorithm.
+    Used to generate a minimum spanning tree, or a minimum spanning
+    forest if the given edges do not connect all points.
+    """
+    def create_tree_from_edges(
+            self,
+            triangulation_edges: list[Edge]
+        ) -> list[Edge]:
+        """
+        Generates a minimum spanning tree from a list of given edges
+        that form a Delaunay triangulation.
+
+        Args:
+            edges: List of edges that
+            the minimum spanning tree is created from.
 
-    def get_potential_unvisited_edges(
+        Returns:
+            List of edges contained in the minimum spanning tree,
+            in the same order as in the given list.
+        """
+        point_indices = {}
+        vertex_pairs = []
+        for edge in triangulation_edges:
+            vertex_pairs.append(tuple(
+                point_indices.setdefault(vertex.point_id, len(point_indices))
+                for vertex in edge.vertices
+            ))
+        forest_edge_indices = set(self.find_forest_edge_indices(
+            len(point_indices),
+            vertex_pairs,
+            [edge.get_length() for edge in triangulation_edges]
+        ))
+        return [
+            edge for edge_index, edge in enumerate(triangulation_edges)
+            if edge_index in forest_edge_indices
+        ]
+
+    def find_forest_edge_indices(
             self,
-            edges: list[Edge],
-            visited_point_ids: set,
-            current_edge: Edge
+            vertex_count: int,
+            vertex_pairs: list[tuple[int, int]],
+            lengths: list[float]
+        ) -> list[int]:
+        """
+        Finds the edges of a minimum spanning forest.
+
+        Args:
+            vertex_count: Number of vertices, which are
+            numbered from 0 to vertex_count - 1.
+            vertex_pairs: The vertices of each edge.
+            lengths: The length of each edge.
+
+        Returns:
+            Indices of the edges in the minimum spanning forest,
+            from shortest to longest.
+        """
+        disjoint_set = DisjointSet(vertex_count)
+        forest_edge_indices = []
+        for edge_index in sorted(
+            range(len(vertex_pairs)),
+            key=lengths.__getitem__
         ):
+            first, second = vertex_pairs[edge_index]
+            if disjoint_set.union(first, second):
+                forest_edge_indices.append(edge_index)
+                if len(forest_edge_indices) == vertex_count - 1:
+                    break
+        return forest_edge_indices
+
+
+class EuclideanMinSpanningTree:
+    """
+    Creates a minimum spanning tree directly from points.
+    The points are triangulated into vertex index triples and Kruskal's
+    algorithm is run on the unique edges of the triangles, so edge
+    objects are only created once for each edge shared by two triangles.
+    """
+    def __init__(self) -> None:
+        self.tree_generator = KruskalMinSpanningTree()
+
+    def create_tree_from_points(
+            self,
+            points: list[Point],
+            triangulator: BowyerWatson
+        ) -> tuple[list[Edge], list[Edge]]:
         """
-        Creates a list of edges that contain unvisited points.
+        Triangulates points and generates a minimum
+        spanning tree from the triangulation.
 
         Args:
-            edges: List of edges to check for potentially
-            unvisited points.
-            visited_point_ids: Set of point ids that
-            have been visited in prim's algorithm.
-            current_edge: The currently evaluated edge that should
-            be ignored for new potential edges.
+            points: List of points to create the tree from.
+            Multiple points should not occupy the same space.
+            triangulator: Bowyer-Watson triangulator
+            used to triangulate the points.
 
         Returns:
-            List of edges that contain unvisited points.
+            A tuple with the list of unique edges in the Delaunay
+            triangulation and the list of edges in the minimum spanning
+            tree, in the same order as in the triangulation.
         """
-        potential_edges = []
-        for potential_edge in edges:
-            if potential_edge == current_edge:
-                continue
-            if (
-                potential_edge.vertices[0].point_id not in visited_point_ids or
-                potential_edge.vertices[1].point_id not in visited_point_ids
-            ):
-                potential_edges.append(potential_edge)
-        return potential_edges
+        vertex_pairs = get_unique_triangle_edges(
+            triangulator.triangulate_point_indices(points)
+        )
+        lengths = [
+            points[start].get_distance_to(points[end])
+            for start, end in vertex_pairs
+        ]
+        forest_edge_indices = sorted(
+            self.tree_generator.find_forest_edge_indices(
+                len(points),
+                vertex_pairs,
+                lengths
+            )
+        )
+        triangulation_edges = [
+            Edge((points[start], points[end])) for start, end in vertex_pairs
+        ]
+        return (
+            triangulation_edges,
+            [triangulation_edges[edge_index] for edge_index in forest_edge_indices]
+        )
 
 
 class RandomEdgeConnector:
@@ -306,7 +630,8 @@ class RandomEdgeConnector:
             self,
             seed: int,
             minimum_spanning_tree: list[Edge],
-            triangulation: list[Edge]
+            triangulation: list[Edge],
+            rng: random.Random = None
         ) -> list[Edge]:
         """
         Creates random connections using separate % chances
@@ -314,43 +639,83 @@ class RandomEdgeConnector:
 
         Args:
             seed: Seed number to be used for RNG.
+            Only used if rng is not given.
             minimum_spanning_tree: List of edges forming
             an MST of the triangulation.
             triangulation: List of edges forming
             a Delaunay triangulation.
+            rng: Random number generator used for the chances.
 
         Returns:
             List of edges forming a graph with random edges added
             on top of the MST.
         """
-        random.seed(seed)
-        mst_point_edge_references = get_point_edge_refs(minimum_spanning_tree)
-        tri_point_edge_references = get_point_edge_refs(triangulation)
+        if rng is None:
+            rng = random.Random(seed)
+        # Each unique edge of the triangulation gets an index, so the
+        # doubled edges shared by two triangles are only compared once
+        # by their keys and afterwards handled as integers. Point keys are
+        # cached, since each point is shared by several edges.
+        point_keys = {}
+        for edge in triangulation:
+            for vertex in edge.vertices:
+                if vertex.point_id not in point_keys:
+                    point_keys[vertex.point_id] = vertex.key
+        unique_edge_indices = {}
+        unique_edge_lengths = []
+        triangulation_unique_indices = []
+        for edge in triangulation:
+            first_key = point_keys[edge.vertices[0].point_id]
+            second_key = point_keys[edge.vertices[1].point_id]
+            edge_key = (
+                (first_key, second_key) if first_key < second_key
+                else (second_key, first_key)
+            )
+            unique_index = unique_edge_indices.get(edge_key)
+            if unique_index is None:
+                unique_index = len(unique_edge_lengths)
+                unique_edge_indices[edge_key] = unique_index
+                unique_edge_lengths.append(edge.get_length())
+            triangulation_unique_indices.append(unique_index)
+
         diagram : list[Edge] = minimum_spanning_tree.copy()
-        dead_end_edge_connector_candidates = self.get_dead_end_edge_candidates(
-            self.get_dead_end_point_ids(
-                mst_point_edge_references
-            ),
-            minimum_spanning_tree,
-            tri_point_edge_references
+        is_in_diagram = [False] * len(unique_edge_lengths)
+        for edge in minimum_spanning_tree:
+            unique_index = unique_edge_indices.get(edge.key)
+            if unique_index is not None:
+                is_in_diagram[unique_index] = True
+
+        dead_end_edge_connector_candidates = (
+            self.get_dead_end_edge_candidate_indices(
+                self.get_dead_end_point_ids(
+                    get_point_edge_index_refs(minimum_spanning_tree)
+                ),
+                minimum_spanning_tree,
+                triangulation
+            )
         )
         dead_end_edge_connector_candidates.sort(
-            key=lambda edge: edge.get_length(),
+            key=lambda triangulation_index: unique_edge_lengths[
+                triangulation_unique_indices[triangulation_index]
+            ],
             reverse=True
         )
-        for edge in dead_end_edge_connector_candidates:
-            chance_value = random.uniform(0, 100)
+        for triangulation_index in dead_end_edge_connector_candidates:
+            chance_value = rng.uniform(0, 100)
             if chance_value < self.dead_end_edge_chance:
-                diagram.append(edge)
+                diagram.append(triangulation[triangulation_index])
+                is_in_diagram[
+                    triangulation_unique_indices[triangulation_index]
+                ] = True
 
-        for potential_new_edge in triangulation:
-            if (
-                potential_new_edge not in minimum_spanning_tree and
-                potential_new_edge not in diagram
-            ):
-                chance_value = random.uniform(0, 100)
+        for triangulation_index, unique_index in enumerate(
+            triangulation_unique_indices
+        ):
+            if not is_in_diagram[unique_index]:
+                chance_value = rng.uniform(0, 100)
                 if chance_value < self.random_edge_add_chance:
-                    diagram.append(potential_new_edge)
+                    diagram.append(triangulation[triangulation_index])
+                    is_in_diagram[unique_index] = True
 
         return diagram
 
@@ -373,12 +738,12 @@ class RandomEdgeConnector:
                 dead_ends.append(point_id)
         return dead_ends
 
-    def get_dead_end_edge_candidates(
+    def get_dead_end_edge_candidate_indices(
             self,
-            dead_end_point_ids: list[str],
+            dead_end_point_ids: list[int],
             minimum_spanning_tree: list[Edge],
-            tri_point_edge_reference: dict
-        ) -> list[Edge]:
+            triangulation: list[Edge]
+        ) -> list[int]:
         """
         Gets edges that are valid new connections to a dead-end.
 
@@ -387,18 +752,22 @@ class RandomEdgeConnector:
             are considered dead-ends.
             minimum_spanning_tree: List of edges contained
             in the MST.
-            tri_point_edge_reference: A dictionary with point ids as keys
-            and lists of edges connected to said points. Only
-            from the triangulation
+            triangulation: List of edges forming
+            a Delaunay triangulation.
 
         Returns:
-            List of edges that are valid connections to dead-end points.
+            List of indices of triangulation edges that
+            are valid connections to dead-end points.
         """
-        edges: list[Edge] = []
-        mst_edge_ids = set(get_edge_id_dict(minimum_spanning_tree).keys())
+        # Edges are compared by edge id, so if the triangulation contains
+        # both copies of a shared edge, the copy that is not in the MST
+        # is a candidate as well
+        mst_edge_ids = {edge.edge_id for edge in minimum_spanning_tree}
+        tri_point_edge_indices = get_point_edge_index_refs(triangulation)
+        candidate_indices = []
         for point_id in dead_end_point_ids:
-            for edge in tri_point_edge_reference[point_id]:
-                if edge.edge_id in mst_edge_ids:
+            for triangulation_index in tri_point_edge_indices.get(point_id, []):
+                if triangulation[triangulation_index].edge_id in mst_edge_ids:
                     continue
-                edges.append(edge)
-        return edges
+                candidate_indices.append(triangulation_index)
+        return candidate_indices
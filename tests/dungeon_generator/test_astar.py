@@ -0,0 +1,122 @@
+import unittest
+from dungeon_generator.grid import Grid, ChunkedGrid
+from dungeon_generator.pathfinding import AStar, PathfindingWorkspace, MAX_SEARCH_GENERATION
+
+class TestAStar(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(16)
+        self.grid.fill("empty")
+        self.grid.fill_rect(-3, -3, 2, 2, "room_floor")
+        self.grid.outline_rect(-3, -3, 2, 2, "room_wall")
+
+    def test_clearance_map_blocks_cells_next_to_rooms(self):
+        pather = AStar(self.grid)
+        expected = [0, 0, 1, 0, 1]
+        result = [pather.clearance[self.grid.get_index(x, y)] for x, y in [(0, 0), (-4, 0), (-5, 0), (3, 3), (4, 4)]]
+        self.assertEqual(expected, result)
+
+    def test_set_cell_updates_clearance_map(self):
+        pather = AStar(self.grid)
+        for y in range(-3, 3):
+            for x in range(-3, 3):
+                pather.set_cell(x, y, "corridor_floor")
+        expected = AStar(self.grid).clearance
+        result = pather.clearance
+        self.assertEqual(expected, result)
+
+    def test_same_neighbours_on_chunked_grid(self):
+        chunked_grid = ChunkedGrid(16, chunk_size=4)
+        chunked_grid.fill("empty")
+        chunked_grid.fill_rect(-3, -3, 2, 2, "room_floor")
+        chunked_grid.outline_rect(-3, -3, 2, 2, "room_wall")
+        cells = [(x, y) for y in range(-8, 8) for x in range(-8, 8)]
+        expected = [AStar(self.grid).get_valid_neighbors(cell) for cell in cells]
+        result = [AStar(chunked_grid).get_valid_neighbors(cell) for cell in cells]
+        self.assertEqual(expected, result)
+
+    def test_find_path_around_room(self):
+        path = AStar(self.grid).find_path((-6, 0), (5, 0))
+        expected = ((5, 0), (-6, 0))
+        result = (path[0], path[-1])
+        self.assertEqual(expected, result)
+
+    def test_find_path_shortest_length(self):
+        path = AStar(self.grid).find_path((-6, -6), (5, 6))
+        expected = 24
+        result = len(path)
+        self.assertEqual(expected, result)
+
+    def test_find_path_no_path(self):
+        self.grid.fill_rect(-8, 4, 7, 4, "room_wall")
+        expected = []
+        result = AStar(self.grid).find_path((0, -6), (0, 6))
+        self.assertEqual(expected, result)
+
+    def test_find_path_same_length_on_chunked_grid(self):
+        chunked_grid = ChunkedGrid(16, chunk_size=4)
+        chunked_grid.fill("empty")
+        chunked_grid.fill_rect(-3, -3, 2, 2, "room_floor")
+        chunked_grid.outline_rect(-3, -3, 2, 2, "room_wall")
+        expected = len(AStar(self.grid).find_path((-6, 0), (5, 0)))
+        result = len(AStar(chunked_grid).find_path((-6, 0), (5, 0)))
+        self.assertEqual(expected, result)
+
+    def test_find_path_leaves_first_window_on_chunked_grid(self):
+        grids = (Grid(128), ChunkedGrid(128, chunk_size=16))
+        for grid in grids:
+            grid.fill("empty")
+            grid.fill_rect(-50, 0, 50, 0, "room_wall")
+        expected = len(AStar(grids[0]).find_path((0, -5), (0, 5)))
+        result = len(AStar(grids[1]).find_path((0, -5), (0, 5)))
+        self.assertEqual(expected, result)
+
+    def test_jump_point_search_chunked_grid_not_supported(self):
+        chunked_grid = ChunkedGrid(16, chunk_size=4)
+        chunked_grid.fill("empty")
+        with self.assertRaises(ValueError):
+            AStar(chunked_grid, jump_point_search=True)
+
+    def test_repeated_searches_same_path(self):
+        pather = AStar(self.grid)
+        expected = pather.find_path((-6, 0), (5, 0))
+        pather.find_path((-6, -6), (5, 6))
+        result = pather.find_path((-6, 0), (5, 0))
+        self.assertEqual(expected, result)
+
+    def test_workspace_generation_wraps_around(self):
+        workspace = PathfindingWorkspace(4)
+        workspace.generation = MAX_SEARCH_GENERATION
+        workspace.closed_generations[2] = 1
+        expected = (1, 0)
+        result = (workspace.start_search(), workspace.closed_generations[2])
+        self.assertEqual(expected, result)
+
+    def test_jump_point_search_same_length(self):
+        self.grid.fill_rect(-8, 5, 4, 5, "room_wall")
+        expected = len(AStar(self.grid).find_path((-6, -6), (-5, 7)))
+        result = len(AStar(self.grid, jump_point_search=True).find_path((-6, -6), (-5, 7)))
+        self.assertEqual(expected, result)
+
+    def test_jump_point_search_path_is_connected(self):
+        path = AStar(self.grid, jump_point_search=True).find_path((-6, -6), (5, 6))
+        expected = [1] * (len(path) - 1)
+        result = [abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(path, path[1:])]
+        self.assertEqual(expected, result)
+        self.assertEqual(((5, 6), (-6, -6)), (path[0], path[-1]))
+
+    def test_jump_point_search_no_path(self):
+        self.grid.fill_rect(-8, 4, 7, 4, "room_wall")
+        expected = []
+        result = AStar(self.grid, jump_point_search=True).find_path((0, -6), (0, 6))
+        self.assertEqual(expected, result)
+
+    def test_path_between_indices_stays_in_window(self):
+        pather = AStar(self.grid)
+        start_index = self.grid.get_index(-6, 0)
+        end_index = self.grid.get_index(6, 0)
+        expected = (True, [])
+        result = (
+            len(pather.find_path_between_indices(start_index, end_index)) > 0,
+            pather.find_path_between_indices(start_index, end_index, window=(0, 6, 15, 10))
+        )
+        self.assertEqual(expected, result)
@@ -30,3 +30,30 @@ class TestBowyerWatson(unittest.TestCase):
         expected = []
         result = BowyerWatson().triangulate_points(point_list)
         self.assertEqual(expected, result)
+
+    def test_triangulate_square_with_center_point(self):
+        point_list = [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4), Point(2, 2)]
+
+        expected = 12
+        result = len(BowyerWatson().triangulate_points(point_list))
+        self.assertEqual(expected, result)
+
+    def test_triangulate_convex_points_keeps_hull_triangles(self):
+        point_list = [Point(i, i * i / 1000) for i in range(-20, 21)]
+
+        expected = 3 * 39
+        result = len(BowyerWatson(use_ghost_vertices=True).triangulate_points(point_list))
+        self.assertEqual(expected, result)
+
+    def test_triangulate_ghost_and_supertriangle_modes_match(self):
+        point_list = [Point((i * 37) % 101, (i * 59) % 97) for i in range(60)]
+        ghost_edges = BowyerWatson(use_ghost_vertices=True).triangulate_points(point_list)
+        super_edges = BowyerWatson(use_ghost_vertices=False).triangulate_points(point_list)
+
+        expected = True
+        result = len(ghost_edges) == len(super_edges)
+        for e in ghost_edges:
+            if e not in super_edges:
+                result = False
+                break
+        self.assertEqual(expected, result)
@@ -0,0 +1,28 @@
+import unittest
+from dungeon_generator.grid import Grid, ChunkedGrid
+from dungeon_generator.corridor_network import CorridorNetworkRouter
+
+class TestCorridorNetworkRouter(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(16)
+        self.grid.fill("empty")
+        self.grid.fill_rect(-3, -3, 2, 2, "room_floor")
+        self.grid.outline_rect(-3, -3, 2, 2, "room_wall")
+
+    def test_follows_corridors(self):
+        self.grid.fill_rect(-6, -6, 5, -6, "corridor_floor")
+        expected = [(5, -5)] + [(x, -6) for x in range(5, -7, -1)] + [(-6, -7)]
+        result = CorridorNetworkRouter(self.grid).find_path((-6, -7), (5, -5))
+        self.assertEqual(expected, result)
+
+    def test_no_path(self):
+        self.grid.fill_rect(-8, 4, 7, 4, "room_wall")
+        expected = []
+        result = CorridorNetworkRouter(self.grid).find_path((0, -6), (0, 6))
+        self.assertEqual(expected, result)
+
+    def test_chunked_grid_not_supported(self):
+        grid = ChunkedGrid(32, chunk_size=8)
+        grid.fill("empty")
+        with self.assertRaises(ValueError):
+            CorridorNetworkRouter(grid)
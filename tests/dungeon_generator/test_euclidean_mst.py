@@ -0,0 +1,31 @@
+import unittest
+from dungeon_generator.undirected_graphing import EuclideanMinSpanningTree, PrimMinSpanningTree, BowyerWatson, get_unique_triangle_edges
+from dungeon_generator.geometry import Point
+
+class TestEuclideanMinSpanningTree(unittest.TestCase):
+    def test_unique_triangle_edges_shared_edge_once(self):
+        triangles = [(0, 1, 2), (2, 1, 3)]
+        expected = [(0, 1), (1, 2), (2, 0), (1, 3), (3, 2)]
+        result = get_unique_triangle_edges(triangles)
+        self.assertEqual(expected, result)
+
+    def test_triangulation_has_no_duplicate_edges(self):
+        points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3)]
+        triangulation, _ = EuclideanMinSpanningTree().create_tree_from_points(points, BowyerWatson())
+        expected = len(set(BowyerWatson().triangulate_points(points)))
+        result = len(set(triangulation))
+        self.assertEqual(expected, result)
+        self.assertEqual(expected, len(triangulation))
+
+    def test_edge_count_minimum(self):
+        points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3)]
+        _, mst = EuclideanMinSpanningTree().create_tree_from_points(points, BowyerWatson())
+        expected = 5
+        self.assertEqual(len(mst), expected)
+
+    def test_same_length_as_prim(self):
+        points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3)]
+        expected = sum(e.get_length() for e in PrimMinSpanningTree().create_tree_from_edges(BowyerWatson().triangulate_points(points)))
+        _, mst = EuclideanMinSpanningTree().create_tree_from_points(points, BowyerWatson())
+        result = sum(e.get_length() for e in mst)
+        self.assertAlmostEqual(expected, result)
@@ -0,0 +1,56 @@
+import unittest
+from dungeon_generator.free_space import get_free_bands, remove_rect_from_bands, get_free_position, count_free_positions
+
+class TestFreeSpace(unittest.TestCase):
+    def test_empty_bounds_are_free(self):
+        expected = [(0, 9, [(0, 9)], 10)]
+        result = get_free_bands([], 2, 2, (0, 0, 9, 9))
+        self.assertEqual(expected, result)
+
+    def test_rect_blocks_positions(self):
+        bands = get_free_bands([(4, 4, 2, 2)], 2, 2, (0, 0, 9, 9))
+        expected = [
+            (0, 2, [(0, 9)], 10),
+            (3, 5, [(0, 2), (6, 9)], 7),
+            (6, 9, [(0, 9)], 10)
+        ]
+        self.assertEqual(expected, bands)
+
+    def test_touching_edges_are_free(self):
+        bands = get_free_bands([(2, 0, 2, 2)], 2, 2, (0, 0, 4, 0))
+        expected = [(0, 0), (4, 0)]
+        result = [get_free_position(bands, i) for i in range(count_free_positions(bands))]
+        self.assertEqual(expected, result)
+
+    def test_fully_blocked_has_no_bands(self):
+        expected = []
+        result = get_free_bands([(-5, -5, 20, 20)], 2, 2, (0, 0, 9, 9))
+        self.assertEqual(expected, result)
+
+    def test_free_positions_counted_row_by_row(self):
+        bands = get_free_bands([(4, 4, 2, 2)], 2, 2, (0, 0, 9, 9))
+        expected = [(0, 0), (9, 0), (0, 3), (2, 3), (6, 3)]
+        result = [get_free_position(bands, i) for i in (0, 9, 30, 32, 33)]
+        self.assertEqual(expected, result)
+        self.assertEqual(10 * 3 + 7 * 3 + 10 * 4, count_free_positions(bands))
+
+    def test_too_large_position_number_raises(self):
+        bands = get_free_bands([], 2, 2, (0, 0, 9, 9))
+        with self.assertRaises(ValueError):
+            get_free_position(bands, 100)
+
+    def test_removed_rect_gives_same_positions_as_sweep(self):
+        rects = [(4, 4, 2, 2), (0, 7, 3, 1), (6, 0, 4, 3), (2, 2, 1, 6)]
+        bands = get_free_bands(rects[:1], 2, 2, (0, 0, 9, 9))
+        for rect in rects[1:]:
+            bands = remove_rect_from_bands(bands, rect, 2, 2, (0, 0, 9, 9))
+        swept_bands = get_free_bands(rects, 2, 2, (0, 0, 9, 9))
+        expected = [get_free_position(swept_bands, i) for i in range(count_free_positions(swept_bands))]
+        result = [get_free_position(bands, i) for i in range(count_free_positions(bands))]
+        self.assertEqual(expected, result)
+
+    def test_removed_rect_outside_bounds_keeps_bands(self):
+        bands = get_free_bands([(4, 4, 2, 2)], 2, 2, (0, 0, 9, 9))
+        expected = bands
+        result = remove_rect_from_bands(bands, (20, 20, 2, 2), 2, 2, (0, 0, 9, 9))
+        self.assertEqual(expected, result)
@@ -1,5 +1,6 @@
 import unittest
-from dungeon_generator.geometry import Point, Edge, Triangle
+from fractions import Fraction
+from dungeon_generator.geometry import Point, Edge, Triangle, orientation, incircle
 
 class TestBowyerWatsonPoint(unittest.TestCase):
     def test_point_distance_nonzero(self):
@@ -37,6 +38,13 @@ class TestBowyerWatsonPoint(unittest.TestCase):
         result = point1 == point2
         self.assertAlmostEqual(expected, result)
 
+    def test_equal_points_in_set(self):
+        points = {Point(1, 2), Point(1.0, 2.0), Point(2, 1)}
+
+        expected = 2
+        result = len(points)
+        self.assertEqual(expected, result)
+
 class TestBowyerWatsonEdge(unittest.TestCase):
     def test_edge_length_nonzero(self):
         point1 = Point(4, -7.1)
@@ -77,6 +85,33 @@ class TestBowyerWatsonEdge(unittest.TestCase):
 
         self.assertEqual(expected, result)
     
+    def test_edge_key_ignores_vertex_order(self):
+        point1 = Point(4, -7.1)
+        point2 = Point(2, 3)
+        edge1 = Edge((point1, point2))
+        edge2 = Edge((point2, point1))
+
+        expected = edge1.key
+        result = edge2.key
+        self.assertEqual(expected, result)
+
+    def test_reversed_edges_in_set(self):
+        point1 = Point(4, -7.1)
+        point2 = Point(2, 3)
+        edges = {Edge((point1, point2)), Edge((Point(2, 3), Point(4, -7.1)))}
+
+        expected = 1
+        result = len(edges)
+        self.assertEqual(expected, result)
+
+    def test_points_have_unique_ids(self):
+        point1 = Point(2, 3)
+        point2 = Point(2, 3)
+
+        expected = False
+        result = point1.point_id == point2.point_id
+        self.assertEqual(expected, result)
+
     def test_edge_points_are_equal_error(self):
         point1 = Point(2, 3)
         point2 = Point(2, 3)
@@ -179,4 +214,56 @@ class TestBowyerWatsonTriangle(unittest.TestCase):
         point2 = Point(0, 0)
         point3 = Point(0, 0)
         with self.assertRaises(ValueError):
-            triangle = Triangle((point1, point2, point3))
\ No newline at end of file
+            triangle = Triangle((point1, point2, point3))
+
+    def test_triangles_with_same_vertices_in_set(self):
+        point1 = Point(-5, 3.5)
+        point2 = Point(1.1, -2)
+        point3 = Point(2, 3)
+        triangles = {
+            Triangle((point1, point2, point3)),
+            Triangle((point3, point1, point2))
+        }
+
+        expected = 1
+        result = len(triangles)
+        self.assertEqual(expected, result)
+
+    def test_point_on_circumcircle_is_not_inside(self):
+        triangle = Triangle((Point(0, 0), Point(2, 0), Point(0, 2)))
+
+        expected = False
+        result = triangle.is_point_in_circumcircle(Point(2, 2))
+        self.assertEqual(expected, result)
+
+    def test_point_inside_circumcircle_clockwise_triangle(self):
+        triangle = Triangle((Point(0, 0), Point(0, 2), Point(2, 0)))
+
+        expected = True
+        result = triangle.incircle(Point(1, 1)) > 0
+        self.assertEqual(expected, result)
+
+class TestGeometryPredicates(unittest.TestCase):
+    def test_orientation_counter_clockwise(self):
+        expected = True
+        result = orientation(0, 0, 1, 0, 0, 1) > 0
+        self.assertEqual(expected, result)
+
+    def test_orientation_nearly_collinear_matches_exact(self):
+        expected = True
+        result = True
+        for i in range(64):
+            x = 0.5 + i * 2.0**-53
+            exact = (
+                (Fraction(12) - Fraction(x)) * (Fraction(24) - Fraction(0.5))
+                - (Fraction(12) - Fraction(0.5)) * (Fraction(24) - Fraction(x))
+            )
+            value = orientation(12, 12, 24, 24, x, 0.5)
+            if (exact > 0) != (value > 0) or (exact == 0) != (value == 0):
+                result = False
+        self.assertEqual(expected, result)
+
+    def test_incircle_cocircular_points_is_zero(self):
+        expected = 0
+        result = incircle(0.1, 0.1, 0.3, 0.1, 0.3, 0.3, 0.1, 0.3)
+        self.assertEqual(expected, result)
@@ -0,0 +1,146 @@
+import unittest
+from dungeon_generator.grid import Grid, ChunkedGrid, Tile
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(8)
+
+    def test_new_grid_cells_are_none(self):
+        expected = None
+        result = self.grid.get_cell(0, 0)
+        self.assertEqual(expected, result)
+
+    def test_set_cell_get_cell(self):
+        self.grid.set_cell(-4, 3, "room_floor")
+        expected = "room_floor"
+        result = self.grid.get_cell(-4, 3)
+        self.assertEqual(expected, result)
+
+    def test_set_cell_sets_tile_code(self):
+        self.grid.set_cell(2, -1, "corridor_wall")
+        expected = Tile.CORRIDOR_WALL
+        result = self.grid.get_tile(2, -1)
+        self.assertEqual(expected, result)
+
+    def test_set_cell_out_of_bounds(self):
+        expected = False
+        result = self.grid.set_cell(4, 0, "empty")
+        self.assertEqual(expected, result)
+        self.assertEqual(None, self.grid.get_cell(4, 0))
+
+    def test_set_cell_new_value(self):
+        self.grid.set_cell(1, 1, "empty2")
+        expected = "empty2"
+        result = self.grid.get_cell(1, 1)
+        self.assertEqual(expected, result)
+
+    def test_cells_do_not_overlap(self):
+        for y in range(self.grid.bounds[0][1], self.grid.bounds[1][1] + 1):
+            for x in range(self.grid.bounds[0][0], self.grid.bounds[1][0] + 1):
+                self.grid.set_cell(x, y, (x, y))
+        expected = (3, -4)
+        result = self.grid.get_cell(3, -4)
+        self.assertEqual(expected, result)
+
+    def test_fill(self):
+        self.grid.fill("empty")
+        expected = ["empty"] * 64
+        result = [self.grid.get_cell(x, y) for y in range(-4, 4) for x in range(-4, 4)]
+        self.assertEqual(expected, result)
+
+    def test_fill_rect_clips_to_bounds(self):
+        self.grid.fill_rect(2, 2, 10, 10, "room_floor")
+        expected = 4
+        result = [self.grid.get_cell(x, y) for y in range(-4, 4) for x in range(-4, 4)].count("room_floor")
+        self.assertEqual(expected, result)
+
+    def test_outline_rect(self):
+        self.grid.fill("empty")
+        self.grid.outline_rect(-2, -2, 1, 2, "room_wall")
+        expected = ["room_wall", "room_wall", "room_wall", "room_wall", "room_wall", "room_wall", "empty", "empty"]
+        result = [self.grid.get_cell(x, y) for x, y in [(-2, -2), (1, 2), (-2, 0), (1, 0), (0, -2), (-1, 2), (0, 0), (-1, 1)]]
+        self.assertEqual(expected, result)
+        self.assertEqual(14, [self.grid.get_cell(x, y) for y in range(-4, 4) for x in range(-4, 4)].count("room_wall"))
+
+    def test_replace(self):
+        self.grid.fill("empty2")
+        self.grid.set_cell(0, 0, "room_floor")
+        self.grid.replace("empty2", "empty")
+        expected = ["empty", "room_floor"]
+        result = [self.grid.get_cell(1, 1), self.grid.get_cell(0, 0)]
+        self.assertEqual(expected, result)
+
+    def test_neighbour_offsets_match_coordinates(self):
+        index = self.grid.get_index(0, 0)
+        expected = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        result = [self.grid.get_coordinates(index + offset) for offset in self.grid.neighbour_offsets]
+        self.assertEqual(expected, result)
+
+    def test_full_neighbour_offsets_match_full_cell_neighbours(self):
+        index = self.grid.get_index(-1, 2)
+        expected = self.grid.get_full_cell_neighbours(-1, 2)
+        result = [self.grid.get_coordinates(index + offset) for offset in self.grid.full_neighbour_offsets]
+        self.assertEqual(expected, result)
+
+    def test_border_around_grid(self):
+        self.grid.fill("empty")
+        index = self.grid.get_index(3, -4)
+        expected = [Tile.EMPTY, Tile.BORDER, Tile.BORDER, Tile.EMPTY]
+        result = [self.grid.cells[index + offset] for offset in self.grid.neighbour_offsets]
+        self.assertEqual(expected, result)
+
+
+class TestChunkedGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = ChunkedGrid(16, chunk_size=4)
+
+    def test_untouched_cells_have_default_value(self):
+        expected = None
+        result = self.grid.get_cell(-8, 7)
+        self.assertEqual(expected, result)
+
+    def test_set_cell_get_cell(self):
+        self.grid.set_cell(-8, 7, "room_floor")
+        expected = "room_floor"
+        result = self.grid.get_cell(-8, 7)
+        self.assertEqual(expected, result)
+
+    def test_set_cell_allocates_one_chunk(self):
+        self.grid.set_cell(5, 5, "room_floor")
+        self.grid.set_cell(6, 4, "room_floor")
+        expected = 1
+        result = len(self.grid.chunks)
+        self.assertEqual(expected, result)
+
+    def test_fill_does_not_allocate_chunks(self):
+        self.grid.fill("empty")
+        expected = ("empty", 0)
+        result = (self.grid.get_cell(3, 3), len(self.grid.chunks))
+        self.assertEqual(expected, result)
+
+    def test_same_cells_as_grid(self):
+        grid = Grid(16)
+        for g in (grid, self.grid):
+            g.fill("empty")
+            g.fill_rect(-3, -5, 6, 2, "room_floor")
+            g.outline_rect(-3, -5, 6, 2, "room_wall")
+            g.set_cell(7, 7, "empty2")
+            g.replace("empty2", "corridor_floor")
+        expected = [grid.get_cell(x, y) for y in range(-9, 9) for x in range(-9, 9)]
+        result = [self.grid.get_cell(x, y) for y in range(-9, 9) for x in range(-9, 9)]
+        self.assertEqual(expected, result)
+
+    def test_large_grid_allocates_only_written_chunks(self):
+        grid = ChunkedGrid(8192)
+        grid.fill("empty")
+        grid.fill_rect(0, 0, 100, 10, "room_floor")
+        expected = 2
+        result = len(grid.chunks)
+        self.assertEqual(expected, result)
+
+    def test_rect_tiles_same_as_get_tile(self):
+        self.grid.fill("empty")
+        self.grid.fill_rect(-3, -5, 6, 2, "room_floor")
+        expected = bytearray(Tile.BORDER if self.grid.get_tile(x, y) is None else self.grid.get_tile(x, y) for y in range(-10, 4) for x in range(-5, 10))
+        result = self.grid.get_rect_tiles(-5, -10, 9, 3)
+        self.assertEqual(expected, result)
@@ -0,0 +1,86 @@
+import unittest
+from dungeon_generator.grid import Grid, ChunkedGrid
+from dungeon_generator.pathfinding import AStar
+from dungeon_generator.hierarchical_pathfinding import HierarchicalPathfinder, PathNotFoundError, PathFailure
+
+class TestHierarchicalPathfinder(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(32)
+        self.grid.fill("empty")
+        self.grid.fill_rect(-10, -6, 6, 4, "room_floor")
+        self.grid.outline_rect(-10, -6, 6, 4, "room_wall")
+        self.pather = HierarchicalPathfinder(self.grid, cluster_size=8, window_distance=0)
+
+    def test_find_path_is_connected(self):
+        path = self.pather.find_path((-14, -14), (12, 13))
+        expected = [1] * (len(path) - 1)
+        result = [abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(path, path[1:])]
+        self.assertEqual(expected, result)
+        self.assertEqual(((12, 13), (-14, -14)), (path[0], path[-1]))
+
+    def test_find_path_only_clear_cells(self):
+        path = self.pather.find_path((-14, 0), (12, 0))
+        expected = [1] * len(path)
+        result = [self.pather.clearance[self.grid.get_index(x, y)] for x, y in path]
+        self.assertEqual(expected, result)
+
+    def test_find_path_not_much_longer_than_shortest(self):
+        shortest = len(AStar(self.grid).find_path((-14, 0), (12, 0)))
+        result = len(self.pather.find_path((-14, 0), (12, 0)))
+        self.assertGreaterEqual(result, shortest)
+        self.assertLessEqual(result, shortest + 8)
+
+    def test_windowed_search_finds_shortest_path(self):
+        pather = HierarchicalPathfinder(self.grid, cluster_size=8)
+        expected = len(AStar(self.grid).find_path((-14, 0), (12, 0)))
+        result = len(pather.find_path((-14, 0), (12, 0)))
+        self.assertEqual(expected, result)
+
+    def test_no_route_raises(self):
+        self.grid.fill_rect(-16, 8, 15, 8, "room_wall")
+        pather = HierarchicalPathfinder(self.grid, cluster_size=8)
+        with self.assertRaises(PathNotFoundError) as context:
+            pather.find_path_or_raise((0, -12), (0, 12))
+        self.assertEqual(PathFailure.NO_ROUTE, context.exception.reason)
+
+    def test_blocked_end_raises(self):
+        with self.assertRaises(PathNotFoundError) as context:
+            self.pather.find_path_or_raise((-14, -14), (0, 0))
+        self.assertEqual(PathFailure.END_BLOCKED, context.exception.reason)
+
+    def test_out_of_bounds_raises(self):
+        with self.assertRaises(PathNotFoundError) as context:
+            self.pather.find_path_or_raise((-14, -14), (40, 0))
+        self.assertEqual(PathFailure.OUT_OF_BOUNDS, context.exception.reason)
+
+    def test_find_path_returns_empty_list_like_astar(self):
+        self.grid.fill_rect(-16, 8, 15, 8, "room_wall")
+        pather = HierarchicalPathfinder(self.grid, cluster_size=8)
+        expected = AStar(self.grid).find_path((0, -12), (0, 12))
+        result = pather.find_path((0, -12), (0, 12))
+        self.assertEqual(expected, result)
+
+    def test_set_cell_drops_cluster_graph(self):
+        self.pather.find_path((-14, -14), (12, 13))
+        cluster = self.pather.get_cluster(self.grid.get_index(-12, 8))
+        self.pather.get_cluster_graph(cluster)
+        self.pather.set_cell(-12, 8, "room_wall")
+        expected = False
+        result = cluster in self.pather.cluster_graphs
+        self.assertEqual(expected, result)
+
+    def test_path_avoids_cells_set_after_search(self):
+        self.pather.find_path((-14, 0), (12, 0))
+        for y in range(-16, 16):
+            if y not in (9, 10, 11):
+                self.pather.set_cell(-12, y, "room_wall")
+        path = self.pather.find_path((-14, 0), (12, 0))
+        expected = True
+        result = (-12, 10) in path
+        self.assertEqual(expected, result)
+
+    def test_chunked_grid_not_supported(self):
+        grid = ChunkedGrid(32, chunk_size=8)
+        grid.fill("empty")
+        with self.assertRaises(ValueError):
+            HierarchicalPathfinder(grid)
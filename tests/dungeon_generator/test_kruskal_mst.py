@@ -0,0 +1,51 @@
+import unittest
+from dungeon_generator.undirected_graphing import KruskalMinSpanningTree, DisjointSet
+from dungeon_generator.geometry import Point, Edge
+
+class TestKruskalMinSpanningTree(unittest.TestCase):
+    def test_kruskal_edge_count_minimum_simple(self):
+        points = [Point(0, 0), Point(2, 2), Point(3, 0), Point(2, -3), Point(-1, -2)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[3], points[4])), Edge((points[4], points[0]))]
+        mst = KruskalMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = 4
+        self.assertEqual(len(mst), expected)
+
+    def test_kruskal_total_length_is_minimum_simple(self):
+        points = [Point(0, 0), Point(2, 2), Point(3, 0), Point(2, -3), Point(-1, -2)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[3], points[4])), Edge((points[4], points[0]))]
+        mst = KruskalMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = triangulation[0].get_length() + triangulation[1].get_length() + triangulation[3].get_length() + triangulation[6].get_length()
+        result = sum(e.get_length() for e in mst)
+        self.assertAlmostEqual(expected, result)
+
+    def test_kruskal_keeps_triangulation_order_simple(self):
+        points = [Point(0, 0), Point(2, 2), Point(3, 0), Point(2, -3), Point(-1, -2)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[3], points[4])), Edge((points[4], points[0]))]
+        mst = KruskalMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = sorted(mst, key=triangulation.index)
+        result = mst
+        self.assertEqual(expected, result)
+
+    def test_kruskal_first_edge_not_in_tree(self):
+        points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[1], points[3])), Edge((points[3], points[4])), Edge((points[4], points[0])), Edge((points[0], points[5])), Edge((points[5], points[1]))]
+        expected = [triangulation[1], triangulation[2], triangulation[6], triangulation[7], triangulation[8]]
+        result = KruskalMinSpanningTree().create_tree_from_edges(triangulation)
+        self.assertEqual(expected, result)
+
+    def test_kruskal_disconnected_edges_create_forest(self):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(10, 10), Point(11, 10)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[3], points[4]))]
+        mst = KruskalMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = [triangulation[0], triangulation[2], triangulation[3]]
+        result = mst
+        self.assertEqual(expected, result)
+
+    def test_disjoint_set_union_same_set(self):
+        disjoint_set = DisjointSet(4)
+        disjoint_set.union(0, 1)
+        disjoint_set.union(2, 3)
+        disjoint_set.union(1, 3)
+        expected = False
+        result = disjoint_set.union(0, 2)
+        self.assertEqual(expected, result)
@@ -0,0 +1,85 @@
+import unittest
+import random
+from dungeon_generator.grid import Grid
+from dungeon_generator.undirected_graphing import BowyerWatson
+from dungeon_generator.room_placer import RoomPlacer
+from dungeon_generator.parallel_routing import ParallelCorridorRouter, windows_overlap
+
+class TestParallelCorridorRouter(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(64)
+        self.grid.fill("empty")
+        self.router = ParallelCorridorRouter(self.grid, workers=1)
+
+    def test_windows_overlap(self):
+        expected = [True, True, False, False]
+        result = [
+            windows_overlap((0, 0, 4, 4), (2, 2, 6, 6)),
+            windows_overlap((0, 0, 4, 4), (4, 4, 6, 6)),
+            windows_overlap((0, 0, 4, 4), (5, 0, 6, 4)),
+            windows_overlap((0, 0, 4, 4), (0, 5, 4, 6))
+        ]
+        self.assertEqual(expected, result)
+
+    def test_split_batch_defers_overlapping_routes(self):
+        routes = [
+            ("a", None, None, (0, 0, 10, 10)),
+            ("b", None, None, (5, 5, 15, 15)),
+            ("c", None, None, (20, 20, 30, 30)),
+            ("d", None, None, (14, 14, 18, 18))
+        ]
+        batch, rest = self.router.split_batch(routes)
+        expected = (["a", "c"], ["b", "d"])
+        result = ([route[0] for route in batch], [route[0] for route in rest])
+        self.assertEqual(expected, result)
+
+    def test_split_batch_routes_long_route_alone(self):
+        routes = [
+            ("a", None, None, None),
+            ("b", None, None, (0, 0, 10, 10))
+        ]
+        batch, rest = self.router.split_batch(routes)
+        expected = (["a"], ["b"])
+        result = ([route[0] for route in batch], [route[0] for route in rest])
+        self.assertEqual(expected, result)
+
+    def test_split_batch_stops_at_long_route(self):
+        routes = [
+            ("a", None, None, (0, 0, 10, 10)),
+            ("b", None, None, None),
+            ("c", None, None, (20, 20, 30, 30))
+        ]
+        batch, rest = self.router.split_batch(routes)
+        expected = (["a"], ["b", "c"])
+        result = ([route[0] for route in batch], [route[0] for route in rest])
+        self.assertEqual(expected, result)
+
+    def test_route_batch_defers_route_leaving_window(self):
+        for y in range(-20, 21):
+            self.router.set_cell(-15, y, "room_wall")
+        routes = [
+            ("a", (-20, 0), (-10, 0), self.router.get_padded_window((-20, 0), (-10, 0))),
+            ("b", (10, 0), (20, 0), self.router.get_padded_window((10, 0), (20, 0)))
+        ]
+        expected = ([("a", (-20, 0), (-10, 0), None)], "corridor_floor", "empty")
+        deferred = self.router.route_batch(routes)
+        result = (deferred, self.grid.get_cell(15, 0), self.grid.get_cell(-12, 0))
+        self.assertEqual(expected, result)
+
+    def test_window_settings_passed_to_pathfinder(self):
+        router = ParallelCorridorRouter(self.grid, window_distance=10, window_margin=2, workers=1)
+        expected = (10, 2, None)
+        result = (router.window_distance, router.window_margin, router.get_padded_window((0, 0), (20, 0)))
+        self.assertEqual(expected, result)
+
+    def test_same_grid_with_worker_processes(self):
+        grids = []
+        for workers in (1, 2):
+            grid, rooms = RoomPlacer().generate_rooms(40, Grid(128), rng=random.Random(3))
+            edges = BowyerWatson().triangulate_points([room.center_point for room in rooms.values()])
+            router = ParallelCorridorRouter(grid, workers=workers, min_batch_size=1)
+            router.paths_for_rooms(rooms, edges)
+            grids.append(bytes(grid.cells))
+        expected = grids[0]
+        result = grids[1]
+        self.assertEqual(expected, result)
@@ -32,3 +32,27 @@ class TestPrimMinSpanningTree(unittest.TestCase):
             if mst.count(e) > 1:
                 result = False
         self.assertEqual(result, expected)
+
+    def test_prim_total_length_is_minimum_simple(self):
+        points = [Point(0, 0), Point(2, 2), Point(3, 0), Point(2, -3), Point(-1, -2)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[3], points[4])), Edge((points[4], points[0]))]
+        mst = PrimMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = triangulation[0].get_length() + triangulation[1].get_length() + triangulation[3].get_length() + triangulation[6].get_length()
+        result = sum(e.get_length() for e in mst)
+        self.assertAlmostEqual(expected, result)
+
+    def test_prim_keeps_triangulation_order_simple(self):
+        points = [Point(0, 0), Point(2, 2), Point(3, 0), Point(2, -3), Point(-1, -2)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[0])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[3], points[4])), Edge((points[4], points[0]))]
+        mst = PrimMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = sorted(mst, key=triangulation.index)
+        result = mst
+        self.assertEqual(expected, result)
+
+    def test_prim_first_edge_not_in_tree(self):
+        points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3)]
+        triangulation = [Edge((points[0], points[1])), Edge((points[1], points[2])), Edge((points[2], points[3])), Edge((points[3], points[0])), Edge((points[1], points[3])), Edge((points[3], points[4])), Edge((points[4], points[0])), Edge((points[0], points[5])), Edge((points[5], points[1]))]
+        mst = PrimMinSpanningTree().create_tree_from_edges(triangulation)
+        expected = [triangulation[1], triangulation[2], triangulation[6], triangulation[7], triangulation[8]]
+        result = mst
+        self.assertEqual(expected, result)
@@ -0,0 +1,33 @@
+import unittest
+from dungeon_generator.undirected_graphing import RandomEdgeConnector, BowyerWatson, PrimMinSpanningTree
+from dungeon_generator.geometry import Point
+
+class TestRandomEdgeConnector(unittest.TestCase):
+    def setUp(self):
+        self.points = [Point(0, 0), Point(4, 1), Point(7, -2), Point(3, -5), Point(-2, -3), Point(1, 3), Point(6, 4)]
+        self.triangulation = BowyerWatson().triangulate_points(self.points)
+        self.mst = PrimMinSpanningTree().create_tree_from_edges(self.triangulation)
+
+    def test_no_chance_returns_mst(self):
+        diagram = RandomEdgeConnector(0, 0).create_connections(1, self.mst, self.triangulation)
+        expected = self.mst
+        result = diagram
+        self.assertEqual(expected, result)
+
+    def test_full_random_edge_chance_adds_each_edge_once(self):
+        diagram = RandomEdgeConnector(0, 100).create_connections(1, self.mst, self.triangulation)
+        expected = len(set(self.triangulation))
+        result = len(diagram)
+        self.assertEqual(expected, result)
+
+    def test_same_seed_same_diagram(self):
+        expected = RandomEdgeConnector(50, 50).create_connections(3, self.mst, self.triangulation)
+        result = RandomEdgeConnector(50, 50).create_connections(3, self.mst, self.triangulation)
+        self.assertEqual(expected, result)
+
+    def test_dead_end_point_ids_have_single_edge(self):
+        connector = RandomEdgeConnector()
+        dead_ends = connector.get_dead_end_point_ids({1: [0], 2: [0, 1], 3: [1]})
+        expected = [1, 3]
+        result = dead_ends
+        self.assertEqual(expected, result)
@@ -0,0 +1,82 @@
+import unittest
+import random
+from dungeon_generator.room_placer import Room, RoomPlacer
+from dungeon_generator.geometry import Point
+from dungeon_generator.grid import Grid
+
+class TestRoomPlacer(unittest.TestCase):
+    def setUp(self):
+        self.room_placer = RoomPlacer()
+        self.rooms = [Room(10, 10, Point(0, 0))]
+
+    def test_intersecting_room(self):
+        expected = True
+        result = self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(12, 5)), self.rooms)
+        self.assertEqual(expected, result)
+
+    def test_room_outside_of_buffer_distance(self):
+        expected = False
+        result = self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(16, 0)), self.rooms)
+        self.assertEqual(expected, result)
+
+    def test_rooms_added_to_list_are_checked(self):
+        self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(40, 40)), self.rooms)
+        self.rooms.append(Room(10, 10, Point(40, 0)))
+        expected = True
+        result = self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(45, 5)), self.rooms)
+        self.assertEqual(expected, result)
+
+    def test_other_list_is_checked(self):
+        self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(40, 40)), self.rooms)
+        expected = False
+        result = self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(5, 5)), [])
+        self.assertEqual(expected, result)
+
+    def test_free_space_sampling_places_all_rooms(self):
+        self.room_placer.free_space_sampling = True
+        self.room_placer.shrink_rooms_to_fit = True
+        _, rooms = self.room_placer.generate_rooms(100, Grid(256), rng=random.Random(1))
+        expected = 100
+        result = len(rooms)
+        self.assertEqual(expected, result)
+
+    def test_free_space_sampling_does_not_shrink_by_default(self):
+        self.room_placer.free_space_sampling = True
+        room = Room(40, 40)
+        expected = (False, 40, 40)
+        result = (self.room_placer.place_room_in_free_space(room, [], Grid(48), random.Random(1)), room.width, room.height)
+        self.assertEqual(expected, result)
+
+    def test_free_space_sampling_rooms_do_not_intersect(self):
+        self.room_placer.free_space_sampling = True
+        _, rooms = self.room_placer.generate_rooms(60, Grid(160), rng=random.Random(2))
+        room_list = list(rooms.values())
+        expected = [False] * len(room_list)
+        result = [
+            self.room_placer.if_room_intersect_with_rooms(room, room_list[:i] + room_list[i+1:])
+            for i, room in enumerate(room_list)
+        ]
+        self.assertEqual(expected, result)
+
+    def test_rooms_generated_onto_given_grid(self):
+        grid = Grid(64)
+        expected = grid
+        result = self.room_placer.generate_rooms(8, grid, rng=random.Random(1))[0]
+        self.assertIs(expected, result)
+
+    def test_room_replaced_in_list_is_checked(self):
+        self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(40, 40)), self.rooms)
+        self.rooms[0] = Room(10, 10, Point(40, 0))
+        expected = (False, True)
+        result = (
+            self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(5, 5)), self.rooms),
+            self.room_placer.if_room_intersect_with_rooms(Room(10, 10, Point(45, 5)), self.rooms)
+        )
+        self.assertEqual(expected, result)
+
+    def test_generated_rooms_do_not_intersect(self):
+        _, rooms = self.room_placer.generate_rooms(30, Grid(128), rng=random.Random(4))
+        room_list = list(rooms.values())
+        expected = [False] * len(room_list)
+        result = [self.room_placer.if_room_intersect_with_rooms(room, room_list[:i] + room_list[i + 1:]) for i, room in enumerate(room_list)]
+        self.assertEqual(expected, result)
@@ -0,0 +1,42 @@
+import unittest
+from dungeon_generator.spatial_hash import SpatialHash
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        self.spatial_hash = SpatialHash(bucket_size=8)
+        self.spatial_hash.insert((0, 0, 10, 10))
+        self.spatial_hash.insert((-30, -30, 5, 5))
+
+    def test_intersects_overlapping_rect(self):
+        expected = [True, True, True]
+        result = [
+            self.spatial_hash.intersects((5, 5, 10, 10)),
+            self.spatial_hash.intersects((9, 9, 1, 1)),
+            self.spatial_hash.intersects((-27, -27, 1, 1))
+        ]
+        self.assertEqual(expected, result)
+
+    def test_touching_rect_does_not_intersect(self):
+        expected = [False, False, False]
+        result = [
+            self.spatial_hash.intersects((10, 0, 5, 5)),
+            self.spatial_hash.intersects((0, 10, 5, 5)),
+            self.spatial_hash.intersects((-25, -30, 5, 5))
+        ]
+        self.assertEqual(expected, result)
+
+    def test_rect_without_area_does_not_intersect(self):
+        expected = False
+        result = self.spatial_hash.intersects((5, 5, 0, 3))
+        self.assertEqual(expected, result)
+
+    def test_large_rect_intersects_across_buckets(self):
+        expected = True
+        result = self.spatial_hash.intersects((-100, -100, 71, 71))
+        self.assertEqual(expected, result)
+
+    def test_count(self):
+        self.spatial_hash.insert((40, 40, 0, 0))
+        expected = 3
+        result = self.spatial_hash.count
+        self.assertEqual(expected, result)
@@ -0,0 +1,43 @@
+import unittest
+from dungeon_generator.spatial_sort import get_hilbert_index, get_biased_randomized_insertion_order
+from dungeon_generator.geometry import Point
+
+class TestSpatialSort(unittest.TestCase):
+    def test_hilbert_index_first_order(self):
+        expected = [0, 1, 2, 3]
+        result = [
+            get_hilbert_index(0, 0, 1),
+            get_hilbert_index(0, 1, 1),
+            get_hilbert_index(1, 1, 1),
+            get_hilbert_index(1, 0, 1)
+        ]
+        self.assertEqual(expected, result)
+
+    def test_hilbert_index_consecutive_cells_are_neighbours(self):
+        order = 3
+        cells = {}
+        for x in range(2**order):
+            for y in range(2**order):
+                cells[get_hilbert_index(x, y, order)] = (x, y)
+
+        expected = True
+        result = True
+        for i in range(1, len(cells)):
+            distance = abs(cells[i][0] - cells[i-1][0]) + abs(cells[i][1] - cells[i-1][1])
+            if distance != 1:
+                result = False
+        self.assertEqual(expected, result)
+
+    def test_insertion_order_contains_every_point_once(self):
+        points = [Point((i * 37) % 101, (i * 59) % 97) for i in range(200)]
+
+        expected = list(range(200))
+        result = sorted(get_biased_randomized_insertion_order(points))
+        self.assertEqual(expected, result)
+
+    def test_insertion_order_is_deterministic(self):
+        points = [Point((i * 37) % 101, (i * 59) % 97) for i in range(200)]
+
+        expected = get_biased_randomized_insertion_order(points, 5)
+        result = get_biased_randomized_insertion_order(points, 5)
+        self.assertEqual(expected, result)
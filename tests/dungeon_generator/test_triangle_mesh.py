@@ -0,0 +1,106 @@
+import unittest
+import random
+from dungeon_generator.triangle_mesh import TriangleMesh
+
+def create_mesh_with_big_triangle() -> TriangleMesh:
+    mesh = TriangleMesh()
+    mesh.add_vertex(-100, -100)
+    mesh.add_vertex(100, -100)
+    mesh.add_vertex(0, 100)
+    mesh.add_triangle(0, 1, 2)
+    return mesh
+
+class TestTriangleMesh(unittest.TestCase):
+    def test_insert_vertex_inside_triangle_splits_triangle(self):
+        mesh = create_mesh_with_big_triangle()
+        mesh.insert_vertex(mesh.add_vertex(0, 0))
+
+        expected = 3
+        result = len(mesh.get_triangles())
+        self.assertEqual(expected, result)
+
+    def test_insert_duplicate_vertex_fails(self):
+        mesh = create_mesh_with_big_triangle()
+        mesh.insert_vertex(mesh.add_vertex(0, 0))
+
+        expected = False
+        result = mesh.insert_vertex(mesh.add_vertex(0, 0))
+        self.assertEqual(expected, result)
+
+    def test_locate_finds_containing_triangle(self):
+        mesh = create_mesh_with_big_triangle()
+        for x, y in [(0, 0), (10, 10), (-20, 5), (30, -40)]:
+            mesh.insert_vertex(mesh.add_vertex(x, y))
+        triangle = mesh.locate(-50, -90)
+        base = 3 * triangle
+        a, b, c = mesh.triangle_vertices[base:base+3]
+
+        expected = True
+        result = (
+            mesh.orientation(a, b, -50, -90) >= 0 and
+            mesh.orientation(b, c, -50, -90) >= 0 and
+            mesh.orientation(c, a, -50, -90) >= 0
+        )
+        self.assertEqual(expected, result)
+
+    def test_triangulation_is_delaunay(self):
+        rng = random.Random(42)
+        mesh = create_mesh_with_big_triangle()
+        for _ in range(100):
+            mesh.insert_vertex(mesh.add_vertex(rng.uniform(-40, 40), rng.uniform(-40, 40)))
+
+        expected = True
+        result = True
+        for triangle, alive in enumerate(mesh.alive):
+            if not alive:
+                continue
+            for vertex in range(len(mesh.x_coords)):
+                if mesh.is_point_in_circumcircle(triangle, mesh.x_coords[vertex], mesh.y_coords[vertex]):
+                    result = False
+        self.assertEqual(expected, result)
+
+    def test_neighbours_are_linked_both_ways(self):
+        rng = random.Random(7)
+        mesh = create_mesh_with_big_triangle()
+        for _ in range(50):
+            mesh.insert_vertex(mesh.add_vertex(rng.uniform(-40, 40), rng.uniform(-40, 40)))
+
+        expected = True
+        result = True
+        for triangle, alive in enumerate(mesh.alive):
+            if not alive:
+                continue
+            for neighbour in mesh.triangle_neighbours[3*triangle:3*triangle+3]:
+                if neighbour == -1:
+                    continue
+                if triangle not in mesh.triangle_neighbours[3*neighbour:3*neighbour+3]:
+                    result = False
+        self.assertEqual(expected, result)
+
+    def test_insert_vertex_outside_hull_with_ghost_triangles(self):
+        mesh = TriangleMesh()
+        mesh.add_vertex(0, 0)
+        mesh.add_vertex(10, 0)
+        mesh.add_vertex(0, 10)
+        mesh.add_vertex(10, 10)
+        mesh.create_initial_triangle(0, 1, 2)
+        mesh.insert_vertex(3)
+
+        expected = 2
+        result = len(mesh.get_triangles())
+        self.assertEqual(expected, result)
+
+    def test_ghost_triangle_contains_points_outside_hull_edge(self):
+        mesh = TriangleMesh()
+        mesh.add_vertex(0, 0)
+        mesh.add_vertex(10, 0)
+        mesh.add_vertex(0, 10)
+        mesh.create_initial_triangle(0, 1, 2)
+        ghost = mesh.triangle_neighbours[0]
+
+        expected = (True, False)
+        result = (
+            mesh.is_point_in_circumcircle(ghost, 5, -1),
+            mesh.is_point_in_circumcircle(ghost, 5, 1)
+        )
+        self.assertEqual(expected, result)
@@ -0,0 +1,46 @@
+import unittest
+import random
+from dungeon_generator.geometry import Point, Triangle
+from dungeon_generator.triangle_store import TriangleStore, np
+from dungeon_generator.undirected_graphing import BowyerWatson, VectorizedBowyerWatson
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestTriangleStore(unittest.TestCase):
+    def test_bad_triangle_mask_matches_triangles(self):
+        rng = random.Random(3)
+        points = [Point(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(30)]
+        store = TriangleStore([p.x for p in points], [p.y for p in points])
+        triangles = []
+        for i in range(0, 30, 3):
+            a, b, c = points[i], points[i+1], points[i+2]
+            if (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x) > 0:
+                store.add_triangle(i, i+1, i+2)
+            else:
+                store.add_triangle(i, i+2, i+1)
+            triangles.append(Triangle((a, b, c)))
+
+        expected = True
+        result = True
+        for _ in range(50):
+            point = Point(rng.uniform(-10, 10), rng.uniform(-10, 10))
+            mask = store.bad_triangle_mask(point.x, point.y)
+            if [bool(value) for value in mask] != [t.is_point_in_circumcircle(point) for t in triangles]:
+                result = False
+        self.assertEqual(expected, result)
+
+    def test_removed_rows_are_reused(self):
+        store = TriangleStore([0, 1, 0, 1], [0, 0, 1, 1])
+        first = store.add_triangle(0, 1, 2)
+        store.remove_triangles([first])
+        second = store.add_triangle(1, 3, 2)
+
+        expected = (first, [(1, 3, 2)])
+        result = (second, store.get_triangles())
+        self.assertEqual(expected, result)
+
+    def test_vectorized_triangulation_matches_mesh_triangulation(self):
+        points = [Point((i * 37) % 101, (i * 59) % 97) for i in range(60)]
+
+        expected = set(BowyerWatson(use_ghost_vertices=False).triangulate_points(points))
+        result = set(VectorizedBowyerWatson().triangulate_points(points))
+        self.assertEqual(expected, result)